@@ -27,8 +27,10 @@ import os
 import subprocess  # nosec B404
 import sys
 from ctypes import cdll
+from typing import Callable, Iterator, Optional, Tuple
 from qgis.PyQt.QtCore import QSettings
 from ..parser.exceptions import RequiresLicenseException
+from .jet_database import JetDatabase, JetFormatException
 
 
 class MissingBinaryException(Exception):
@@ -37,6 +39,57 @@ class MissingBinaryException(Exception):
     """
 
 
+class StyleIterator:
+    """
+    An iterator over the raw styles read from a .style database.
+
+    The underlying database (or mdb-export process) is closed when the
+    iterator is exhausted or closed, or when it is discarded without
+    being consumed.
+    """
+
+    def __init__(self, styles: Iterator[dict], close: Callable[[], None]):
+        self._styles = styles
+        self._close = close
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> dict:
+        try:
+            return next(self._styles)
+        except StopIteration:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """
+        Returns True if the underlying database or process has been closed
+        """
+        return self._close is None
+
+    def close(self):
+        """
+        Closes the underlying database or process
+        """
+        if self._close is None:
+            return
+
+        self._styles.close()
+        self._close()
+        self._close = None
+
+
 class Extractor:
     """
     Extracts style information and blobs from .style databases
@@ -243,13 +296,121 @@ class Extractor:
         )
 
     @staticmethod
-    def extract_styles(file_path: str, symbol_type: str):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    def read_style_rows(
+        database: JetDatabase, symbol_type: str
+    ) -> Iterator[Tuple[str, str, str, str, Optional[memoryview]]]:
+        """
+        Reads all symbols of a given symbol type from a .style database,
+        without using the MDB tools utilities.
+
+        Yields (id, name, category, tags, blob) tuples, where blob is a view
+        into the database which is only valid while the database is open.
+        :param database: .style database
+        :param symbol_type: symbol type to extract, e.g. Extractor.FILL_SYMBOLS
+        """
+        if not database.has_table(symbol_type):
+            return
+
+        for row in database.rows(symbol_type):
+            values = {k.lower(): v for k, v in row.items()}
+            symbol_id = values.get("id")
+            yield (
+                str(symbol_id) if symbol_id is not None else "",
+                values.get("name") or "",
+                values.get("category") or "",
+                values.get("tags") or "",
+                values.get("object"),
+            )
+
+    @staticmethod
+    def count_styles(file_path: str, symbol_type: str) -> Optional[int]:
+        """
+        Returns the number of styles of a given symbol type in a .style file,
+        or None if the count cannot be determined without extracting the styles
+        :param file_path: path to .style file
+        :param symbol_type: symbol type to count, e.g. Extractor.FILL_SYMBOLS
+        """
+        try:
+            with JetDatabase(file_path) as database:
+                if not database.has_table(symbol_type):
+                    return 0
+                return database.row_count(symbol_type)
+        except JetFormatException:
+            return None
+
+    @staticmethod
+    def iter_styles(file_path: str, symbol_type: str) -> StyleIterator:
+        """
+        Iterates over all matching styles of a given symbol type from a .style file.
+
+        Styles are read as they are consumed, so only one raw symbol needs to
+        be held in memory at a time. The database is opened (or the mdb-export
+        process started) before this function returns, so any
+        MissingBinaryException is raised by the call itself. The database is
+        closed when the returned iterator is exhausted, closed or discarded.
+        :param file_path: path to .style file
+        :param symbol_type: symbol type to extract, e.g. Extractor.FILL_SYMBOLS
+        :return: iterator of raw symbols, ready for parsing
+        """
+        try:
+            database = JetDatabase(file_path)
+        except JetFormatException:
+            # not a database we can read natively, e.g. a Jet 3 database
+            return Extractor._iter_styles_with_mdb_tools(file_path, symbol_type)
+
+        return StyleIterator(
+            Extractor._iter_database_styles(database, symbol_type), database.close
+        )
+
+    @staticmethod
+    def _iter_database_styles(
+        database: JetDatabase, symbol_type: str
+    ) -> Iterator[dict]:
+        """
+        Iterates over the styles from a database, closing the database
+        when done
+        """
+        with database:
+            for symbol_id, name, category, tags, blob in Extractor.read_style_rows(
+                database, symbol_type
+            ):
+                yield {
+                    Extractor.NAME: name,
+                    Extractor.CATEGORY: category,
+                    Extractor.TAGS: tags,
+                    Extractor.ID: symbol_id,
+                    Extractor.BLOB: bytes(blob) if blob is not None else b"",
+                }
+
+    @staticmethod
+    def extract_styles(file_path: str, symbol_type: str):
         """
         Extracts all matching styles of a given symbol type from a .style file
         :param file_path: path to .style file
         :param symbol_type: symbol type to extract, e.g. Extractor.FILL_SYMBOLS
         :return: list of raw symbols, ready for parsing
         """
+        return list(Extractor.iter_styles(file_path, symbol_type))
+
+    @staticmethod
+    def extract_styles_with_mdb_tools(file_path: str, symbol_type: str):
+        """
+        Extracts all matching styles of a given symbol type from a .style file,
+        using the MDB tools "mdb-export" utility
+        :param file_path: path to .style file
+        :param symbol_type: symbol type to extract, e.g. Extractor.FILL_SYMBOLS
+        :return: list of raw symbols, ready for parsing
+        """
+        return list(Extractor._iter_styles_with_mdb_tools(file_path, symbol_type))
+
+    @staticmethod
+    def _iter_styles_with_mdb_tools(file_path: str, symbol_type: str) -> StyleIterator:
+        """
+        Starts mdb-export for a symbol table, returning an iterator over the
+        exported styles
+        :param file_path: path to .style file
+        :param symbol_type: symbol type to extract, e.g. Extractor.FILL_SYMBOLS
+        """
         binary = Extractor.get_mdb_tools_binary_path(Extractor.MDB_EXPORT_BINARY)
 
         export_args = [
@@ -268,30 +429,75 @@ class Extractor:
 
         CREATE_NO_WINDOW = 0x08000000
         try:
-            result = subprocess.run(  # nosec=B603
+            proc = subprocess.Popen(  # nosec=B603 pylint: disable=consider-using-with
                 export_args,
                 stdout=subprocess.PIPE,
                 creationflags=CREATE_NO_WINDOW,
-                check=False,
             )
         except ValueError:
             try:
-                result = subprocess.run(  # nosec=B603
-                    export_args, stdout=subprocess.PIPE, check=False
+                proc = subprocess.Popen(  # nosec=B603 pylint: disable=consider-using-with
+                    export_args, stdout=subprocess.PIPE
                 )
             except FileNotFoundError as e:
                 raise MissingBinaryException from e
         except FileNotFoundError as e:
             raise MissingBinaryException from e
 
-        raw_symbols = []
+        return Extractor._mdb_export_styles(proc)
+
+    @staticmethod
+    def _mdb_export_styles(proc) -> StyleIterator:
+        """
+        Returns an iterator over the styles exported by an mdb-export process,
+        which stops the process when closed
+        """
+
+        def close():
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+        return StyleIterator(Extractor._iter_mdb_export_output(proc), close)
+
+    @staticmethod
+    def _iter_mdb_export_records(proc) -> Iterator[bytes]:
+        """
+        Reads the records from an mdb-export process as they are written,
+        closing the process when done
+        """
+        chunk_size = 1024 * 1024
+        with proc:
+            try:
+                pending = b""
+                while True:
+                    chunk = proc.stdout.read(chunk_size)
+                    if not chunk:
+                        break
+                    pending += chunk
+                    records = pending.split(Extractor.__NEWLINE)
+                    # the last part may be an incomplete record (or delimiter)
+                    pending = records.pop()
+                    yield from records
+                if pending:
+                    yield pending
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+
+    @staticmethod
+    def _iter_mdb_export_output(proc) -> Iterator[dict]:  # pylint: disable=too-many-locals,too-many-branches
+        """
+        Iterates over the styles exported by an mdb-export process
+        """
         headers = None
         symbol_id_idx = None
         name_idx = None
         category_idx = None
         blob_idx = None
         tags_idx = None
-        for r in result.stdout.split(Extractor.__NEWLINE):
+        for r in Extractor._iter_mdb_export_records(proc):
             if not r:
                 continue
 
@@ -332,13 +538,10 @@ class Extractor:
                 # Windows new endings come round to bite us again
                 blob = blob.replace(b"\r\n", b"\n")
 
-            symbol = {
+            yield {
                 Extractor.NAME: Extractor._extract_text(name),
                 Extractor.CATEGORY: Extractor._extract_text(category),
                 Extractor.TAGS: Extractor._extract_text(tags) if tags else "",
                 Extractor.ID: Extractor._extract_text(symbol_id),
                 Extractor.BLOB: blob,
             }
-            raw_symbols.append(symbol)
-
-        return raw_symbols
@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+
+# /***************************************************************************
+#  *                                                                         *
+#  *   This program is free software; you can redistribute it and/or modify  *
+#  *   it under the terms of the GNU General Public License as published by  *
+#  *   the Free Software Foundation; either version 2 of the License, or     *
+#  *   (at your option) any later version.                                   *
+#  *                                                                         *
+#  ***************************************************************************/
+
+
+"""
+Reads tables from Jet 4 (Access 2000 and later) databases, such as ESRI .style files
+"""
+
+import mmap
+from struct import Struct
+from typing import Dict, Iterator, List, Optional
+
+INT16 = Struct("<H")
+INT32 = Struct("<I")
+SIGNED_INT16 = Struct("<h")
+SIGNED_INT32 = Struct("<i")
+FLOAT = Struct("<f")
+DOUBLE = Struct("<d")
+MONEY = Struct("<q")
+
+
+class JetFormatException(Exception):
+    """
+    Thrown when a database is not a readable Jet 4 database
+    """
+
+
+class JetColumn:
+    """
+    A column from a Jet table definition
+    """
+
+    TYPE_BOOL = 0x01
+    TYPE_BYTE = 0x02
+    TYPE_INT = 0x03
+    TYPE_LONGINT = 0x04
+    TYPE_MONEY = 0x05
+    TYPE_FLOAT = 0x06
+    TYPE_DOUBLE = 0x07
+    TYPE_DATETIME = 0x08
+    TYPE_BINARY = 0x09
+    TYPE_TEXT = 0x0A
+    TYPE_OLE = 0x0B
+    TYPE_MEMO = 0x0C
+
+    FLAG_FIXED = 0x01
+
+    # struct used to decode fixed length numeric columns, by type
+    FIXED_STRUCTS = {
+        TYPE_BYTE: Struct("<B"),
+        TYPE_INT: SIGNED_INT16,
+        TYPE_LONGINT: SIGNED_INT32,
+        TYPE_MONEY: MONEY,
+        TYPE_FLOAT: FLOAT,
+        TYPE_DOUBLE: DOUBLE,
+        TYPE_DATETIME: DOUBLE,
+    }
+
+    __slots__ = (
+        "name",
+        "column_type",
+        "column_number",
+        "var_column_number",
+        "fixed_offset",
+        "length",
+        "flags",
+    )
+
+    def __init__(self, definition: bytes, offset: int):
+        """
+        Creates a column from its entry in a table definition
+        :param definition: table definition
+        :param offset: offset of the column entry in the definition
+        """
+        self.name = ""
+        self.column_type = definition[offset]
+        self.column_number = INT16.unpack_from(definition, offset + 5)[0]
+        self.var_column_number = INT16.unpack_from(definition, offset + 7)[0]
+        self.flags = definition[offset + 15]
+        self.fixed_offset = INT16.unpack_from(definition, offset + 21)[0]
+        self.length = INT16.unpack_from(definition, offset + 23)[0]
+
+    def is_fixed(self) -> bool:
+        """
+        Returns True if the column is stored in the fixed length part of rows
+        """
+        return bool(self.flags & JetColumn.FLAG_FIXED)
+
+
+class JetDatabase:
+    """
+    A read-only, memory mapped Jet 4 database.
+
+    Only the subset of the format required to read simple tables (such as the
+    symbol tables in .style files) is supported. Text values are returned as
+    str, numeric values as int/float, and binary, OLE and memo values stored
+    within a single page as memoryviews into the database. These memoryviews
+    are only valid until the database is closed.
+    """
+
+    PAGE_SIZE = 4096
+
+    PAGE_DATA = 0x01
+    PAGE_TABLE_DEFINITION = 0x02
+
+    # table definition page for the MSysObjects catalog
+    CATALOG_PAGE = 2
+    CATALOG_TYPE_TABLE = 1
+
+    ROW_DELETED = 0x8000
+    ROW_OVERFLOW = 0x4000
+    ROW_OFFSET_MASK = 0x1FFF
+
+    LVAL_INLINE = 0x80000000
+    LVAL_SINGLE_PAGE = 0x40000000
+    LVAL_LENGTH_MASK = 0x3FFFFFFF
+
+    def __init__(self, file_path: str):
+        """
+        Opens a database
+        :param file_path: path to .mdb or .style file
+        """
+        with open(file_path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise JetFormatException(
+                    "{} is not a Jet database".format(file_path)
+                ) from e
+
+        self._data = memoryview(self._map)
+        if (
+            len(self._data) < JetDatabase.PAGE_SIZE
+            or self._data[4:19] != b"Standard Jet DB"
+        ):
+            self.close()
+            raise JetFormatException("{} is not a Jet database".format(file_path))
+        if self._data[0x14] == 0:
+            self.close()
+            raise JetFormatException(
+                "{} is a Jet 3 database, only Jet 4 databases are supported".format(
+                    file_path
+                )
+            )
+
+        self.page_count = len(self._data) // JetDatabase.PAGE_SIZE
+        self._tables = None
+        # usage map row pointers, by table definition page
+        self._usage_maps = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the database. Memoryviews returned by rows() must not be
+        used after closing the database.
+        """
+        if self._map is None:
+            return
+        self._data.release()
+        try:
+            self._map.close()
+        except BufferError:
+            # memoryviews into the database are still referenced, leave closing
+            # the map to garbage collection
+            pass
+        self._map = None
+
+    def page(self, page_number: int) -> memoryview:
+        """
+        Returns the content of a page
+        """
+        if not 0 <= page_number < self.page_count:
+            raise JetFormatException("Invalid page number {}".format(page_number))
+        start = page_number * JetDatabase.PAGE_SIZE
+        return self._data[start : start + JetDatabase.PAGE_SIZE]
+
+    def table_names(self) -> List[str]:
+        """
+        Returns the names of all tables in the database (including system tables)
+        """
+        return list(self._table_pages().values())
+
+    def _table_pages(self) -> Dict[int, str]:
+        """
+        Returns a dictionary of table definition page to table name
+        """
+        if self._tables is None:
+            columns = self._read_table_definition(JetDatabase.CATALOG_PAGE)
+            self._tables = {}
+            for row in self._rows(JetDatabase.CATALOG_PAGE, columns):
+                if row.get("Type") == JetDatabase.CATALOG_TYPE_TABLE and row.get(
+                    "Name"
+                ):
+                    self._tables[row["Id"] & 0x00FFFFFF] = row["Name"]
+        return self._tables
+
+    def has_table(self, table_name: str) -> bool:
+        """
+        Returns True if the database contains a table with matching name
+        (case insensitive)
+        """
+        return table_name.lower() in (n.lower() for n in self.table_names())
+
+    def _table_page(self, table_name: str) -> int:
+        """
+        Returns the table definition page for a table
+        """
+        for page_number, name in self._table_pages().items():
+            if name.lower() == table_name.lower():
+                return page_number
+
+        raise JetFormatException("Table {} does not exist".format(table_name))
+
+    def row_count(self, table_name: str) -> int:
+        """
+        Returns the number of rows in a table, as stored in its definition
+        """
+        return INT32.unpack_from(self.page(self._table_page(table_name)), 16)[0]
+
+    def rows(self, table_name: str) -> Iterator[Dict[str, object]]:
+        """
+        Iterates over the rows of a table, yielding a dictionary of column
+        name to value for each row. Table names are case insensitive.
+        """
+        page_number = self._table_page(table_name)
+        columns = self._read_table_definition(page_number)
+        return self._rows(page_number, columns)
+
+    def _read_table_definition(self, page_number: int) -> List[JetColumn]:
+        """
+        Reads the column definitions from a table definition
+        """
+        page = self.page(page_number)
+        if page[0] != JetDatabase.PAGE_TABLE_DEFINITION:
+            raise JetFormatException(
+                "Page {} is not a table definition".format(page_number)
+            )
+
+        # definitions may span multiple pages, each with an 8 byte header
+        definition = bytearray(page)
+        next_page = INT32.unpack_from(page, 4)[0]
+        while next_page:
+            page = self.page(next_page)
+            definition.extend(page[8:])
+            next_page = INT32.unpack_from(page, 4)[0]
+
+        column_count = INT16.unpack_from(definition, 45)[0]
+        index_count = INT32.unpack_from(definition, 51)[0]
+
+        offset = 63 + index_count * 12
+        columns = []
+        for _ in range(column_count):
+            columns.append(JetColumn(definition, offset))
+            offset += 25
+
+        for column in columns:
+            name_length = INT16.unpack_from(definition, offset)[0]
+            column.name = bytes(
+                definition[offset + 2 : offset + 2 + name_length]
+            ).decode("utf-16-le")
+            offset += 2 + name_length
+
+        self._usage_maps[page_number] = INT32.unpack_from(definition, 55)[0]
+
+        return sorted(columns, key=lambda c: c.column_number)
+
+    def _find_row(self, page: memoryview, row: int) -> memoryview:
+        """
+        Returns the data of a row within a page, following overflow rows
+        """
+        row_count = INT16.unpack_from(page, 12)[0]
+        if row >= row_count:
+            raise JetFormatException("Invalid row {}".format(row))
+
+        start = INT16.unpack_from(page, 14 + row * 2)[0]
+        if row == 0:
+            end = JetDatabase.PAGE_SIZE
+        else:
+            end = INT16.unpack_from(page, 12 + row * 2)[0] & JetDatabase.ROW_OFFSET_MASK
+
+        data = page[start & JetDatabase.ROW_OFFSET_MASK : end]
+        if start & JetDatabase.ROW_OVERFLOW:
+            pointer = INT32.unpack_from(data, 0)[0]
+            return self._find_row(self.page(pointer >> 8), pointer & 0xFF)
+        return data
+
+    def _data_pages(self, table_page: int) -> Iterator[memoryview]:
+        """
+        Iterates over the data pages belonging to a table
+        """
+        candidates = self._usage_map_pages(table_page)
+        if candidates is None:
+            # unknown usage map, scan all pages
+            candidates = range(self.page_count)
+
+        for page_number in candidates:
+            if page_number >= self.page_count:
+                break
+            page = self.page(page_number)
+            if (
+                page[0] == JetDatabase.PAGE_DATA
+                and INT32.unpack_from(page, 4)[0] == table_page
+            ):
+                yield page
+
+    def _usage_map_pages(self, table_page: int) -> Optional[Iterator[int]]:
+        """
+        Returns the pages listed in a table's usage map, or None if the usage
+        map could not be read
+        """
+        pointer = self._usage_maps[table_page]
+        usage_map = self._find_row(self.page(pointer >> 8), pointer & 0xFF)
+        map_type = usage_map[0]
+        if map_type == 0:
+            # inline bitmap, starting at a page number
+            start_page = INT32.unpack_from(usage_map, 1)[0]
+            return JetDatabase._bitmap_pages(usage_map[5:], start_page)
+        if map_type == 1:
+            # list of bitmap pages
+            return self._reference_map_pages(usage_map)
+        return None
+
+    def _reference_map_pages(self, usage_map: memoryview) -> Iterator[int]:
+        """
+        Iterates over the pages listed in a usage map consisting of bitmap pages
+        """
+        pages_per_map = (JetDatabase.PAGE_SIZE - 4) * 8
+        for map_index in range((len(usage_map) - 1) // 4):
+            map_page = INT32.unpack_from(usage_map, 1 + map_index * 4)[0]
+            if map_page:
+                yield from JetDatabase._bitmap_pages(
+                    self.page(map_page)[4:], map_index * pages_per_map
+                )
+
+    @staticmethod
+    def _bitmap_pages(bitmap: memoryview, start_page: int) -> Iterator[int]:
+        """
+        Iterates over the pages flagged in a usage bitmap
+        """
+        for byte_index, byte in enumerate(bitmap):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield start_page + byte_index * 8 + bit
+
+    def _rows(
+        self, table_page: int, columns: List[JetColumn]
+    ) -> Iterator[Dict[str, object]]:
+        """
+        Iterates over the rows of a table
+        """
+        for page in self._data_pages(table_page):
+            row_count = INT16.unpack_from(page, 12)[0]
+            end = JetDatabase.PAGE_SIZE
+            for row in range(row_count):
+                start = INT16.unpack_from(page, 14 + row * 2)[0]
+                row_end = end
+                end = start & JetDatabase.ROW_OFFSET_MASK
+                if start & JetDatabase.ROW_DELETED:
+                    continue
+
+                if start & JetDatabase.ROW_OVERFLOW:
+                    data = self._find_row(page, row)
+                else:
+                    data = page[end:row_end]
+                yield self._read_row(data, columns)
+
+    def _read_row(
+        self, data: memoryview, columns: List[JetColumn]
+    ) -> Dict[str, object]:
+        """
+        Reads the values from a row
+        """
+        row_column_count = INT16.unpack_from(data, 0)[0]
+        null_mask_size = (row_column_count + 7) // 8
+        null_mask = data[len(data) - null_mask_size :]
+        var_count_offset = len(data) - null_mask_size - 2
+        var_count = INT16.unpack_from(data, var_count_offset)[0]
+
+        res = {}
+        for column in columns:
+            number = column.column_number
+            # set bits in the null mask indicate non-null values
+            is_set = number < row_column_count and bool(
+                null_mask[number // 8] & (1 << (number % 8))
+            )
+            if column.column_type == JetColumn.TYPE_BOOL:
+                res[column.name] = is_set
+                continue
+            if not is_set:
+                res[column.name] = None
+                continue
+
+            if column.is_fixed():
+                start = column.fixed_offset + 2
+                value = data[start : start + column.length]
+            else:
+                if column.var_column_number >= var_count:
+                    res[column.name] = None
+                    continue
+                offset = var_count_offset - 2 - column.var_column_number * 2
+                start = INT16.unpack_from(data, offset)[0]
+                end = INT16.unpack_from(data, offset - 2)[0]
+                value = data[start:end]
+
+            res[column.name] = self._convert_value(column, value)
+
+        return res
+
+    def _convert_value(self, column: JetColumn, value: memoryview):
+        """
+        Converts a raw column value
+        """
+        column_type = column.column_type
+        if column_type in JetColumn.FIXED_STRUCTS:
+            res = JetColumn.FIXED_STRUCTS[column_type].unpack_from(value)[0]
+            if column_type == JetColumn.TYPE_MONEY:
+                return res / 10000
+            return res
+        if column_type == JetColumn.TYPE_TEXT:
+            return JetDatabase.decode_text(value)
+        if column_type == JetColumn.TYPE_MEMO:
+            return JetDatabase.decode_text(self._read_long_value(value))
+        if column_type == JetColumn.TYPE_OLE:
+            return self._read_long_value(value)
+        return value
+
+    def _read_long_value(self, value: memoryview):
+        """
+        Reads a long value (memo or OLE), which may be stored inline or
+        on separate pages.
+
+        Returns a memoryview for values stored within a single page, or bytes
+        for values spanning multiple pages.
+        """
+        if len(value) < 12:
+            return b""
+
+        header = INT32.unpack_from(value, 0)[0]
+        length = header & JetDatabase.LVAL_LENGTH_MASK
+        if header & JetDatabase.LVAL_INLINE:
+            return value[12 : 12 + length]
+
+        pointer = INT32.unpack_from(value, 4)[0]
+        if header & JetDatabase.LVAL_SINGLE_PAGE:
+            return self._find_row(self.page(pointer >> 8), pointer & 0xFF)[:length]
+
+        # chain of pages, each prefixed with a pointer to the next part
+        res = bytearray()
+        while pointer and len(res) < length:
+            part = self._find_row(self.page(pointer >> 8), pointer & 0xFF)
+            pointer = INT32.unpack_from(part, 0)[0]
+            res.extend(part[4:])
+        return bytes(res[:length])
+
+    @staticmethod
+    def decode_text(value) -> str:
+        """
+        Decodes a Jet 4 text value, which is either UTF-16 or uses
+        Jet's "compressed unicode" encoding
+        """
+        if len(value) >= 2 and value[0] == 0xFF and value[1] == 0xFE:
+            # compressed sections store one byte per character, with
+            # 00 bytes toggling between compressed and uncompressed sections
+            res = bytearray()
+            compressed = True
+            i = 2
+            while i < len(value):
+                if value[i] == 0:
+                    compressed = not compressed
+                    i += 1
+                elif compressed:
+                    res.append(value[i])
+                    res.append(0)
+                    i += 1
+                elif i + 1 < len(value):
+                    res.append(value[i])
+                    res.append(value[i + 1])
+                    i += 2
+                else:
+                    break
+            value = res
+
+        return bytes(value).decode("utf-16-le", errors="replace")
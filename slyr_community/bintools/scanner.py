@@ -5,15 +5,50 @@ Scans a binary blob for interesting looking bits, which may give clues to revers
 """
 
 import string
-from struct import unpack
-import binascii
+from struct import unpack, iter_unpack
+from typing import List, Optional, Tuple
 from colorama import Fore
 
+from slyr_community.parser.memory_stream import MemoryStream
 from slyr_community.parser.stream import Stream
 from slyr_community.parser.object_registry import REGISTRY
 from slyr_community.parser.objects.colors import Color
 
 
+def find_registered_clsids(data: bytes) -> List[Tuple[int, type]]:
+    """
+    Finds all occurrences of registered object CLSIDs in a buffer
+
+    :return: list of (offset, object class), sorted by offset
+    """
+    res = []
+    for clsid, object_class in REGISTRY.binary_objects.items():
+        offset = data.find(clsid)
+        while offset != -1:
+            res.append((offset, object_class))
+            offset = data.find(clsid, offset + 1)
+    res.sort(key=lambda r: r[0])
+    return res
+
+
+def iter_values(data: bytes, value_format: str, size: int):
+    """
+    Iterates over the values of the given struct format starting at every
+    offset of a buffer, yielding (offset, value) tuples in offset order
+    """
+    count = len(data) - size + 1
+    if count <= 0:
+        return []
+
+    values = [None] * count
+    for alignment in range(min(size, count)):
+        end = alignment + ((len(data) - alignment) // size) * size
+        values[alignment::size] = [
+            v[0] for v in iter_unpack(value_format, data[alignment:end])
+        ]
+    return enumerate(values)
+
+
 class ObjectScan:
     """
     Base class for objects which scan through file handles for interesting bits
@@ -30,6 +65,24 @@ class ObjectScan:
         file_handle.seek(start)
         return res
 
+    def scan_buffer(self, data: bytes) -> List[Tuple[int, "ObjectMatch"]]:
+        """
+        Scans a whole buffer for matches.
+
+        Subclasses should override this with a faster check than the default
+        implementation, which runs scan() at every offset.
+        :param data: buffer to scan
+        :return: list of (scanned offset, match), sorted by offset
+        """
+        res = []
+        handle = MemoryStream(data)
+        for offset in range(len(data)):
+            handle.seek(offset)
+            match = self.scan(handle)
+            if match is not None:
+                res.append((offset, match))
+        return res
+
     def check_handle(self, file_handle):  # pylint: disable=unused-argument
         """
         Runs scan check. Subclasses should implement their logic here
@@ -123,6 +176,27 @@ class StringScan(ObjectScan):
             return None
         return None
 
+    def scan_buffer(self, data):
+        # only attempt to read strings with a plausible length and terminator
+        res = []
+        handle = MemoryStream(data)
+        size = len(data)
+        for offset, length in iter_values(data, "<I", 4):
+            end = offset + 4 + length
+            if (
+                length < 4
+                or length % 2
+                or end > size
+                or data[end - 2] != 0
+                or data[end - 1] != 0
+            ):
+                continue
+            handle.seek(offset)
+            match = self.scan(handle)
+            if match is not None:
+                res.append((offset, match))
+        return res
+
 
 class GuidCodeMatch(ObjectMatch):
     """
@@ -152,10 +226,7 @@ class GuidCodeScan(ObjectScan):
 
     def check_handle(self, file_handle):
         try:
-            guid_bin = binascii.hexlify(file_handle.read(16))
-            guid = REGISTRY.hex_to_clsid(guid_bin)
-
-            obj = REGISTRY.create_object(guid)
+            obj = REGISTRY.create_object_from_bytes(file_handle.read(16))
             if obj is None:
                 return None
             return GuidCodeMatch(
@@ -165,6 +236,12 @@ class GuidCodeScan(ObjectScan):
             return None
         return None
 
+    def scan_buffer(self, data):
+        return [
+            (offset, GuidCodeMatch(offset, 16, object_class.__name__))
+            for offset, object_class in find_registered_clsids(data)
+        ]
+
 
 class DoubleMatch(ObjectMatch):
     """
@@ -192,19 +269,33 @@ class DoubleScan(ObjectScan):
     Scans for reasonable real/double values
     """
 
+    @staticmethod
+    def is_reasonable(real_value: float) -> bool:
+        """
+        Returns True if a double value looks like a real value
+        """
+        return (
+            -1000 < real_value < 10000
+            and (real_value > 0.00001 or real_value < -0.00001)
+            and round(real_value * 10) == real_value * 10
+        )
+
     def check_handle(self, file_handle):
         try:
             real_value = unpack("<d", file_handle.read(8))[0]
-            if (
-                -1000 < real_value < 10000
-                and (real_value > 0.00001 or real_value < -0.00001)
-                and round(real_value * 10) == real_value * 10
-            ):
+            if DoubleScan.is_reasonable(real_value):
                 return DoubleMatch(file_handle.tell() - 8, 8, real_value)
         except:  # nopep8, pylint: disable=bare-except
             return None
         return None
 
+    def scan_buffer(self, data):
+        return [
+            (offset, DoubleMatch(offset, 8, value))
+            for offset, value in iter_values(data, "<d", 8)
+            if DoubleScan.is_reasonable(value)
+        ]
+
 
 class IntMatch(ObjectMatch):
     """
@@ -241,6 +332,13 @@ class IntScan(ObjectScan):
             return None
         return None
 
+    def scan_buffer(self, data):
+        return [
+            (offset, IntMatch(offset, 4, value))
+            for offset, value in iter_values(data, "<I", 4)
+            if 0 < value < 1125500
+        ]
+
 
 class ColorMatch(ObjectMatch):
     """
@@ -295,7 +393,7 @@ class ColorScan(ObjectScan):
             color = stream.read_object()
             if issubclass(color.__class__, Color):
                 return ColorMatch(
-                    start, file_handle.tell() - start, color.color_model, color
+                    start, file_handle.tell() - start, color.model, color.to_dict()
                 )
             else:
                 return None
@@ -303,6 +401,19 @@ class ColorScan(ObjectScan):
             return None
         return None
 
+    def scan_buffer(self, data):
+        # colors can only start at a color CLSID
+        res = []
+        handle = MemoryStream(data)
+        for offset, object_class in find_registered_clsids(data):
+            if not issubclass(object_class, Color):
+                continue
+            handle.seek(offset)
+            match = self.scan(handle)
+            if match is not None:
+                res.append((offset, match))
+        return res
+
 
 class PersistentMatch(ObjectMatch):
     """
@@ -342,6 +453,17 @@ class PersistentScan(ObjectScan):
             return None
         return None
 
+    def scan_buffer(self, data):
+        # persistent objects can only start at a registered CLSID
+        res = []
+        handle = MemoryStream(data)
+        for offset, _ in find_registered_clsids(data):
+            handle.seek(offset)
+            match = self.scan(handle)
+            if match is not None:
+                res.append((offset, match))
+        return res
+
 
 SCANNERS = [
     StringScan(),
@@ -351,3 +473,39 @@ SCANNERS = [
     ColorScan(),
     PersistentScan(),
 ]
+
+
+def scan_buffer(data: bytes) -> List[ObjectMatch]:
+    """
+    Runs all scanners over a buffer, returning the matches ordered by
+    the offset they were found at (and then by scanner)
+    """
+    matches = []
+    for scanner_index, scanner in enumerate(SCANNERS):
+        for offset, match in scanner.scan_buffer(data):
+            matches.append((offset, scanner_index, match))
+    matches.sort(key=lambda m: (m[0], m[1]))
+    return [m[2] for m in matches]
+
+
+def resolve_precedence(
+    matches: List[ObjectMatch], length: int
+) -> List[Optional[ObjectMatch]]:
+    """
+    Returns the match which should be used for each byte in a buffer of the
+    given length. Where matches overlap the match with the highest precedence
+    is used, or the first match for matches with equal precedence.
+
+    :param matches: matches, as returned by scan_buffer()
+    :param length: buffer length
+    """
+    res = [None] * length
+    # paint matches from lowest to highest precedence, so that higher
+    # precedence matches overwrite lower ones. Within a precedence the
+    # earliest match must win, so those are painted last.
+    for match in sorted(reversed(matches), key=lambda m: m.precedence()):
+        start = max(match.match_start, 0)
+        end = min(match.match_end, length)
+        if end > start:
+            res[start:end] = [match] * (end - start)
+    return res
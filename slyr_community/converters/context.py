@@ -22,6 +22,7 @@
 Conversion context
 """
 
+import copy
 import os
 import tempfile
 from math import cos, sin, asin, sqrt, radians
@@ -44,8 +45,28 @@ class Context:
     WARNING = "WARNING"
     CRITICAL = "CRITICAL"
 
-    def __init__(self):
-        s = QSettings()
+    # attributes which are read from the plugin settings, see read_settings()
+    SETTINGS_ATTRIBUTES = (
+        "convert_fonts",
+        "units",
+        "apply_conversion_tweaks",
+        "inkscape_path",
+        "convert_esri_fonts_to_simple_markers",
+        "sde_primary_key",
+        "sde_table_name_conversion",
+        "upgrade_http_to_https",
+    )
+
+    def __init__(self, settings: Optional[Dict[str, object]] = None):
+        """
+        Constructor for Context.
+
+        If settings is specified (see read_settings()) then these will be
+        used instead of reading the plugin settings again.
+        """
+        if settings is None:
+            settings = Context.read_settings()
+
         self.layer_name: Optional[str] = None
         self.layout_name: Optional[str] = None
         self.element_name: Optional[str] = None
@@ -63,33 +84,16 @@ class Context:
         self.current_symbol_layer = None
         self.picture_folder: Optional[str] = None
         self.temporary_picture_folder = ""
-        self.convert_fonts = int(s.value("/plugins/slyr/convert_fonts_to_svg", 1))
-        try:
-            unit = s.value(
-                "/plugins/slyr/symbol_units",
-                int(QgsUnitTypes.RenderUnit.RenderPoints),
-                int,
-            )
-            if unit is None:
-                unit = QgsUnitTypes.RenderUnit.RenderPoints
-            else:
-                unit = QgsUnitTypes.RenderUnit(unit)
-        except TypeError:
-            unit = QgsUnitTypes.RenderUnit.RenderPoints
-        except AttributeError:
-            unit = QgsUnitTypes.RenderUnit.RenderPoints
-
-        self.units = unit
-        self.apply_conversion_tweaks = int(s.value("/plugins/slyr/apply_tweaks", 1))
-        self.inkscape_path = s.value("/plugins/slyr/inkscape_path", "inkscape")
-        self.convert_esri_fonts_to_simple_markers = int(
-            s.value("/plugins/slyr/convert_fonts_to_simple_markers", 1)
-        )
+        self.convert_fonts = settings["convert_fonts"]
+        self.units = settings["units"]
+        self.apply_conversion_tweaks = settings["apply_conversion_tweaks"]
+        self.inkscape_path = settings["inkscape_path"]
+        self.convert_esri_fonts_to_simple_markers = settings[
+            "convert_esri_fonts_to_simple_markers"
+        ]
 
-        self.sde_primary_key: str = s.value("/plugins/slyr/sde_primary_key", "OBJECTID")
-        self.sde_table_name_conversion: str = s.value(
-            "/plugins/slyr/sde_name_conversion", "unchanged"
-        )
+        self.sde_primary_key: str = settings["sde_primary_key"]
+        self.sde_table_name_conversion: str = settings["sde_table_name_conversion"]
 
         self.unsupported_object_callback = None
         self.warned_crs_definitions = set()
@@ -137,13 +141,89 @@ class Context:
 
         self.preferred_file_extension: Optional[str] = "xml"
 
-        self.upgrade_http_to_https: bool = bool(
-            int(s.value("/plugins/slyr/replace_http", 0))
-        )
+        self.upgrade_http_to_https: bool = settings["upgrade_http_to_https"]
 
         self.vsi_content_prefix: Optional[str] = None
         self.prefer_maplex: bool = False
 
+        # optional cache for converted symbols, see SymbolConversionCache
+        self.symbol_cache = None
+
+    @staticmethod
+    def read_settings() -> Dict[str, object]:
+        """
+        Reads the conversion settings from the plugin settings.
+
+        The returned snapshot can be passed to the Context constructor, so
+        that the settings are only read once when many contexts are created.
+        """
+        s = QSettings()
+        try:
+            unit = s.value(
+                "/plugins/slyr/symbol_units",
+                int(QgsUnitTypes.RenderUnit.RenderPoints),
+                int,
+            )
+            if unit is None:
+                unit = QgsUnitTypes.RenderUnit.RenderPoints
+            else:
+                unit = QgsUnitTypes.RenderUnit(unit)
+        except TypeError:
+            unit = QgsUnitTypes.RenderUnit.RenderPoints
+        except AttributeError:
+            unit = QgsUnitTypes.RenderUnit.RenderPoints
+
+        return {
+            "convert_fonts": int(s.value("/plugins/slyr/convert_fonts_to_svg", 1)),
+            "units": unit,
+            "apply_conversion_tweaks": int(s.value("/plugins/slyr/apply_tweaks", 1)),
+            "inkscape_path": s.value("/plugins/slyr/inkscape_path", "inkscape"),
+            "convert_esri_fonts_to_simple_markers": int(
+                s.value("/plugins/slyr/convert_fonts_to_simple_markers", 1)
+            ),
+            "sde_primary_key": s.value("/plugins/slyr/sde_primary_key", "OBJECTID"),
+            "sde_table_name_conversion": s.value(
+                "/plugins/slyr/sde_name_conversion", "unchanged"
+            ),
+            "upgrade_http_to_https": bool(
+                int(s.value("/plugins/slyr/replace_http", 0))
+            ),
+        }
+
+    def reset_conversion_state(self):
+        """
+        Resets the state which is collected while converting a single item,
+        such as the symbol layer index maps and CRS warnings.
+        """
+        self.current_symbol = None
+        self.current_symbol_layer = None
+        self.symbol_type_hint = None
+        self.used_geometric_effect_which_flips_orientation = False
+        self.global_cim_effects = []
+        self.symbol_layer_output_to_input_index_map = {}
+        self.final_symbol_layer_output_to_input_index_map = {}
+        self.warned_crs_definitions = set()
+
+    def clone(self) -> "Context":
+        """
+        Returns a copy of the context, reusing its settings and configuration
+        without reading the plugin settings again.
+
+        The per-item conversion state is not copied (see reset_conversion_state()).
+        """
+        res = copy.copy(self)
+        res.reset_conversion_state()
+        return res
+
+    def for_symbol(self, symbol_name: str) -> "Context":
+        """
+        Returns a copy of the context for converting the symbol with
+        the specified name
+        """
+        res = self.clone()
+        res.symbol_name = symbol_name
+        return res
+
     def push_warning(self, warning: str, level: Optional[str] = None):
         """
         Pushes a warning to the context
@@ -0,0 +1,396 @@
+"""
+EMF picture conversion
+"""
+
+# /***************************************************************************
+#  *                                                                         *
+#  *   This program is free software; you can redistribute it and/or modify  *
+#  *   it under the terms of the GNU General Public License as published by  *
+#  *   the Free Software Foundation; either version 2 of the License, or     *
+#  *   (at your option) any later version.                                   *
+#  *                                                                         *
+#  ***************************************************************************/
+
+import hashlib
+import os
+import shutil
+import subprocess  # nosec B404
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from qgis.PyQt.QtCore import QSettings
+from qgis.PyQt.QtXml import QDomDocument
+from qgis.core import QgsApplication
+
+from .context import Context
+from .emf_svg import EmfSvgTranslator, UnsupportedEmfException
+
+# Inkscape export arguments, for different Inkscape versions
+INKSCAPE_EXPORT_ARGUMENTS = (
+    # most recent inkscape version arguments
+    ("--export-plain-svg", "--export-area-drawing", "-o", "{svg}", "{emf}"),
+    # bah, inkscape changed parameters!
+    ("--export-plain-svg", "--export-file", "{svg}", "{emf}"),
+    # this is the command for a very old inkscape version (pre 1.0)
+    ("--file", "{emf}", "--export-plain-svg", "{svg}"),
+)
+
+# marks an Inkscape binary which could not be run
+INKSCAPE_UNAVAILABLE = -1
+
+# index of the working INKSCAPE_EXPORT_ARGUMENTS for each Inkscape binary,
+# detected on first use
+_INKSCAPE_ARGUMENT_STYLES: Dict[str, int] = {}
+
+# result of running a conversion command
+RUN_OK = 0
+RUN_MISSING_BINARY = 1
+RUN_PERMISSION_DENIED = 2
+
+
+class EmfConverter:
+    """
+    Converts EMF pictures to SVG.
+
+    Pictures using only common vector drawing records are translated natively,
+    and other pictures are converted using Inkscape (or LibreOffice). SVGs
+    converted by Inkscape are cached on disk in the user's QGIS settings
+    folder, keyed on the content of the EMF picture. Both the native
+    translation and the cache can be disabled in the SLYR settings.
+    """
+
+    # number of EMF files to convert in each Inkscape process in batch mode
+    BATCH_SIZE = 50
+
+    @staticmethod
+    def native_conversion_enabled() -> bool:
+        """
+        Returns True if EMF pictures may be translated natively, or False
+        if all pictures must be converted using Inkscape
+        """
+        return not int(QSettings().value("/plugins/slyr/force_inkscape_emf", 0))
+
+    @staticmethod
+    def cache_enabled() -> bool:
+        """
+        Returns True if converted SVG files should be cached
+        """
+        return bool(int(QSettings().value("/plugins/slyr/enable_emf_cache", 1)))
+
+    @staticmethod
+    def cache_folder() -> str:
+        """
+        Returns the folder used to cache converted SVG files
+        """
+        folder = QSettings().value("/plugins/slyr/emf_cache_path", "")
+        if not folder:
+            folder = os.path.join(
+                QgsApplication.qgisSettingsDirPath(), "slyr", "emf_cache"
+            )
+        return folder
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """
+        Returns the cache key for EMF content
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def cached_svg_path(content: bytes) -> str:
+        """
+        Returns the path of the cached SVG for EMF content. The file
+        only exists if the content has previously been converted.
+        """
+        return os.path.join(
+            EmfConverter.cache_folder(), EmfConverter.content_hash(content) + ".svg"
+        )
+
+    @staticmethod
+    def store_in_cache(content: bytes, svg_path: str):
+        """
+        Stores a converted SVG file in the cache
+        """
+        cache_path = EmfConverter.cached_svg_path(content)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # write to a temporary file first, so that concurrent conversions
+            # never see a partially written file
+            temp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+            shutil.copyfile(svg_path, temp_path)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def run(args: List[str]) -> int:
+        """
+        Runs a conversion command, hiding the console window on Windows.
+
+        Returns RUN_OK, RUN_MISSING_BINARY or RUN_PERMISSION_DENIED.
+        """
+        # pylint: disable=subprocess-run-check
+        CREATE_NO_WINDOW = 0x08000000
+        try:
+            try:
+                subprocess.run(  # nosec=B603
+                    args,
+                    stdout=subprocess.PIPE,
+                    creationflags=CREATE_NO_WINDOW,
+                    check=False,
+                )
+            except ValueError:
+                subprocess.run(args, stdout=subprocess.PIPE, check=False)  # nosec=B603
+        except FileNotFoundError:
+            return RUN_MISSING_BINARY
+        except PermissionError:
+            return RUN_PERMISSION_DENIED
+        # pylint: enable=subprocess-run-check
+        return RUN_OK
+
+    @staticmethod
+    def inkscape_export_arguments(
+        binary: str, style: int, emf_path: str, svg_path: str
+    ) -> List[str]:
+        """
+        Returns the arguments for exporting an EMF file using Inkscape
+        """
+        return [binary] + [
+            arg.format(emf=emf_path, svg=svg_path)
+            for arg in INKSCAPE_EXPORT_ARGUMENTS[style]
+        ]
+
+    @staticmethod
+    def convert_with_inkscape(binary: str, emf_path: str, svg_path: str) -> int:
+        """
+        Converts an EMF file using Inkscape.
+
+        The working argument style for the Inkscape binary is detected on
+        first use, and only that style is used for later conversions.
+        """
+        known_style = _INKSCAPE_ARGUMENT_STYLES.get(binary)
+        if known_style == INKSCAPE_UNAVAILABLE:
+            return RUN_MISSING_BINARY
+
+        styles = (
+            [known_style]
+            if known_style is not None
+            else range(len(INKSCAPE_EXPORT_ARGUMENTS))
+        )
+        result = RUN_OK
+        for style in styles:
+            result = EmfConverter.run(
+                EmfConverter.inkscape_export_arguments(
+                    binary, style, emf_path, svg_path
+                )
+            )
+            if result != RUN_OK:
+                _INKSCAPE_ARGUMENT_STYLES[binary] = INKSCAPE_UNAVAILABLE
+                return result
+
+            if os.path.exists(svg_path):
+                _INKSCAPE_ARGUMENT_STYLES[binary] = style
+                return RUN_OK
+
+        return result
+
+    @staticmethod
+    def convert_with_libreoffice(emf_path: str, svg_path: str) -> int:
+        """
+        Converts an EMF file using LibreOffice
+        """
+        out_dir = Path(svg_path).parent
+        result = EmfConverter.run(
+            [
+                "libreoffice",
+                "--headless",
+                "--convert-to",
+                "svg",
+                emf_path,
+                "--outdir",
+                out_dir.as_posix(),
+            ]
+        )
+        libre_office_export_path = (out_dir / Path(emf_path).stem).as_posix() + ".svg"
+        if result == RUN_OK and os.path.exists(libre_office_export_path):
+            try:
+                shutil.copy(libre_office_export_path, svg_path)
+            except shutil.SameFileError:
+                pass
+        return result
+
+    @staticmethod
+    def convert_natively(content: bytes, svg_path: str) -> bool:
+        """
+        Converts EMF content using the native translator.
+
+        Returns False if the content uses features which aren't supported
+        by the native translator.
+        """
+        try:
+            svg = EmfSvgTranslator.translate(content)
+        except UnsupportedEmfException:
+            return False
+
+        with open(svg_path, "wt", encoding="utf-8") as svg_file:
+            svg_file.write(svg)
+        return True
+
+    @staticmethod
+    def clean_svg(svg_path: str):
+        """
+        Removes width/height from the svg tag, so that the viewbox is correctly re-calculated
+        """
+        with open(svg_path, "rt", encoding="utf-8") as svg_file:
+            doc = QDomDocument()
+            doc.setContent("".join(svg_file.readlines()))
+            doc.documentElement().removeAttribute("width")
+            doc.documentElement().removeAttribute("height")
+
+            out = doc.toString(2)
+        with open(svg_path, "wt", encoding="utf-8") as svg_file:
+            svg_file.write(out)
+
+    @staticmethod
+    def emf_to_svg(
+        emf_path: str,
+        svg_path: str,
+        inkscape_path: Optional[str] = None,
+        context: Optional[Context] = None,
+    ):
+        """
+        Converts an EMF file to an SVG file (natively, or using inkscape)
+        """
+        with open(emf_path, "rb") as f:
+            content = f.read()
+
+        if EmfConverter.native_conversion_enabled() and EmfConverter.convert_natively(
+            content, svg_path
+        ):
+            return
+
+        use_cache = EmfConverter.cache_enabled()
+        if use_cache:
+            cache_path = EmfConverter.cached_svg_path(content)
+            if os.path.exists(cache_path):
+                try:
+                    shutil.copyfile(cache_path, svg_path)
+                    return
+                except OSError:
+                    pass
+
+        binary = inkscape_path or "inkscape"
+        likely_invalid_path = False
+
+        result = EmfConverter.convert_with_inkscape(binary, emf_path, svg_path)
+        if result == RUN_PERMISSION_DENIED:
+            likely_invalid_path = True
+
+        if not os.path.exists(svg_path):
+            if (
+                EmfConverter.convert_with_libreoffice(emf_path, svg_path)
+                == RUN_PERMISSION_DENIED
+            ):
+                likely_invalid_path = True
+
+        if not os.path.exists(svg_path):
+            # didn't work
+            if context is None:
+                return
+            if likely_invalid_path:
+                context.push_warning(
+                    "Invalid path to Inkscape executable -- cannot convert EMF content",
+                    level=Context.CRITICAL,
+                )
+            else:
+                context.push_warning(
+                    "Conversion of EMF content requires a valid path to an Inkscape install setup in the SLYR options",
+                    level=Context.CRITICAL,
+                )
+            return
+
+        EmfConverter.clean_svg(svg_path)
+        if use_cache:
+            EmfConverter.store_in_cache(content, svg_path)
+
+    @staticmethod
+    def convert_batch(
+        contents: Iterable[bytes],
+        inkscape_path: Optional[str] = None,
+        max_processes: Optional[int] = None,
+    ) -> int:
+        """
+        Converts many EMF pictures to SVG, storing the results in the cache so
+        that later conversions of the same pictures don't need to run Inkscape.
+
+        Recent Inkscape versions convert BATCH_SIZE pictures per process, with
+        up to max_processes Inkscape processes running at once. Pictures
+        which can't be converted in batches are converted individually, and
+        pictures which can be translated natively are skipped.
+
+        Nothing is converted if the cache is disabled.
+
+        Returns the number of pictures which were converted.
+        """
+        if not EmfConverter.cache_enabled():
+            return 0
+
+        binary = inkscape_path or "inkscape"
+        native_conversion_enabled = EmfConverter.native_conversion_enabled()
+        pending = {}
+        for content in contents:
+            key = EmfConverter.content_hash(content)
+            if key in pending or os.path.exists(EmfConverter.cached_svg_path(content)):
+                continue
+            if not native_conversion_enabled:
+                pending[key] = content
+                continue
+            try:
+                # pictures which can be translated natively never need Inkscape
+                EmfSvgTranslator.translate(content)
+            except UnsupportedEmfException:
+                pending[key] = content
+
+        if not pending:
+            return 0
+
+        converted = 0
+        with tempfile.TemporaryDirectory() as temp_dir:
+            emf_paths = {}
+            for key, content in pending.items():
+                emf_paths[key] = os.path.join(temp_dir, key + ".emf")
+                with open(emf_paths[key], "wb") as f:
+                    f.write(content)
+
+            if _INKSCAPE_ARGUMENT_STYLES.get(binary, 0) == 0:
+                # recent Inkscape versions can export many files at once, writing
+                # each svg next to the source file
+                paths = list(emf_paths.values())
+                batches = [
+                    [
+                        binary,
+                        "--export-type=svg",
+                        "--export-plain-svg",
+                        "--export-area-drawing",
+                    ]
+                    + paths[i : i + EmfConverter.BATCH_SIZE]
+                    for i in range(0, len(paths), EmfConverter.BATCH_SIZE)
+                ]
+                with ThreadPoolExecutor(max_workers=max_processes) as executor:
+                    list(executor.map(EmfConverter.run, batches))
+
+            for key, emf_path in emf_paths.items():
+                svg_path = os.path.join(temp_dir, key + ".svg")
+                if os.path.exists(svg_path):
+                    _INKSCAPE_ARGUMENT_STYLES.setdefault(binary, 0)
+                    EmfConverter.clean_svg(svg_path)
+                    EmfConverter.store_in_cache(pending[key], svg_path)
+                else:
+                    EmfConverter.emf_to_svg(emf_path, svg_path, inkscape_path=binary)
+
+                if os.path.exists(svg_path):
+                    converted += 1
+
+        return converted
@@ -0,0 +1,965 @@
+"""
+Native EMF to SVG translation
+"""
+
+# /***************************************************************************
+#  *                                                                         *
+#  *   This program is free software; you can redistribute it and/or modify  *
+#  *   it under the terms of the GNU General Public License as published by  *
+#  *   the Free Software Foundation; either version 2 of the License, or     *
+#  *   (at your option) any later version.                                   *
+#  *                                                                         *
+#  ***************************************************************************/
+
+import copy
+import math
+import struct
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import quoteattr, escape
+
+# EMF record types
+EMR_HEADER = 0x01
+EMR_POLYBEZIER = 0x02
+EMR_POLYGON = 0x03
+EMR_POLYLINE = 0x04
+EMR_POLYBEZIERTO = 0x05
+EMR_POLYLINETO = 0x06
+EMR_POLYPOLYLINE = 0x07
+EMR_POLYPOLYGON = 0x08
+EMR_SETWINDOWEXTEX = 0x09
+EMR_SETWINDOWORGEX = 0x0A
+EMR_SETVIEWPORTEXTEX = 0x0B
+EMR_SETVIEWPORTORGEX = 0x0C
+EMR_EOF = 0x0E
+EMR_SETMAPMODE = 0x11
+EMR_SETPOLYFILLMODE = 0x13
+EMR_SETTEXTALIGN = 0x16
+EMR_SETTEXTCOLOR = 0x18
+EMR_MOVETOEX = 0x1B
+EMR_INTERSECTCLIPRECT = 0x1E
+EMR_SAVEDC = 0x21
+EMR_RESTOREDC = 0x22
+EMR_SETWORLDTRANSFORM = 0x23
+EMR_MODIFYWORLDTRANSFORM = 0x24
+EMR_SELECTOBJECT = 0x25
+EMR_CREATEPEN = 0x26
+EMR_CREATEBRUSHINDIRECT = 0x27
+EMR_DELETEOBJECT = 0x28
+EMR_ELLIPSE = 0x2A
+EMR_RECTANGLE = 0x2B
+EMR_LINETO = 0x36
+EMR_SETMITERLIMIT = 0x3A
+EMR_BEGINPATH = 0x3B
+EMR_ENDPATH = 0x3C
+EMR_CLOSEFIGURE = 0x3D
+EMR_FILLPATH = 0x3E
+EMR_STROKEANDFILLPATH = 0x3F
+EMR_STROKEPATH = 0x40
+EMR_ABORTPATH = 0x44
+EMR_EXTSELECTCLIPRGN = 0x4B
+EMR_EXTCREATEFONTINDIRECTW = 0x52
+EMR_EXTTEXTOUTW = 0x54
+EMR_POLYBEZIER16 = 0x55
+EMR_POLYGON16 = 0x56
+EMR_POLYLINE16 = 0x57
+EMR_POLYBEZIERTO16 = 0x58
+EMR_POLYLINETO16 = 0x59
+EMR_POLYPOLYLINE16 = 0x5A
+EMR_POLYPOLYGON16 = 0x5B
+EMR_EXTCREATEPEN = 0x5F
+
+# records which don't affect the translated drawing
+IGNORED_RECORDS = {
+    0x10,  # EMR_SETMAPPERFLAGS
+    0x12,  # EMR_SETBKMODE
+    0x14,  # EMR_SETROP2
+    0x15,  # EMR_SETSTRETCHBLTMODE
+    0x17,  # EMR_SETCOLORADJUSTMENT
+    0x19,  # EMR_SETBKCOLOR
+    # clip regions are never set (see EMR_EXTSELECTCLIPRGN), so offsetting
+    # or saving them has no effect
+    0x1A,  # EMR_OFFSETCLIPRGN
+    0x1C,  # EMR_SETMETARGN
+    0x46,  # EMR_GDICOMMENT
+    0x62,  # EMR_SETICMMODE
+    0x73,  # EMR_SETLAYOUT
+}
+
+# region mode which replaces the clip region
+RGN_COPY = 5
+
+# map modes
+MM_TEXT = 1
+MM_ISOTROPIC = 7
+MM_ANISOTROPIC = 8
+
+# size of a logical unit in millimeters, for the fixed scale map modes
+MAP_MODE_UNIT_SIZES = {
+    2: 0.1,  # MM_LOMETRIC
+    3: 0.01,  # MM_HIMETRIC
+    4: 0.254,  # MM_LOENGLISH
+    5: 0.0254,  # MM_HIENGLISH
+    6: 25.4 / 1440,  # MM_TWIPS
+}
+
+# pen styles
+PS_STYLE_MASK = 0x0000000F
+PS_DASH = 1
+PS_DOT = 2
+PS_DASHDOT = 3
+PS_DASHDOTDOT = 4
+PS_NULL = 5
+PS_USERSTYLE = 7
+PS_ENDCAP_MASK = 0x00000F00
+PS_ENDCAP_SQUARE = 0x00000100
+PS_ENDCAP_FLAT = 0x00000200
+PS_JOIN_MASK = 0x0000F000
+PS_JOIN_BEVEL = 0x00001000
+PS_JOIN_MITER = 0x00002000
+PS_GEOMETRIC = 0x00010000
+
+# dash patterns, as multiples of the pen width
+DASH_PATTERNS = {
+    PS_DASH: (3, 1),
+    PS_DOT: (1, 1),
+    PS_DASHDOT: (3, 1, 1, 1),
+    PS_DASHDOTDOT: (3, 1, 1, 1, 1, 1),
+}
+
+# brush styles
+BS_SOLID = 0
+BS_NULL = 1
+
+# stock objects
+STOCK_OBJECT_FLAG = 0x80000000
+STOCK_BRUSHES = {
+    0: (255, 255, 255),  # WHITE_BRUSH
+    1: (192, 192, 192),  # LTGRAY_BRUSH
+    2: (128, 128, 128),  # GRAY_BRUSH
+    3: (64, 64, 64),  # DKGRAY_BRUSH
+    4: (0, 0, 0),  # BLACK_BRUSH
+    5: None,  # NULL_BRUSH
+    18: (255, 255, 255),  # DC_BRUSH
+}
+STOCK_PENS = {
+    6: (255, 255, 255),  # WHITE_PEN
+    7: (0, 0, 0),  # BLACK_PEN
+    8: None,  # NULL_PEN
+    19: (0, 0, 0),  # DC_PEN
+}
+
+# fill modes
+ALTERNATE = 1
+
+# text alignment
+TA_RIGHT = 2
+TA_CENTER = 6
+TA_BOTTOM = 8
+TA_BASELINE = 24
+
+# world transform modification modes
+MWT_IDENTITY = 1
+MWT_LEFTMULTIPLY = 2
+MWT_RIGHTMULTIPLY = 3
+MWT_SET = 4
+
+# output units (SVG user units) per millimeter, at 96 dpi
+PIXELS_PER_MM = 96 / 25.4
+
+# cubic bezier control point distance for approximating a quarter ellipse
+KAPPA = 4 * (math.sqrt(2) - 1) / 3
+
+RECTL = struct.Struct("<iiii")
+POINTL = struct.Struct("<ii")
+XFORM = struct.Struct("<ffffff")
+
+
+class UnsupportedEmfException(Exception):
+    """
+    Raised when an EMF picture uses features which cannot be translated
+    """
+
+
+class Pen:
+    """
+    A GDI pen
+    """
+
+    __slots__ = ("color", "width", "style", "dashes")
+
+    def __init__(self, color, width: float = 0, style: int = 0, dashes=None):
+        self.color = color
+        self.width = width
+        self.style = style
+        self.dashes = dashes
+
+
+class Font:
+    """
+    A GDI font
+    """
+
+    __slots__ = ("height", "weight", "italic", "escapement", "face_name")
+
+    def __init__(
+        self, height: int, weight: int, italic: bool, escapement: int, face_name: str
+    ):
+        self.height = height
+        self.weight = weight
+        self.italic = italic
+        self.escapement = escapement
+        self.face_name = face_name
+
+
+class DeviceContext:
+    """
+    Graphics state for EMF playback
+    """
+
+    def __init__(self):
+        self.pen = Pen((0, 0, 0))
+        self.brush = (255, 255, 255)
+        self.font: Optional[Font] = None
+        self.text_color = (0, 0, 0)
+        self.text_align = 0
+        self.fill_mode = ALTERNATE
+        self.miter_limit = 10.0
+        self.map_mode = MM_TEXT
+        self.window_org = (0, 0)
+        self.window_ext = (1, 1)
+        self.viewport_org = (0, 0)
+        self.viewport_ext = (1, 1)
+        self.world_transform = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def _multiply(
+    a: Tuple[float, ...], b: Tuple[float, ...]
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Multiplies two affine transforms in XFORM order (eM11, eM12, eM21, eM22, eDx, eDy),
+    returning the transform which applies a and then b
+    """
+    return (
+        a[0] * b[0] + a[1] * b[2],
+        a[0] * b[1] + a[1] * b[3],
+        a[2] * b[0] + a[3] * b[2],
+        a[2] * b[1] + a[3] * b[3],
+        a[4] * b[0] + a[5] * b[2] + b[4],
+        a[4] * b[1] + a[5] * b[3] + b[5],
+    )
+
+
+def _format_number(value: float) -> str:
+    """
+    Formats a coordinate for SVG output
+    """
+    res = "{:.4f}".format(value).rstrip("0").rstrip(".")
+    return "0" if res in ("-0", "") else res
+
+
+def _color(color) -> str:
+    """
+    Converts an RGB tuple to an SVG color
+    """
+    return "#{:02x}{:02x}{:02x}".format(*color)
+
+
+def _colorref(value: int) -> Tuple[int, int, int]:
+    """
+    Converts a COLORREF value to an RGB tuple
+    """
+    return value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF
+
+
+class EmfSvgTranslator:  # pylint: disable=too-many-instance-attributes
+    """
+    Translates EMF pictures to SVG, by playing back the GDI drawing records.
+
+    Only the vector drawing records commonly found in ESRI picture symbols
+    are supported (polygons, polylines, beziers, paths, rectangles, ellipses,
+    pens, solid brushes and text). An UnsupportedEmfException is raised for
+    pictures using any other drawing records, such as embedded bitmaps.
+
+    SVG coordinates are in pixels at 96 dpi, based on the physical size of the
+    EMF reference device, and the view box covers the drawn content.
+    """
+
+    def __init__(self, content: bytes):
+        self.content = memoryview(content)
+        self.dc = DeviceContext()
+        self.saved_dcs: List[DeviceContext] = []
+        self.objects = {}
+        self.device_scale = (1.0, 1.0)
+        self.transform = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+        self.position = (0, 0)
+        self.elements: List[str] = []
+        self.bounds = [math.inf, math.inf, -math.inf, -math.inf]
+
+        # path bracket state
+        self.in_path = False
+        self.path: List[str] = []
+        self.path_bounds: List[Tuple[float, float]] = []
+        self.figure_open = False
+
+    @staticmethod
+    def is_emf(content: bytes) -> bool:
+        """
+        Returns True if content is an EMF picture
+        """
+        return (
+            len(content) >= 88
+            and struct.unpack_from("<I", content, 0)[0] == EMR_HEADER
+            and bytes(content[40:44]) == b" EMF"
+        )
+
+    @staticmethod
+    def translate(content: bytes) -> str:
+        """
+        Translates EMF content to an SVG document.
+
+        :raises UnsupportedEmfException: if the content cannot be translated
+        """
+        return EmfSvgTranslator(content).to_svg()
+
+    def to_svg(self) -> str:
+        """
+        Plays back the EMF records and returns the SVG document
+        """
+        if not EmfSvgTranslator.is_emf(self.content):
+            raise UnsupportedEmfException("Not an EMF picture")
+
+        try:
+            self._play()
+        except struct.error as e:
+            raise UnsupportedEmfException("Corrupt EMF record: {}".format(e)) from e
+
+        if not self.elements:
+            raise UnsupportedEmfException("EMF picture has no vector content")
+
+        x_min, y_min, x_max, y_max = self.bounds
+        return (
+            '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" '
+            'viewBox="{} {} {} {}">\n{}\n</svg>\n'.format(
+                _format_number(x_min),
+                _format_number(y_min),
+                _format_number(x_max - x_min),
+                _format_number(y_max - y_min),
+                "\n".join(self.elements),
+            )
+        )
+
+    # pylint: disable=too-many-branches,too-many-statements
+    def _play(self):
+        """
+        Plays back all records
+        """
+        content = self.content
+        offset = 0
+        while offset + 8 <= len(content):
+            record_type, size = struct.unpack_from("<II", content, offset)
+            if size < 8 or offset + size > len(content):
+                raise UnsupportedEmfException("Corrupt EMF record size")
+
+            data = content[offset + 8 : offset + size]
+            offset += size
+
+            if record_type == EMR_EOF:
+                break
+            if record_type in IGNORED_RECORDS:
+                continue
+
+            if record_type == EMR_HEADER:
+                self._read_header(data)
+            elif record_type == EMR_SETMAPMODE:
+                self.dc.map_mode = struct.unpack_from("<I", data)[0]
+            elif record_type == EMR_SETWINDOWEXTEX:
+                self.dc.window_ext = POINTL.unpack_from(data)
+            elif record_type == EMR_SETWINDOWORGEX:
+                self.dc.window_org = POINTL.unpack_from(data)
+            elif record_type == EMR_SETVIEWPORTEXTEX:
+                self.dc.viewport_ext = POINTL.unpack_from(data)
+            elif record_type == EMR_SETVIEWPORTORGEX:
+                self.dc.viewport_org = POINTL.unpack_from(data)
+            elif record_type == EMR_SETWORLDTRANSFORM:
+                self.dc.world_transform = XFORM.unpack_from(data)
+            elif record_type == EMR_MODIFYWORLDTRANSFORM:
+                xform = XFORM.unpack_from(data)
+                mode = struct.unpack_from("<I", data, 24)[0]
+                if mode == MWT_IDENTITY:
+                    self.dc.world_transform = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+                elif mode == MWT_LEFTMULTIPLY:
+                    self.dc.world_transform = _multiply(xform, self.dc.world_transform)
+                elif mode == MWT_RIGHTMULTIPLY:
+                    self.dc.world_transform = _multiply(self.dc.world_transform, xform)
+                elif mode == MWT_SET:
+                    self.dc.world_transform = xform
+            elif record_type == EMR_SAVEDC:
+                self.saved_dcs.append(copy.copy(self.dc))
+            elif record_type == EMR_RESTOREDC:
+                index = struct.unpack_from("<i", data)[0]
+                if index < 0:
+                    for _ in range(min(-index, len(self.saved_dcs))):
+                        self.dc = self.saved_dcs.pop()
+                else:
+                    while len(self.saved_dcs) >= index > 0:
+                        self.dc = self.saved_dcs.pop()
+            elif record_type == EMR_SETPOLYFILLMODE:
+                self.dc.fill_mode = struct.unpack_from("<I", data)[0]
+            elif record_type == EMR_SETMITERLIMIT:
+                self.dc.miter_limit = struct.unpack_from("<I", data)[0]
+            elif record_type == EMR_SETTEXTCOLOR:
+                self.dc.text_color = _colorref(struct.unpack_from("<I", data)[0])
+            elif record_type == EMR_SETTEXTALIGN:
+                self.dc.text_align = struct.unpack_from("<I", data)[0]
+            elif record_type == EMR_CREATEPEN:
+                self._create_pen(data)
+            elif record_type == EMR_EXTCREATEPEN:
+                self._ext_create_pen(data)
+            elif record_type == EMR_CREATEBRUSHINDIRECT:
+                self._create_brush(data)
+            elif record_type == EMR_EXTCREATEFONTINDIRECTW:
+                self._create_font(data)
+            elif record_type == EMR_SELECTOBJECT:
+                self._select_object(struct.unpack_from("<I", data)[0])
+            elif record_type == EMR_DELETEOBJECT:
+                self.objects.pop(struct.unpack_from("<I", data)[0], None)
+            elif record_type == EMR_MOVETOEX:
+                self._move_to(POINTL.unpack_from(data))
+            elif record_type == EMR_LINETO:
+                self._poly_to([POINTL.unpack_from(data)], "L")
+            elif record_type in (EMR_POLYLINETO, EMR_POLYLINETO16):
+                self._poly_to(self._read_points(data, record_type), "L")
+            elif record_type in (EMR_POLYBEZIERTO, EMR_POLYBEZIERTO16):
+                self._poly_to(self._read_points(data, record_type), "C")
+            elif record_type == EMR_CLOSEFIGURE:
+                if self.in_path and self.figure_open:
+                    self.path.append("Z")
+                    self.figure_open = False
+            elif record_type in (EMR_POLYGON, EMR_POLYGON16):
+                self._draw_figures([self._read_points(data, record_type)], True)
+            elif record_type in (EMR_POLYLINE, EMR_POLYLINE16):
+                self._draw_figures([self._read_points(data, record_type)], False)
+            elif record_type in (EMR_POLYPOLYGON, EMR_POLYPOLYGON16):
+                self._draw_figures(self._read_poly_points(data, record_type), True)
+            elif record_type in (EMR_POLYPOLYLINE, EMR_POLYPOLYLINE16):
+                self._draw_figures(self._read_poly_points(data, record_type), False)
+            elif record_type in (EMR_POLYBEZIER, EMR_POLYBEZIER16):
+                points = self._read_points(data, record_type)
+                self._draw_bezier(points)
+            elif record_type == EMR_RECTANGLE:
+                left, top, right, bottom = RECTL.unpack_from(data)
+                self._draw_figures(
+                    [[(left, top), (right, top), (right, bottom), (left, bottom)]],
+                    True,
+                )
+            elif record_type == EMR_ELLIPSE:
+                self._draw_ellipse(RECTL.unpack_from(data))
+            elif record_type == EMR_BEGINPATH:
+                self.in_path = True
+                self.path = []
+                self.path_bounds = []
+                self.figure_open = False
+            elif record_type == EMR_ENDPATH:
+                self.in_path = False
+            elif record_type == EMR_ABORTPATH:
+                self.in_path = False
+                self.path = []
+                self.path_bounds = []
+            elif record_type in (EMR_FILLPATH, EMR_STROKEPATH, EMR_STROKEANDFILLPATH):
+                self._emit_path(
+                    " ".join(self.path),
+                    self.path_bounds,
+                    fill=record_type != EMR_STROKEPATH,
+                    stroke=record_type != EMR_FILLPATH,
+                )
+                self.path = []
+                self.path_bounds = []
+            elif record_type == EMR_EXTTEXTOUTW:
+                self._draw_text(data)
+            elif record_type == EMR_EXTSELECTCLIPRGN:
+                self._select_clip_region(data)
+            elif record_type == EMR_INTERSECTCLIPRECT:
+                raise UnsupportedEmfException("EMF clipping is not supported")
+            else:
+                raise UnsupportedEmfException(
+                    "Unsupported EMF record type {}".format(hex(record_type))
+                )
+
+    # pylint: enable=too-many-branches,too-many-statements
+
+    @staticmethod
+    def _select_clip_region(data):
+        """
+        Handles a clip region selection. Only resetting the clip region to
+        the default (no clipping) is supported.
+        """
+        region_size, mode = struct.unpack_from("<II", data, 0)
+        if region_size != 0 or mode != RGN_COPY:
+            raise UnsupportedEmfException("EMF clipping is not supported")
+
+    def _read_header(self, data):
+        """
+        Reads the EMF header, which describes the reference device
+        """
+        device_x, device_y, mm_x, mm_y = struct.unpack_from("<iiii", data, 64)
+        if device_x <= 0 or device_y <= 0 or mm_x <= 0 or mm_y <= 0:
+            raise UnsupportedEmfException("Invalid EMF reference device")
+        self.device_scale = (
+            mm_x / device_x * PIXELS_PER_MM,
+            mm_y / device_y * PIXELS_PER_MM,
+        )
+
+    def _update_transform(self):
+        """
+        Calculates the transform from logical coordinates to SVG coordinates
+        """
+        dc = self.dc
+        if dc.map_mode in (MM_ISOTROPIC, MM_ANISOTROPIC):
+            scale_x = dc.viewport_ext[0] / dc.window_ext[0] if dc.window_ext[0] else 1
+            scale_y = dc.viewport_ext[1] / dc.window_ext[1] if dc.window_ext[1] else 1
+            if dc.map_mode == MM_ISOTROPIC:
+                scale = min(abs(scale_x), abs(scale_y))
+                scale_x = math.copysign(scale, scale_x)
+                scale_y = math.copysign(scale, scale_y)
+        elif dc.map_mode in MAP_MODE_UNIT_SIZES:
+            unit_size = MAP_MODE_UNIT_SIZES[dc.map_mode] * PIXELS_PER_MM
+            scale_x = unit_size / self.device_scale[0]
+            scale_y = -unit_size / self.device_scale[1]
+        else:
+            scale_x = scale_y = 1
+
+        page_to_device = (
+            scale_x,
+            0.0,
+            0.0,
+            scale_y,
+            dc.viewport_org[0] - dc.window_org[0] * scale_x,
+            dc.viewport_org[1] - dc.window_org[1] * scale_y,
+        )
+        device_to_svg = (self.device_scale[0], 0.0, 0.0, self.device_scale[1], 0, 0)
+        self.transform = _multiply(
+            _multiply(dc.world_transform, page_to_device), device_to_svg
+        )
+
+    def _map(self, point) -> Tuple[float, float]:
+        """
+        Maps a logical point to SVG coordinates
+        """
+        t = self.transform
+        x, y = point
+        return x * t[0] + y * t[2] + t[4], x * t[1] + y * t[3] + t[5]
+
+    def _map_length(self, length: float) -> float:
+        """
+        Maps a logical length to SVG units
+        """
+        t = self.transform
+        return length * math.sqrt(abs(t[0] * t[3] - t[1] * t[2]))
+
+    @staticmethod
+    def _read_points(data, record_type) -> List[Tuple[int, int]]:
+        """
+        Reads the points from a poly record (after the bounds)
+        """
+        count = struct.unpack_from("<I", data, 16)[0]
+        if record_type >= EMR_POLYBEZIER16:
+            values = struct.unpack_from("<{}h".format(count * 2), data, 20)
+        else:
+            values = struct.unpack_from("<{}i".format(count * 2), data, 20)
+        return list(zip(values[::2], values[1::2]))
+
+    @staticmethod
+    def _read_poly_points(data, record_type) -> List[List[Tuple[int, int]]]:
+        """
+        Reads the figures from a polypoly record (after the bounds)
+        """
+        figure_count, point_count = struct.unpack_from("<II", data, 16)
+        counts = struct.unpack_from("<{}I".format(figure_count), data, 24)
+        offset = 24 + 4 * figure_count
+        if record_type >= EMR_POLYBEZIER16:
+            values = struct.unpack_from("<{}h".format(point_count * 2), data, offset)
+        else:
+            values = struct.unpack_from("<{}i".format(point_count * 2), data, offset)
+        points = list(zip(values[::2], values[1::2]))
+        figures = []
+        start = 0
+        for count in counts:
+            figures.append(points[start : start + count])
+            start += count
+        return figures
+
+    def _create_pen(self, data):
+        """
+        Handles EMR_CREATEPEN
+        """
+        index, style, width, _, color = struct.unpack_from("<IIiiI", data)
+        self.objects[index] = (
+            "pen",
+            Pen(_colorref(color), width, style | PS_GEOMETRIC if width > 1 else style),
+        )
+
+    def _ext_create_pen(self, data):
+        """
+        Handles EMR_EXTCREATEPEN
+        """
+        index = struct.unpack_from("<I", data)[0]
+        style, width, brush_style, color, _, entry_count = struct.unpack_from(
+            "<IIIIII", data, 20
+        )
+        if brush_style not in (BS_SOLID, BS_NULL):
+            raise UnsupportedEmfException("Unsupported pen brush style")
+        dashes = None
+        if (style & PS_STYLE_MASK) == PS_USERSTYLE and entry_count:
+            dashes = struct.unpack_from("<{}I".format(entry_count), data, 44)
+        if brush_style == BS_NULL:
+            style = (style & ~PS_STYLE_MASK) | PS_NULL
+        self.objects[index] = ("pen", Pen(_colorref(color), width, style, dashes))
+
+    def _create_brush(self, data):
+        """
+        Handles EMR_CREATEBRUSHINDIRECT
+        """
+        index, style, color = struct.unpack_from("<III", data)
+        if style == BS_SOLID:
+            self.objects[index] = ("brush", _colorref(color))
+        elif style == BS_NULL:
+            self.objects[index] = ("brush", None)
+        else:
+            raise UnsupportedEmfException("Unsupported brush style {}".format(style))
+
+    def _create_font(self, data):
+        """
+        Handles EMR_EXTCREATEFONTINDIRECTW
+        """
+        index, height, _, escapement, _, weight, italic = struct.unpack_from(
+            "<IiiiiiB", data
+        )
+        face_name = bytes(data[32:96]).decode("utf-16-le", errors="ignore")
+        face_name = face_name.split("\x00", 1)[0]
+        self.objects[index] = (
+            "font",
+            Font(height, weight, bool(italic), escapement, face_name),
+        )
+
+    def _select_object(self, index: int):
+        """
+        Handles EMR_SELECTOBJECT
+        """
+        if index & STOCK_OBJECT_FLAG:
+            stock = index & ~STOCK_OBJECT_FLAG
+            if stock in STOCK_BRUSHES:
+                self.dc.brush = STOCK_BRUSHES[stock]
+            elif stock in STOCK_PENS:
+                color = STOCK_PENS[stock]
+                self.dc.pen = Pen(
+                    color or (0, 0, 0), 0, PS_NULL if color is None else 0
+                )
+            # stock fonts and palettes are left unchanged
+            return
+
+        object_type, value = self.objects.get(index, (None, None))
+        if object_type == "pen":
+            self.dc.pen = value
+        elif object_type == "brush":
+            self.dc.brush = value
+        elif object_type == "font":
+            self.dc.font = value
+
+    def _path_data(
+        self, figures, closed: bool
+    ) -> Tuple[str, List[Tuple[float, float]]]:
+        """
+        Returns the SVG path data and SVG points for figures
+        """
+        self._update_transform()
+        parts = []
+        mapped_points = []
+        for figure in figures:
+            if not figure:
+                continue
+            mapped = [self._map(p) for p in figure]
+            mapped_points.extend(mapped)
+            parts.append(
+                "M "
+                + " L ".join(
+                    "{},{}".format(_format_number(x), _format_number(y))
+                    for x, y in mapped
+                )
+                + (" Z" if closed else "")
+            )
+        return " ".join(parts), mapped_points
+
+    def _draw_figures(self, figures, closed: bool):
+        """
+        Draws polygons or polylines (or adds them to the current path)
+        """
+        path_data, points = self._path_data(figures, closed)
+        if not path_data:
+            return
+        if self.in_path:
+            self.path.append(path_data)
+            self.path_bounds.extend(points)
+            self.figure_open = False
+            if figures and figures[-1]:
+                self.position = figures[-1][-1]
+            return
+
+        self._emit_path(path_data, points, fill=closed, stroke=True)
+
+    def _draw_bezier(self, points):
+        """
+        Draws a bezier curve (or adds it to the current path)
+        """
+        if not points:
+            return
+        self._move_to(points[0])
+        self._poly_to(points[1:], "C")
+
+    def _draw_ellipse(self, box):
+        """
+        Draws an ellipse, approximated by cubic beziers
+        """
+        left, top, right, bottom = box
+        cx = (left + right) / 2
+        cy = (top + bottom) / 2
+        rx = (right - left) / 2
+        ry = (bottom - top) / 2
+        kx = rx * KAPPA
+        ky = ry * KAPPA
+        points = [
+            (cx + rx, cy),
+            (cx + rx, cy + ky),
+            (cx + kx, cy + ry),
+            (cx, cy + ry),
+            (cx - kx, cy + ry),
+            (cx - rx, cy + ky),
+            (cx - rx, cy),
+            (cx - rx, cy - ky),
+            (cx - kx, cy - ry),
+            (cx, cy - ry),
+            (cx + kx, cy - ry),
+            (cx + rx, cy - ky),
+            (cx + rx, cy),
+        ]
+        self._update_transform()
+        mapped = [self._map(p) for p in points]
+        path_data = "M {} C {} Z".format(
+            ",".join(_format_number(v) for v in mapped[0]),
+            " ".join(
+                "{},{}".format(_format_number(x), _format_number(y))
+                for x, y in mapped[1:]
+            ),
+        )
+        if self.in_path:
+            self.path.append(path_data)
+            self.path_bounds.extend(mapped)
+            return
+        self._emit_path(path_data, mapped, fill=True, stroke=True)
+
+    def _move_to(self, point):
+        """
+        Handles EMR_MOVETOEX
+        """
+        self.position = point
+        if self.in_path:
+            self._update_transform()
+            x, y = self._map(point)
+            self.path.append("M {},{}".format(_format_number(x), _format_number(y)))
+            self.path_bounds.append((x, y))
+            self.figure_open = True
+
+    def _poly_to(self, points, command: str):
+        """
+        Draws lines or beziers from the current position
+        """
+        if not points:
+            return
+        self._update_transform()
+        mapped = [self._map(p) for p in points]
+        segment = "{} {}".format(
+            command,
+            " ".join(
+                "{},{}".format(_format_number(x), _format_number(y)) for x, y in mapped
+            ),
+        )
+        start = self._map(self.position)
+        self.position = points[-1]
+        if self.in_path:
+            if not self.figure_open:
+                self.path.append(
+                    "M {},{}".format(_format_number(start[0]), _format_number(start[1]))
+                )
+                self.path_bounds.append(start)
+                self.figure_open = True
+            self.path.append(segment)
+            self.path_bounds.extend(mapped)
+            return
+
+        self._emit_path(
+            "M {},{} {}".format(
+                _format_number(start[0]), _format_number(start[1]), segment
+            ),
+            [start] + mapped,
+            fill=False,
+            stroke=True,
+        )
+
+    def _stroke_style(self) -> Tuple[List[str], float]:
+        """
+        Returns the SVG style properties for the current pen, and the stroke width
+        """
+        pen = self.dc.pen
+        if pen is None or (pen.style & PS_STYLE_MASK) == PS_NULL:
+            return ["stroke:none"], 0
+
+        if pen.style & PS_GEOMETRIC and pen.width > 0:
+            width = self._map_length(pen.width)
+        else:
+            # cosmetic pens are always one device pixel wide
+            width = self.device_scale[0]
+
+        style = [
+            "stroke:{}".format(_color(pen.color)),
+            "stroke-width:{}".format(_format_number(width)),
+        ]
+
+        cap = pen.style & PS_ENDCAP_MASK
+        style.append(
+            "stroke-linecap:{}".format(
+                "square"
+                if cap == PS_ENDCAP_SQUARE
+                else "butt"
+                if cap == PS_ENDCAP_FLAT
+                else "round"
+            )
+        )
+        join = pen.style & PS_JOIN_MASK
+        if join == PS_JOIN_MITER:
+            style.append("stroke-linejoin:miter")
+            style.append(
+                "stroke-miterlimit:{}".format(_format_number(self.dc.miter_limit))
+            )
+        else:
+            style.append(
+                "stroke-linejoin:{}".format(
+                    "bevel" if join == PS_JOIN_BEVEL else "round"
+                )
+            )
+
+        pen_style = pen.style & PS_STYLE_MASK
+        dashes = None
+        if pen_style == PS_USERSTYLE and pen.dashes:
+            dashes = [self._map_length(d) for d in pen.dashes]
+        elif pen_style in DASH_PATTERNS:
+            dashes = [d * width for d in DASH_PATTERNS[pen_style]]
+        if dashes:
+            style.append(
+                "stroke-dasharray:{}".format(
+                    ",".join(_format_number(d) for d in dashes)
+                )
+            )
+
+        return style, width
+
+    def _emit_path(self, path_data: str, points, fill: bool, stroke: bool):
+        """
+        Adds a path element to the SVG, using the current pen and brush
+        """
+        if not path_data:
+            return
+
+        style = []
+        if fill and self.dc.brush is not None:
+            style.append("fill:{}".format(_color(self.dc.brush)))
+            style.append(
+                "fill-rule:{}".format(
+                    "evenodd" if self.dc.fill_mode == ALTERNATE else "nonzero"
+                )
+            )
+        else:
+            style.append("fill:none")
+
+        width = 0
+        if stroke:
+            stroke_style, width = self._stroke_style()
+            style.extend(stroke_style)
+        else:
+            style.append("stroke:none")
+
+        if style[0] == "fill:none" and "stroke:none" in style:
+            return
+
+        self._extend_bounds(points, width / 2)
+        self.elements.append(
+            '<path style="{}" d="{}" />'.format(";".join(style), path_data)
+        )
+
+    def _extend_bounds(self, points, margin: float = 0):
+        """
+        Extends the drawing bounds to include points
+        """
+        bounds = self.bounds
+        for x, y in points:
+            bounds[0] = min(bounds[0], x - margin)
+            bounds[1] = min(bounds[1], y - margin)
+            bounds[2] = max(bounds[2], x + margin)
+            bounds[3] = max(bounds[3], y + margin)
+
+    def _draw_text(self, data):
+        """
+        Handles EMR_EXTTEXTOUTW
+        """
+        reference = POINTL.unpack_from(data, 28)
+        char_count, string_offset = struct.unpack_from("<II", data, 36)
+        if not char_count:
+            return
+        # offsets are relative to the start of the record, including the type and size
+        start = string_offset - 8
+        text = bytes(data[start : start + char_count * 2]).decode(
+            "utf-16-le", errors="replace"
+        )
+
+        self._update_transform()
+        x, y = self._map(reference)
+        font = self.dc.font
+        size = self._map_length(abs(font.height)) if font and font.height else 12
+
+        attributes = [
+            'x="{}"'.format(_format_number(x)),
+            'y="{}"'.format(_format_number(y)),
+            'font-size="{}"'.format(_format_number(size)),
+            'fill="{}"'.format(_color(self.dc.text_color)),
+        ]
+        if font and font.face_name:
+            attributes.append("font-family={}".format(quoteattr(font.face_name)))
+        if font and font.weight >= 700:
+            attributes.append('font-weight="bold"')
+        if font and font.italic:
+            attributes.append('font-style="italic"')
+
+        align = self.dc.text_align
+        if align & TA_CENTER == TA_CENTER:
+            attributes.append('text-anchor="middle"')
+        elif align & TA_RIGHT:
+            attributes.append('text-anchor="end"')
+        if align & TA_BASELINE == TA_BASELINE:
+            pass
+        elif align & TA_BOTTOM:
+            attributes.append('dominant-baseline="text-after-edge"')
+        else:
+            attributes.append('dominant-baseline="text-before-edge"')
+
+        if font and font.escapement:
+            # escapement is in tenths of degrees, counter-clockwise
+            attributes.append(
+                'transform="rotate({} {} {})"'.format(
+                    _format_number(-font.escapement / 10),
+                    _format_number(x),
+                    _format_number(y),
+                )
+            )
+
+        self._extend_bounds([(x, y)], size)
+        self.elements.append(
+            "<text {}>{}</text>".format(" ".join(attributes), escape(text))
+        )
@@ -11,6 +11,8 @@ Geometry conversion
 #  *                                                                         *
 #  ***************************************************************************/
 import math
+import sys
+from struct import Struct
 from typing import List
 
 from qgis.PyQt.QtCore import QRectF, QPointF, QLineF
@@ -29,7 +31,7 @@ from qgis.core import (
 )
 
 from ..parser.exceptions import NotImplementedException
-from ..parser.objects.geometry import Segment
+from ..parser.objects.geometry import MultiPartGeometry, Segment
 from ..parser.objects.point import Point
 from ..parser.objects.polygon import Polygon
 from ..parser.objects.polyline import Polyline
@@ -37,6 +39,17 @@ from ..parser.objects.multipoint import Multipoint
 from ..parser.objects.geometry_bag import GeometryBag
 
 
+# WKB headers, as (byte order, type, count) and, for single ring
+# polygons, (byte order, type, ring count, vertex count)
+WKB_HEADER = Struct("<BII")
+WKB_POLYGON_HEADER = Struct("<BIII")
+
+WKB_LINESTRING = 2
+WKB_POLYGON = 3
+WKB_MULTIPOLYGON = 6
+WKB_MULTICURVE = 11
+
+
 class GeometryConverter:
     """
     Geometry converter
@@ -258,18 +271,67 @@ class GeometryConverter:
 
         return compound_curve
 
+    @staticmethod
+    def linear_geometry_to_wkb(geometry: MultiPartGeometry, is_polygon: bool) -> bytes:
+        """
+        Converts a polyline or polygon consisting of linear segments only to WKB,
+        directly from the geometry's coordinate array.
+
+        Polylines are converted to a LineString (for single part geometries) or
+        MultiCurve of LineStrings, and polygons to a Polygon or MultiPolygon,
+        with each part forming the exterior ring of a separate polygon.
+        """
+        coordinates = geometry.coordinates
+        if sys.byteorder == "big":
+            coordinates = coordinates[:]
+            coordinates.byteswap()
+        data = coordinates.tobytes()
+
+        offsets = geometry.part_offsets
+        parts = []
+        for i in range(len(offsets) - 1):
+            vertex_count = offsets[i + 1] - offsets[i]
+            if is_polygon:
+                header = WKB_POLYGON_HEADER.pack(1, WKB_POLYGON, 1, vertex_count)
+            else:
+                header = WKB_HEADER.pack(1, WKB_LINESTRING, vertex_count)
+            parts.append(header + data[offsets[i] * 16 : offsets[i + 1] * 16])
+
+        if len(parts) == 1:
+            return parts[0]
+
+        return WKB_HEADER.pack(
+            1, WKB_MULTIPOLYGON if is_polygon else WKB_MULTICURVE, len(parts)
+        ) + b"".join(parts)
+
+    @staticmethod
+    def wkb_to_geometry(wkb: bytes) -> QgsGeometry:
+        """
+        Creates a QGIS geometry from WKB
+        """
+        res = QgsGeometry()
+        res.fromWkb(wkb)
+        return res
+
     @staticmethod
     def polygon_to_geometry(polygon: Polygon) -> QgsGeometry:
         """
         Converts a polygon to a QGIS geometry
         """
-        if not polygon.parts:
+        if polygon.part_count() and not polygon.segments:
+            # fast path for linear polygons
+            return GeometryConverter.wkb_to_geometry(
+                GeometryConverter.linear_geometry_to_wkb(polygon, True)
+            )
+
+        polygon_parts = polygon.parts
+        if not polygon_parts:
             return QgsGeometry()
 
-        if len(polygon.parts) > 1:
+        if len(polygon_parts) > 1:
             parts = []
             part_start_index = 0
-            for part in polygon.parts:
+            for part in polygon_parts:
                 parts.append(
                     GeometryConverter.convert_polygon(
                         part, polygon.segments, part_start_index
@@ -280,7 +342,7 @@ class GeometryConverter:
             res = QgsGeometry.collectGeometry(parts)
             return res
 
-        return GeometryConverter.convert_polygon(polygon.parts[0], polygon.segments)
+        return GeometryConverter.convert_polygon(polygon_parts[0], polygon.segments)
 
     @staticmethod
     def convert_polygon(polygon, segments, part_start_index: int = 0) -> QgsGeometry:
@@ -303,13 +365,20 @@ class GeometryConverter:
         """
         Converts a polyline to a QGIS geometry
         """
-        if not polyline.parts:
+        if polyline.part_count() and not polyline.segments:
+            # fast path for linear polylines
+            return GeometryConverter.wkb_to_geometry(
+                GeometryConverter.linear_geometry_to_wkb(polyline, False)
+            )
+
+        parts = polyline.parts
+        if not parts:
             return QgsGeometry(QgsLineString())
 
-        if len(polyline.parts) > 1:
+        if len(parts) > 1:
             multi_curve = QgsMultiCurve()
             part_start_index = 0
-            for part in polyline.parts:
+            for part in parts:
                 multi_curve.addGeometry(
                     GeometryConverter.convert_to_curve(
                         part, polyline.segments, False, part_start_index
@@ -320,7 +389,7 @@ class GeometryConverter:
             return QgsGeometry(multi_curve)
 
         exterior = GeometryConverter.convert_to_curve(
-            polyline.parts[0], polyline.segments, False
+            parts[0], polyline.segments, False
         )
         return QgsGeometry(exterior)
 
@@ -1542,7 +1542,7 @@ class LayoutConverter:
                 )
                 return {}
 
-            points = element.shape.parts[0]
+            points = element.shape.part(0)
             shape.setNodes(
                 QPolygonF([QPointF(p[0], page_height - p[1]) for p in points])
             )
@@ -1583,7 +1583,7 @@ class LayoutConverter:
                 SymbolConverter.Symbol_to_QgsSymbol(element.symbol, context)
             )
 
-            points = element.shape.parts[0]
+            points = element.shape.part(0)
             shape.setNodes(
                 QPolygonF([QPointF(p[0], page_height - p[1]) for p in points])
             )
@@ -23,8 +23,8 @@ Picture handling utilities
 """
 
 import base64
-import struct
-from typing import List, Tuple
+from array import array
+from typing import Callable, List, Optional, Tuple
 
 from qgis.PyQt.QtCore import QBuffer, Qt
 from qgis.PyQt.QtGui import (
@@ -140,11 +140,6 @@ class PictureUtils:
             raise UnreadablePictureException("Could not read embedded picture data")
 
         image = image.convertToFormat(QImage.Format.Format_ARGB32)
-        ucharptr = image.bits()
-        try:
-            ucharptr.setsize(image.sizeInBytes() * image.height())
-        except AttributeError:
-            ucharptr.setsize(image.byteCount() * image.height())
 
         # assume top left pixel is transparent?
         if fix_alpha:
@@ -152,16 +147,10 @@ class PictureUtils:
             trans_rgba = qRgba(c.red(), c.green(), c.blue(), c.alpha())
             actual_trans_rgba = qRgba(c.red(), c.green(), c.blue(), 0)
 
-            for y in range(image.height()):
-                start = y * image.width() * 4
-                for x in range(image.width()):
-                    x_start = x * 4 + start
-                    rgba = struct.unpack("I", ucharptr[x_start : x_start + 4])[0]
-
-                    if rgba == trans_rgba:
-                        ucharptr[x_start : x_start + 4] = struct.pack(
-                            "I", actual_trans_rgba
-                        )
+            PictureUtils.map_pixels(
+                image,
+                lambda rgba: actual_trans_rgba if rgba == trans_rgba else None,
+            )
 
         if not color.isValid():
             return image
@@ -202,7 +191,40 @@ class PictureUtils:
         return image
 
     @staticmethod
-    def set_colors(data: bin, fg: QColor, bg: QColor, trans: QColor) -> bin:  # pylint: disable=too-many-locals
+    def map_pixels(image: QImage, map_function: Callable[[int], Optional[int]]):
+        """
+        Replaces pixel values in an ARGB32 image, in place.
+
+        The map_function is called only once for each distinct pixel value
+        in the image, and must return the replacement value (or None if
+        the pixel should be left unchanged).
+        """
+        size = image.width() * image.height() * 4
+        if not size:
+            return
+
+        ucharptr = image.bits()
+        try:
+            ucharptr.setsize(image.sizeInBytes() * image.height())
+        except AttributeError:
+            ucharptr.setsize(image.byteCount() * image.height())
+
+        pixels = array("I", ucharptr[:size])
+
+        replacements = {}
+        for rgba in set(pixels):
+            replacement = map_function(rgba)
+            if replacement is not None and replacement != rgba:
+                replacements[rgba] = replacement
+
+        if not replacements:
+            return
+
+        replace = replacements.get
+        ucharptr[:size] = array("I", [replace(p, p) for p in pixels]).tobytes()
+
+    @staticmethod
+    def set_colors(data: bin, fg: QColor, bg: QColor, trans: QColor) -> bin:
         """
         Burns foreground and background colors into a raster image, and returns
         the results as a PNG binary
@@ -213,11 +235,6 @@ class PictureUtils:
             raise UnreadablePictureException("Could not read embedded picture data")
 
         image = image.convertToFormat(QImage.Format.Format_ARGB32)
-        ucharptr = image.bits()
-        try:
-            ucharptr.setsize(image.sizeInBytes() * image.height())
-        except AttributeError:
-            ucharptr.setsize(image.byteCount() * image.height())
 
         fg_rgba = (
             qRgba(fg.red(), fg.green(), fg.blue(), fg.alpha())
@@ -229,44 +246,45 @@ class PictureUtils:
             if bg and bg.isValid()
             else None
         )
+        trans_rgb = (trans.red(), trans.green(), trans.blue()) if trans else None
 
         COLOR_TOLERANCE = 40
 
         fg_comp = 0
         bg_comp = 255
 
-        for y in range(image.height()):
-            start = y * image.width() * 4
-            for x in range(image.width()):
-                x_start = x * 4 + start
-                rgba = struct.unpack("I", ucharptr[x_start : x_start + 4])[0]
-                red = qRed(rgba)
-                blue = qBlue(rgba)
-                green = qGreen(rgba)
-
-                if (
-                    trans
-                    and abs(red - trans.red()) < COLOR_TOLERANCE
-                    and abs(green - trans.green()) < COLOR_TOLERANCE
-                    and abs(blue - trans.blue()) < COLOR_TOLERANCE
-                ):
-                    ucharptr[x_start : x_start + 4] = struct.pack(
-                        "I", qRgba(0, 0, 0, 0)
-                    )
-                elif (
-                    fg_rgba is not None
-                    and abs(red - fg_comp) < COLOR_TOLERANCE
-                    and abs(green - fg_comp) < COLOR_TOLERANCE
-                    and abs(blue - fg_comp) < COLOR_TOLERANCE
-                ):
-                    ucharptr[x_start : x_start + 4] = struct.pack("I", fg_rgba)
-                elif (
-                    bg_rgba is not None
-                    and abs(red - bg_comp) < COLOR_TOLERANCE
-                    and abs(green - bg_comp) < COLOR_TOLERANCE
-                    and abs(blue - bg_comp) < COLOR_TOLERANCE
-                ):
-                    ucharptr[x_start : x_start + 4] = struct.pack("I", bg_rgba)
+        def replace_color(rgba: int) -> Optional[int]:
+            """
+            Returns the replacement for a pixel value
+            """
+            red = qRed(rgba)
+            blue = qBlue(rgba)
+            green = qGreen(rgba)
+
+            if (
+                trans_rgb
+                and abs(red - trans_rgb[0]) < COLOR_TOLERANCE
+                and abs(green - trans_rgb[1]) < COLOR_TOLERANCE
+                and abs(blue - trans_rgb[2]) < COLOR_TOLERANCE
+            ):
+                return qRgba(0, 0, 0, 0)
+            if (
+                fg_rgba is not None
+                and abs(red - fg_comp) < COLOR_TOLERANCE
+                and abs(green - fg_comp) < COLOR_TOLERANCE
+                and abs(blue - fg_comp) < COLOR_TOLERANCE
+            ):
+                return fg_rgba
+            if (
+                bg_rgba is not None
+                and abs(red - bg_comp) < COLOR_TOLERANCE
+                and abs(green - bg_comp) < COLOR_TOLERANCE
+                and abs(blue - bg_comp) < COLOR_TOLERANCE
+            ):
+                return bg_rgba
+            return None
+
+        PictureUtils.map_pixels(image, replace_color)
 
         # convert to PNG
         png_data = QBuffer()
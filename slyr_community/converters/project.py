@@ -11,8 +11,11 @@ Project file converter
 #  *                                                                         *
 #  ***************************************************************************/
 
+import math
 import os
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
+
+from qgis.PyQt.QtXml import QDomDocument
 
 from qgis.core import (
     Qgis,
@@ -30,6 +33,9 @@ from qgis.core import (
     QgsVectorLayer,
     QgsLayerTreeGroup,
     QgsRelationContext,
+    QgsLayerDefinition,
+    QgsReadWriteContext,
+    QgsPathResolver,
 )
 
 from qgis.utils import iface
@@ -52,9 +58,113 @@ from .vector_layer import VectorLayerConverter
 from .symbols import SymbolConverter
 from .crs import CrsConverter
 from .layout import LayoutConverter
+from .worker_pool import (
+    worker_count,
+    create_executor,
+    context_to_worker_state,
+    context_from_worker_state,
+    push_worker_warnings,
+)
 from ..parser.exceptions import RequiresLicenseException
 
 
+class LayerDefinition:
+    """
+    A root layer or group from a map document, converted to a QGIS
+    layer definition (QLR) in a worker process
+    """
+
+    def __init__(
+        self,
+        xml: str,
+        layer_positions: List[Optional[int]],
+        table_layer_ids: List[Optional[str]],
+    ):
+        # layer definition XML
+        self.xml = xml
+        # for each source layer from the root group (in the order returned by
+        # ProjectConverter.source_layers()), the position of the converted layer
+        # in the definition's layer tree (or None if the layer was not converted)
+        self.layer_positions = layer_positions
+        # IDs of the layers converted from the frame's standalone tables in
+        # the worker, which must be replaced by the IDs of the standalone
+        # table layers in the destination project
+        self.table_layer_ids = table_layer_ids
+
+
+def _root_groups_to_layer_definitions(
+    input_file: str,
+    frame_index: int,
+    root_group_indices: List[int],
+    context_state: dict,
+) -> Tuple[Dict[int, LayerDefinition], List[Tuple[str, str]]]:
+    """
+    Converts root layers/groups from a data frame in a map document to
+    QGIS layer definitions. Runs in a worker process.
+
+    Returns a dictionary of root group index to layer definition, and the
+    list of warnings raised during the conversion.
+    """
+    context, warnings = context_from_worker_state(context_state)
+    project = QgsProject()
+    context.project = project
+
+    with open(input_file, "rb") as f:
+        # layers which aren't required are never parsed in lazy documents
+        document = MapDocument(f, lazy=True)
+        map_object = document.frames[frame_index]
+
+        # the frame's standalone tables are converted too, so that the
+        # root groups are converted exactly as they would be in the
+        # destination project
+        layer_tree_nodes = {}
+        layer_to_layer_map = ProjectConverter.add_layers_to_project(
+            project,
+            input_file,
+            map_object,
+            context,
+            root_group_indices=root_group_indices,
+            layer_tree_nodes=layer_tree_nodes,
+        )
+        table_layer_ids = [
+            layer_to_layer_map[t].id() if t in layer_to_layer_map else None
+            for t in map_object.standalone_tables
+        ]
+
+        definitions = {}
+        for index in root_group_indices:
+            nodes = layer_tree_nodes.get(index, [])
+
+            tree_layer_ids = [
+                l.id() if l is not None else None
+                for l in ProjectConverter.layer_tree_layers(nodes)
+            ]
+            layer_positions = []
+            for source_layer in ProjectConverter.source_layers(
+                map_object.root_groups[index]
+            ):
+                converted = layer_to_layer_map.get(source_layer)
+                if converted is not None and converted.id() in tree_layer_ids:
+                    layer_positions.append(tree_layer_ids.index(converted.id()))
+                else:
+                    layer_positions.append(None)
+
+            rw_context = QgsReadWriteContext()
+            rw_context.setPathResolver(QgsPathResolver())
+            doc = QDomDocument("qgis-layer-definition")
+            res, error = QgsLayerDefinition.exportLayerDefinition(
+                doc, nodes, rw_context
+            )
+            if res:
+                definitions[index] = LayerDefinition(
+                    doc.toString(), layer_positions, table_layer_ids
+                )
+            else:
+                warnings.append((error, Context.CRITICAL))
+
+    return definitions, warnings
+
+
 class ProjectConverter:
     """
     Project file converter
@@ -66,9 +176,15 @@ class ProjectConverter:
         document: MapDocument,
         context: Context,
         fallback_crs=None,
+        max_workers: Optional[int] = None,
     ) -> QgsProject:
         """
         Converts a project document to a QGIS project
+
+        If max_workers is greater than 1, the layers from the document are
+        converted in parallel using a pool of worker processes. See
+        convert_layer_definitions() for details. Within the QGIS desktop
+        application the layers are always converted sequentially.
         """
 
         if Qgis.QGIS_VERSION_INT >= 32601:
@@ -78,11 +194,80 @@ class ProjectConverter:
             p = QgsProject()
 
         context.project = p
+
+        layer_definitions = None
+        max_workers = worker_count(max_workers)
+        if max_workers > 1:
+            layer_definitions = ProjectConverter.convert_layer_definitions(
+                input_file, document, context, max_workers
+            )
+
         ProjectConverter.convert_target_project(
-            p, input_file, document, context, fallback_crs
+            p,
+            input_file,
+            document,
+            context,
+            fallback_crs,
+            layer_definitions=layer_definitions,
         )
         return p
 
+    @staticmethod
+    def convert_layer_definitions(
+        input_file: str,
+        document: MapDocument,
+        context: Context,
+        max_workers: Optional[int] = None,
+    ) -> Dict[int, Dict[int, LayerDefinition]]:
+        """
+        Converts the root layers and groups from all data frames in a document
+        to QGIS layer definitions, using a pool of worker processes.
+
+        The root groups from each data frame are split into (at most)
+        max_workers batches of consecutive groups. Each task reparses the
+        document from input_file once for its batch. Since the document
+        is parsed lazily, each worker only reads the layers it converts.
+
+        Returns a dictionary of data frame index to a dictionary of
+        root group index to layer definition.
+        """
+        context_state = context_to_worker_state(context)
+        batch_count = max_workers or os.cpu_count() or 1
+
+        with create_executor(max_workers) as executor:
+            futures = []
+            for frame_index, frame in enumerate(document.frames):
+                root_group_indices = [
+                    index
+                    for index, root_group in enumerate(frame.root_groups)
+                    if not isinstance(root_group, CustomObject)
+                ]
+                batch_size = max(1, math.ceil(len(root_group_indices) / batch_count))
+
+                for start in range(0, len(root_group_indices), batch_size):
+                    futures.append(
+                        (
+                            frame_index,
+                            executor.submit(
+                                _root_groups_to_layer_definitions,
+                                input_file,
+                                frame_index,
+                                root_group_indices[start : start + batch_size],
+                                context_state,
+                            ),
+                        )
+                    )
+
+            # results are collected in submission order, so that the
+            # output does not depend on worker scheduling
+            res = {}
+            for frame_index, future in futures:
+                definitions, warnings = future.result()
+                push_worker_warnings(context, warnings)
+                res.setdefault(frame_index, {}).update(definitions)
+
+        return res
+
     @staticmethod
     def set_project_home_paths(project: QgsProject, input_file: str):
         """
@@ -104,10 +289,18 @@ class ProjectConverter:
         context: Context,
         fallback_crs=None,
         canvas=None,
+        layer_definitions: Optional[Dict[int, Dict[int, LayerDefinition]]] = None,
     ):
         """
         Converts a map document into a target QGIS project
+
+        If layer_definitions are specified (see convert_layer_definitions()),
+        then the prepared layer definitions will be used instead of converting
+        the corresponding layers.
         """
+        if layer_definitions is None:
+            layer_definitions = {}
+
         ProjectConverter.set_project_home_paths(project, input_file)
 
         if document.frames:
@@ -118,8 +311,9 @@ class ProjectConverter:
                 context,
                 fallback_crs=fallback_crs,
                 multiframes=len(document.frames) > 1,
+                layer_definitions=layer_definitions.get(0),
             )
-            for frame in document.frames[1:]:
+            for frame_index, frame in enumerate(document.frames[1:], start=1):
                 frame_layer_to_layer_map = ProjectConverter.update_project(
                     project,
                     input_file,
@@ -127,6 +321,7 @@ class ProjectConverter:
                     context,
                     multiframes=True,
                     fallback_crs=fallback_crs,
+                    layer_definitions=layer_definitions.get(frame_index),
                 )
                 layer_to_layer_map = {**layer_to_layer_map, **frame_layer_to_layer_map}
         else:
@@ -232,6 +427,7 @@ class ProjectConverter:
         fallback_crs=None,
         multiframes=False,
         canvas=None,
+        layer_definitions: Optional[Dict[int, LayerDefinition]] = None,
     ) -> Dict:
         """
         Adds layers from a map document to an existing project
@@ -244,6 +440,7 @@ class ProjectConverter:
             context=context,
             fallback_crs=fallback_crs,
             parent_group_name=map_object.name if multiframes else None,
+            layer_definitions=layer_definitions,
         )
         # ProjectConverter.convert_project_properties(map, project, context, canvas=canvas)
 
@@ -294,9 +491,19 @@ class ProjectConverter:
         context: Context,
         fallback_crs=None,
         parent_group_name: Optional[str] = None,
+        layer_definitions: Optional[Dict[int, LayerDefinition]] = None,
+        root_group_indices: Optional[List[int]] = None,
+        layer_tree_nodes: Optional[Dict[int, List]] = None,
     ) -> Dict:
         """
         Adds layers from a map to an existing QGIS project
+
+        :param layer_definitions: optional dictionary of root group index to
+        layer definition, for root groups which have already been converted
+        :param root_group_indices: if set, only the root groups with matching indices
+        will be added (standalone tables are always added)
+        :param layer_tree_nodes: if set, will be populated with the layer tree
+        nodes created for each root group index
         """
         theme = QgsMapThemeCollection.MapThemeRecord()
         if not fallback_crs:
@@ -411,6 +618,55 @@ class ProjectConverter:
                         group_node, group.transparency
                     )
 
+        def add_layer_definition(layer, definition, parent):
+            nonlocal fallback_crs
+            xml = definition.xml
+            # layers from the definition may reference the standalone tables,
+            # which have different IDs in the worker process
+            for table_layer_id, table in zip(
+                definition.table_layer_ids, map_object.standalone_tables
+            ):
+                if table_layer_id and table in layer_to_layer_map:
+                    xml = xml.replace(table_layer_id, layer_to_layer_map[table].id())
+
+            doc = QDomDocument("qgis-layer-definition")
+            doc.setContent(xml)
+            rw_context = QgsReadWriteContext()
+            rw_context.setPathResolver(QgsPathResolver())
+
+            existing_count = len(parent.children())
+            res, error = QgsLayerDefinition.loadLayerDefinition(
+                doc, project, parent, rw_context
+            )
+            if not res:
+                context.push_warning(
+                    "{}: {}".format(layer.name, error), level=Context.CRITICAL
+                )
+                return
+
+            # loading the definition assigns new layer IDs, but retains
+            # the layer tree structure
+            layers = ProjectConverter.layer_tree_layers(
+                parent.children()[existing_count:]
+            )
+            for source_layer, position in zip(
+                ProjectConverter.source_layers(layer), definition.layer_positions
+            ):
+                if (
+                    position is not None
+                    and position < len(layers)
+                    and layers[position] is not None
+                ):
+                    layer_to_layer_map[source_layer] = layers[position]
+
+            for l in layers:
+                if l is None:
+                    continue
+                if not fallback_crs.isValid() and l.crs().isValid():
+                    fallback_crs = l.crs()
+                theme_record = QgsMapThemeCollection.MapThemeLayerRecord(l)
+                theme.addLayerRecord(theme_record)
+
         # ouch, Arc allows multiple data frames to share a single name!!
         theme_name = map_object.name
         try_index = 1
@@ -430,7 +686,11 @@ class ProjectConverter:
 
         root_layers = map_object.root_groups
 
-        for c in root_layers:
+        for index, c in enumerate(root_layers):
+            if root_group_indices is not None and index not in root_group_indices:
+                continue
+
+            existing_count = len(root.children())
             if isinstance(c, CustomObject):
                 context.push_warning(
                     "An unknown custom object was removed from the project ({})".format(
@@ -438,16 +698,47 @@ class ProjectConverter:
                     ),
                     level=Context.WARNING,
                 )
+            elif layer_definitions and index in layer_definitions:
+                add_layer_definition(c, layer_definitions[index], root)
             elif LayerConverter.is_layer(c):
                 add_layer(c, root)
             else:
                 add_group(c, root)
 
+            if layer_tree_nodes is not None:
+                layer_tree_nodes[index] = root.children()[existing_count:]
+
         project.mapThemeCollection().insert(theme_name, theme)
         layer_to_layer_map[map_object] = theme_name
 
         return layer_to_layer_map
 
+    @staticmethod
+    def source_layers(group) -> List:
+        """
+        Returns a flattened list of all source layers from a layer or group
+        """
+        if LayerConverter.is_layer(group):
+            return [group]
+
+        res = []
+        for c in group.children:
+            res.extend(ProjectConverter.source_layers(c))
+        return res
+
+    @staticmethod
+    def layer_tree_layers(nodes) -> List[Optional[QgsMapLayer]]:
+        """
+        Returns a flattened list of the layers from a list of layer tree nodes
+        """
+        layers = []
+        for node in nodes:
+            if QgsLayerTree.isLayer(node):
+                layers.append(node.layer())
+            else:
+                layers.extend(n.layer() for n in node.findLayers())
+        return layers
+
     @staticmethod
     def convert_project_properties(
         map_object: Map,
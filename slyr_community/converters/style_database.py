@@ -0,0 +1,359 @@
+"""
+Style database symbol converter
+"""
+
+# /***************************************************************************
+#  *                                                                         *
+#  *   This program is free software; you can redistribute it and/or modify  *
+#  *   it under the terms of the GNU General Public License as published by  *
+#  *   the Free Software Foundation; either version 2 of the License, or     *
+#  *   (at your option) any later version.                                   *
+#  *                                                                         *
+#  ***************************************************************************/
+
+import os
+from collections import deque
+from io import BytesIO
+from typing import Callable, Optional, Iterable, Iterator, List, Tuple
+
+from qgis.PyQt.QtXml import QDomDocument
+from qgis.core import (
+    QgsColorRamp,
+    QgsPalLayerSettings,
+    QgsReadWriteContext,
+    QgsSymbol,
+    QgsSymbolLayerUtils,
+    QgsTextFormat,
+)
+
+from ..bintools.extractor import Extractor
+from ..parser.exceptions import (
+    UnreadableSymbolException,
+    UnsupportedVersionException,
+    NotImplementedException,
+    UnknownClsidException,
+    UnreadablePictureException,
+)
+from ..parser.stream import Stream
+from .context import Context
+from .geometry import GeometryConverter
+from .symbols import SymbolConverter
+from .worker_pool import (
+    create_executor,
+    context_to_worker_state,
+    context_from_worker_state,
+)
+
+try:
+    from qgis.core import QgsLegendPatchShape  # pylint: disable=ungrouped-imports
+except ImportError:
+    QgsLegendPatchShape = None
+
+# signature from the header of EMF pictures
+EMF_SIGNATURE = b" EMF"
+
+# number of symbols to read before pre-converting their EMF pictures
+EMF_PRECONVERSION_CHUNK_SIZE = 500
+
+
+def _convert_style_symbol(
+    symbol_type: str,
+    name: str,
+    unique_name: str,
+    blob: bytes,
+    context_state: dict,
+) -> Tuple[Optional[Tuple[str, str]], Optional[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Converts a raw symbol from a style database. Runs in a worker process.
+
+    Returns the converted entity as XML (see StyleDatabaseConverter.entity_to_xml()),
+    the conversion error (if any) and the list of warnings raised during the conversion.
+    """
+    context, warnings = context_from_worker_state(context_state)
+    context.symbol_name = unique_name
+
+    entity, error = StyleDatabaseConverter.convert_symbol(
+        symbol_type, name, blob, context
+    )
+    entity_xml = (
+        StyleDatabaseConverter.entity_to_xml(entity) if entity is not None else None
+    )
+    return entity_xml, error, warnings
+
+
+class StyleDatabaseConverter:
+    """
+    Converts symbols from style databases
+    """
+
+    SYMBOL = "symbol"
+    COLOR_RAMP = "colorramp"
+    TEXT_FORMAT = "textformat"
+    LABEL_SETTINGS = "labelsettings"
+    LEGEND_PATCH_SHAPE = "legendpatchshape"
+
+    @staticmethod
+    def convert_symbol(  # pylint: disable=too-many-return-statements
+        symbol_type: str, name: str, blob: bytes, context: Context
+    ) -> Tuple[object, Optional[Tuple[str, str]]]:
+        """
+        Reads and converts a raw symbol from a style database.
+
+        Returns the converted QGIS entity and None, or None and a tuple of the
+        (error message, report message) if the symbol could not be converted.
+        """
+        stream = Stream(BytesIO(blob))
+        try:
+            symbol = stream.read_object()
+        except UnreadableSymbolException as e:
+            return None, (
+                "Error reading symbol {}: {}".format(name, e),
+                "Error reading symbol: {}".format(e),
+            )
+        except NotImplementedException as e:
+            return None, (
+                "Parsing {} is not supported: {}".format(name, e),
+                "Parsing not supported: {}".format(e),
+            )
+        except UnsupportedVersionException as e:
+            return None, (
+                "Cannot read {} version: {}".format(name, e),
+                "Version not supported: {}".format(e),
+            )
+        except UnknownClsidException as e:
+            return None, (str(e), "Unknown object: {}".format(e))
+        except UnreadablePictureException as e:
+            return None, (str(e), "Unreadable picture: {}".format(e))
+
+        if symbol_type == Extractor.LINE_PATCHES:
+            geom = GeometryConverter.convert_geometry(symbol.polyline)
+            return (
+                QgsLegendPatchShape(
+                    QgsSymbol.SymbolType.Line, geom, symbol.preserve_aspect
+                ),
+                None,
+            )
+        if symbol_type == Extractor.AREA_PATCHES:
+            geom = GeometryConverter.convert_geometry(symbol.polygon)
+            return (
+                QgsLegendPatchShape(
+                    QgsSymbol.SymbolType.Fill, geom, symbol.preserve_aspect
+                ),
+                None,
+            )
+
+        try:
+            return SymbolConverter.Symbol_to_QgsSymbol(symbol, context), None
+        except NotImplementedException as e:
+            return None, (str(e), str(e))
+        except UnreadablePictureException as e:
+            return None, (str(e), "Unreadable picture: {}".format(e))
+
+    @staticmethod
+    def preconvert_emf_pictures(
+        symbol_type: str, blobs: Iterable[bytes], context: Context
+    ) -> int:
+        """
+        Converts the EMF pictures used by raw symbols from a style database in
+        batches, ahead of the symbol conversion.
+
+        See SymbolConverter.preconvert_emf_pictures()
+        """
+        if symbol_type not in (
+            Extractor.FILL_SYMBOLS,
+            Extractor.LINE_SYMBOLS,
+            Extractor.MARKER_SYMBOLS,
+        ):
+            return 0
+
+        def symbols():
+            for blob in blobs:
+                # only symbols containing an EMF header need to be read
+                if EMF_SIGNATURE not in blob:
+                    continue
+                try:
+                    yield Stream(BytesIO(blob)).read_object()
+                except (
+                    UnreadableSymbolException,
+                    NotImplementedException,
+                    UnsupportedVersionException,
+                    UnknownClsidException,
+                    UnreadablePictureException,
+                ):
+                    continue
+
+        return SymbolConverter.preconvert_emf_pictures(symbols(), context)
+
+    @staticmethod
+    def with_preconverted_emf_pictures(
+        symbol_type: str,
+        items: Iterable,
+        blob: Callable[[object], bytes],
+        context: Context,
+        chunk_size: int = EMF_PRECONVERSION_CHUNK_SIZE,
+    ) -> Iterator:
+        """
+        Passes through items representing raw symbols, converting the EMF
+        pictures used by each chunk of chunk_size items in batches before the
+        chunk is yielded (see preconvert_emf_pictures()).
+
+        This allows the EMF pictures to be pre-converted while symbols are read
+        lazily from the database, instead of reading the database twice.
+
+        :param blob: returns the raw symbol blob for an item
+        """
+        if symbol_type not in (
+            Extractor.FILL_SYMBOLS,
+            Extractor.LINE_SYMBOLS,
+            Extractor.MARKER_SYMBOLS,
+        ):
+            yield from items
+            return
+
+        chunk = []
+        try:
+            for item in items:
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    StyleDatabaseConverter.preconvert_emf_pictures(
+                        symbol_type, (blob(i) for i in chunk), context
+                    )
+                    yield from chunk
+                    chunk = []
+
+            if chunk:
+                StyleDatabaseConverter.preconvert_emf_pictures(
+                    symbol_type, (blob(i) for i in chunk), context
+                )
+                yield from chunk
+        finally:
+            # release the database if the caller stopped early
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def entity_to_xml(entity) -> Optional[Tuple[str, str]]:
+        """
+        Converts a QGIS style entity to XML, for transfer between processes.
+
+        Returns a tuple of the entity type and XML, or None if the entity
+        type is not supported.
+        """
+        doc = QDomDocument("style-entity")
+        rw_context = QgsReadWriteContext()
+        if isinstance(entity, QgsSymbol):
+            entity_type = StyleDatabaseConverter.SYMBOL
+            element = QgsSymbolLayerUtils.saveSymbol("symbol", entity, doc, rw_context)
+        elif isinstance(entity, QgsColorRamp):
+            entity_type = StyleDatabaseConverter.COLOR_RAMP
+            element = QgsSymbolLayerUtils.saveColorRamp("ramp", entity, doc)
+        elif isinstance(entity, QgsTextFormat):
+            entity_type = StyleDatabaseConverter.TEXT_FORMAT
+            element = entity.writeXml(doc, rw_context)
+        elif isinstance(entity, QgsPalLayerSettings):
+            entity_type = StyleDatabaseConverter.LABEL_SETTINGS
+            element = entity.writeXml(doc, rw_context)
+        elif QgsLegendPatchShape is not None and isinstance(
+            entity, QgsLegendPatchShape
+        ):
+            entity_type = StyleDatabaseConverter.LEGEND_PATCH_SHAPE
+            element = doc.createElement("patch")
+            entity.writeXml(element, doc, rw_context)
+        else:
+            return None
+
+        doc.appendChild(element)
+        return entity_type, doc.toString()
+
+    @staticmethod
+    def entity_from_xml(entity_type: str, xml: str):
+        """
+        Creates a QGIS style entity from XML created by entity_to_xml()
+        """
+        doc = QDomDocument()
+        doc.setContent(xml)
+        element = doc.documentElement()
+        rw_context = QgsReadWriteContext()
+        if entity_type == StyleDatabaseConverter.SYMBOL:
+            return QgsSymbolLayerUtils.loadSymbol(element, rw_context)
+        if entity_type == StyleDatabaseConverter.COLOR_RAMP:
+            return QgsSymbolLayerUtils.loadColorRamp(element)
+        if entity_type == StyleDatabaseConverter.TEXT_FORMAT:
+            text_format = QgsTextFormat()
+            text_format.readXml(element, rw_context)
+            return text_format
+        if entity_type == StyleDatabaseConverter.LABEL_SETTINGS:
+            settings = QgsPalLayerSettings()
+            settings.readXml(element, rw_context)
+            return settings
+        if entity_type == StyleDatabaseConverter.LEGEND_PATCH_SHAPE:
+            shape = QgsLegendPatchShape()
+            shape.readXml(element, rw_context)
+            return shape
+
+        return None
+
+    @staticmethod
+    def convert_symbols(
+        symbol_type: str,
+        symbols: Iterable[Tuple[str, str, bytes, object]],
+        context: Context,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[
+        Tuple[object, object, Optional[Tuple[str, str]], List[Tuple[str, str]]]
+    ]:
+        """
+        Converts raw symbols from a style database using a pool of worker
+        processes.
+
+        symbols must be an iterable of (name, unique name, blob, key) tuples,
+        where key is any picklable value identifying the symbol.
+
+        Yields a tuple of the key, converted entity, conversion error (see
+        convert_symbol()) and the (message, level) of any warnings raised
+        for each symbol. Results are yielded in the same order as the symbols,
+        regardless of worker scheduling. Only a limited number of symbols are
+        submitted to the pool at once, so the symbols can be read lazily.
+
+        This must only be called when worker processes can be spawned,
+        see worker_count().
+        """
+        context_state = context_to_worker_state(context)
+        max_pending = 4 * (max_workers or os.cpu_count() or 1)
+
+        def result(key, future):
+            entity_xml, error, warnings = future.result()
+            entity = (
+                StyleDatabaseConverter.entity_from_xml(*entity_xml)
+                if entity_xml is not None
+                else None
+            )
+            return key, entity, error, warnings
+
+        with create_executor(max_workers) as executor:
+            pending = deque()
+            try:
+                for name, unique_name, blob, key in symbols:
+                    pending.append(
+                        (
+                            key,
+                            executor.submit(
+                                _convert_style_symbol,
+                                symbol_type,
+                                name,
+                                unique_name,
+                                blob,
+                                context_state,
+                            ),
+                        )
+                    )
+                    if len(pending) >= max_pending:
+                        yield result(*pending.popleft())
+
+                while pending:
+                    yield result(*pending.popleft())
+            finally:
+                # if the caller stopped early, don't wait for unneeded conversions
+                for _, future in pending:
+                    future.cancel()
@@ -0,0 +1,245 @@
+"""
+Content addressed cache for symbol conversion
+"""
+
+# /***************************************************************************
+#  *                                                                         *
+#  *   This program is free software; you can redistribute it and/or modify  *
+#  *   it under the terms of the GNU General Public License as published by  *
+#  *   the Free Software Foundation; either version 2 of the License, or     *
+#  *   (at your option) any later version.                                   *
+#  *                                                                         *
+#  ***************************************************************************/
+
+import hashlib
+import sqlite3
+from array import array
+from typing import Callable, Dict, Optional, Tuple
+
+from qgis.PyQt.QtCore import QSettings
+from qgis.core import Qgis
+
+from ..parser.deferred_object import DeferredObject
+from ..parser.object import Object
+from .context import Context
+from .style_database import StyleDatabaseConverter
+
+# bump when converter changes would invalidate symbols stored in persistent caches
+CACHE_FORMAT_VERSION = 1
+
+# object attributes which don't affect the converted symbol
+IGNORED_ATTRIBUTES = {"ref_id", "stream_offset"}
+
+
+def _object_attributes(value: Object):
+    """
+    Returns the names of all attributes set on an object, in a stable order
+    """
+    names = set()
+    for cls in value.__class__.__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        names.update((slots,) if isinstance(slots, str) else slots)
+    names.update(getattr(value, "__dict__", {}))
+    return sorted(names - IGNORED_ATTRIBUTES)
+
+
+def _update_digest(digest, value, visiting: set):
+    """
+    Adds a value to a symbol digest
+    """
+    if isinstance(value, DeferredObject):
+        value = value.resolve()
+
+    if isinstance(value, Object):
+        if id(value) in visiting:
+            digest.update(b"<cycle>")
+            return
+        visiting.add(id(value))
+        digest.update(b"O" + value.__class__.__name__.encode())
+        for name in _object_attributes(value):
+            try:
+                attribute = getattr(value, name)
+            except AttributeError:
+                # unset slot
+                continue
+            if callable(attribute):
+                # e.g. per instance to_dict wrappers
+                continue
+            digest.update(b"." + name.encode())
+            _update_digest(digest, attribute, visiting)
+        visiting.discard(id(value))
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        digest.update(b"B%d:" % len(value))
+        digest.update(value)
+    elif isinstance(value, array):
+        data = value.tobytes()
+        digest.update(b"A" + value.typecode.encode() + b"%d:" % len(data))
+        digest.update(data)
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"L%d:" % len(value))
+        for v in value:
+            _update_digest(digest, v, visiting)
+    elif isinstance(value, dict):
+        digest.update(b"D%d:" % len(value))
+        for k, v in value.items():
+            _update_digest(digest, k, visiting)
+            _update_digest(digest, v, visiting)
+    else:
+        digest.update(b"V" + repr(value).encode() + b";")
+
+
+def symbol_digest(symbol: Object) -> str:
+    """
+    Returns a digest of the content of a parsed symbol.
+
+    Symbols with identical content have identical digests, regardless of the
+    document they were read from.
+    """
+    digest = hashlib.sha256()
+    _update_digest(digest, symbol, set())
+    return digest.hexdigest()
+
+
+class SymbolConversionCache:
+    """
+    A cache of converted symbols, keyed on the content of the source
+    symbol and the context settings which affect the conversion.
+
+    Converted symbols are stored as QGIS XML, so every cache hit returns
+    a new copy of the converted symbol.
+
+    If a path is specified, then cached symbols are also stored in an SQLite
+    database at that path, so that they can be reused by later runs. Only
+    symbols with embedded pictures are persisted, since symbols which link
+    to files in a picture folder can't be safely reused once the folder changes.
+    Persisted symbols are written when the cache is closed (or garbage
+    collected, if a conversion is aborted before the cache is closed).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._entries: Dict[str, Tuple[str, str]] = {}
+        self._connection: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self._connection = sqlite3.connect(path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS symbols "
+                "(key TEXT PRIMARY KEY, entity_type TEXT NOT NULL, xml TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def from_settings() -> "SymbolConversionCache":
+        """
+        Creates a cache using the persistent cache path from the plugin
+        settings, or an in-memory only cache if no path is set
+        """
+        return SymbolConversionCache(
+            QSettings().value("/plugins/slyr/symbol_cache_path", "")
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """
+        Closes the cache, writing any new symbols to the persistent cache
+        """
+        if self._connection is not None:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def cache_key(symbol: Object, context: Context) -> str:
+        """
+        Returns the cache key for converting a symbol with a context
+        """
+        settings = (
+            CACHE_FORMAT_VERSION,
+            Qgis.QGIS_VERSION_INT,
+            int(context.units),
+            context.embed_svgs(),
+            context.picture_folder,
+            context.convert_fonts,
+            context.apply_conversion_tweaks,
+            context.convert_esri_fonts_to_simple_markers,
+            context.use_real_world_units,
+            context.symbol_type_hint,
+            context.is_test_mode,
+        )
+        return "{}:{}".format(
+            symbol_digest(symbol),
+            hashlib.sha256(repr(settings).encode()).hexdigest(),
+        )
+
+    def _lookup(self, key: str) -> Optional[Tuple[str, str]]:
+        """
+        Returns the (entity type, xml) for a key, if cached
+        """
+        entry = self._entries.get(key)
+        if entry is None and self._connection is not None:
+            entry = self._connection.execute(
+                "SELECT entity_type, xml FROM symbols WHERE key=?", (key,)
+            ).fetchone()
+            if entry is not None:
+                entry = tuple(entry)
+                self._entries[key] = entry
+        return entry
+
+    def convert(
+        self,
+        symbol: Object,
+        context: Context,
+        convert_function: Callable[[Object, Context], object],
+    ):
+        """
+        Converts a symbol using the specified conversion function, or
+        returns a copy of a previously converted identical symbol.
+
+        Symbols are only cached if their conversion succeeded without
+        pushing any messages to the context, so that warnings are still
+        reported for every symbol which raises them.
+        """
+        key = SymbolConversionCache.cache_key(symbol, context)
+        entry = self._lookup(key)
+        if entry is not None:
+            converted = StyleDatabaseConverter.entity_from_xml(*entry)
+            if converted is not None:
+                self.hits += 1
+                return converted
+
+        self.misses += 1
+
+        callback = context.unsupported_object_callback
+        messages_pushed = False
+
+        def record_message(msg, level=Context.WARNING):
+            nonlocal messages_pushed
+            messages_pushed = True
+            if callback:
+                callback(msg, level=level)
+
+        context.unsupported_object_callback = record_message
+        try:
+            res = convert_function(symbol, context)
+        finally:
+            context.unsupported_object_callback = callback
+
+        if res is not None and not messages_pushed:
+            entry = StyleDatabaseConverter.entity_to_xml(res)
+            if entry is not None:
+                self._entries[key] = entry
+                if self._connection is not None and context.embed_svgs():
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO symbols VALUES (?, ?, ?)",
+                        (key, entry[0], entry[1]),
+                    )
+
+        return res
@@ -26,12 +26,8 @@ Symbol converter
 import base64
 import math
 import os
-import shutil
-from shutil import SameFileError
-import subprocess  # nosec B404
 import uuid
-from pathlib import Path
-from typing import Union, Tuple
+from typing import Iterable, List, Optional, Union, Tuple
 
 from qgis.core import (
     qgsDoubleNear,
@@ -77,7 +73,6 @@ from qgis.PyQt.QtGui import (
     QTransform,
 )
 from qgis.PyQt.QtSvg import QSvgGenerator, QSvgRenderer
-from qgis.PyQt.QtXml import QDomDocument
 
 from ..parser.objects.multi_layer_symbols import (
     MultiLayerSymbol,
@@ -118,6 +113,7 @@ from ..parser.exceptions import NotImplementedException
 from .context import Context
 from .color import ColorConverter
 from .decorations import DecorationConverter
+from .emf import EmfConverter
 from ..parser.objects.simple_line3d_symbol import SimpleLine3DSymbol
 from ..parser.objects.marker3d_symbol import Marker3DSymbol
 from ..parser.objects.simple_marker3d_symbol import SimpleMarker3DSymbol
@@ -157,11 +153,29 @@ class SymbolConverter:  # pylint: disable=too-many-public-methods
             raise AssertionError("Unexpected symbol type")
         return out
 
-    # pylint: disable=too-many-return-statements, too-many-branches, too-many-statements
     @staticmethod
     def Symbol_to_QgsSymbol(symbol, context: Context):
         """
         Converts a raw Symbol to a QgsSymbol
+
+        If the context has a symbol cache, then symbols which aren't part of
+        another symbol are converted via the cache.
+        """
+        if not symbol:
+            return None
+
+        if context.symbol_cache is not None and context.current_symbol is None:
+            return context.symbol_cache.convert(
+                symbol, context, SymbolConverter._convert_symbol
+            )
+
+        return SymbolConverter._convert_symbol(symbol, context)
+
+    # pylint: disable=too-many-return-statements, too-many-branches, too-many-statements
+    @staticmethod
+    def _convert_symbol(symbol, context: Context):
+        """
+        Converts a raw Symbol to a QgsSymbol, without using the symbol cache
         """
         if not symbol:
             return None
@@ -1009,157 +1023,58 @@ class SymbolConverter:  # pylint: disable=too-many-public-methods
 
         return path
 
-    # pylint: disable=too-many-branches, too-many-statements
     @staticmethod
     def emf_to_svg(
         emf_path: str, svg_path: str, inkscape_path: str = None, context: Context = None
     ):
         """
         Converts an EMF file to an SVG file (using inkscape)
-        """
-        binary = "inkscape"
-        if inkscape_path is not None:
-            binary = inkscape_path
-        likely_invalid_path = False
-
-        # most recent inkscape version arguments
-        export_args = [
-            binary,
-            "--export-plain-svg",
-            "--export-area-drawing",
-            "-o",
-            svg_path,
-            emf_path,
-        ]
-
-        # pylint: disable=subprocess-run-check
-        CREATE_NO_WINDOW = 0x08000000
-        try:
-            try:
-                _ = subprocess.run(  # nosec=B603
-                    export_args,
-                    stdout=subprocess.PIPE,
-                    creationflags=CREATE_NO_WINDOW,
-                    check=False,
-                )
-            except ValueError:
-                _ = subprocess.run(export_args, stdout=subprocess.PIPE, check=False)  # nosec=B603
-        except FileNotFoundError:
-            pass
-        except PermissionError:
-            likely_invalid_path = True
-
-        if not os.path.exists(svg_path):
-            # bah, inkscape changed parameters!
-            export_args = [
-                binary,
-                "--export-plain-svg",
-                "--export-file",
-                svg_path,
-                emf_path,
-            ]
 
-            try:
-                try:
-                    _ = subprocess.run(  # nosec=B603
-                        export_args,
-                        stdout=subprocess.PIPE,
-                        creationflags=CREATE_NO_WINDOW,
-                        check=False,
-                    )
-                except ValueError:
-                    _ = subprocess.run(export_args, stdout=subprocess.PIPE, check=False)  # nosec=B603
-            except FileNotFoundError:
-                pass
-            except PermissionError:
-                likely_invalid_path = True
-
-        if not os.path.exists(svg_path):
-            # this is the command for a very old inkscape version (pre 1.0)
-            export_args = [binary, "--file", emf_path, "--export-plain-svg", svg_path]
-
-            try:
-                try:
-                    _ = subprocess.run(  # nosec=B603
-                        export_args,
-                        stdout=subprocess.PIPE,
-                        creationflags=CREATE_NO_WINDOW,
-                        check=False,
-                    )
-                except ValueError:
-                    _ = subprocess.run(export_args, stdout=subprocess.PIPE, check=False)  # nosec=B603
-            except FileNotFoundError:
-                pass
-            except PermissionError:
-                likely_invalid_path = True
-
-        # pylint: enable=subprocess-run-check
-
-        if not os.path.exists(svg_path):
-            export_args = [
-                "libreoffice",
-                "--headless",
-                "--convert-to",
-                "svg",
-                emf_path,
-                "--outdir",
-                Path(svg_path).parent.as_posix(),
-            ]
+        See EmfConverter.emf_to_svg()
+        """
+        EmfConverter.emf_to_svg(
+            emf_path, svg_path, inkscape_path=inkscape_path, context=context
+        )
 
-            try:
-                try:
-                    _ = subprocess.run(  # nosec=B603
-                        export_args,
-                        stdout=subprocess.PIPE,
-                        creationflags=CREATE_NO_WINDOW,
-                        check=False,
-                    )
-                except ValueError:
-                    _ = subprocess.run(export_args, stdout=subprocess.PIPE, check=False)  # nosec=B603
-                lo_office_export_path = os.path.exists(
-                    (Path(svg_path).parent / Path(emf_path).stem).as_posix() + ".svg"
-                )
-                if os.path.exists(lo_office_export_path) and lo_office_export_path:
-                    try:
-                        shutil.copy(
-                            (Path(svg_path).parent / Path(emf_path).stem).as_posix()
-                            + ".svg",
-                            svg_path,
-                        )
-                    except SameFileError:
-                        pass
-            except FileNotFoundError:
-                pass
-            except PermissionError:
-                likely_invalid_path = True
+    @staticmethod
+    def emf_picture_contents(symbol) -> List[bytes]:
+        """
+        Returns the content of all EMF pictures used by the layers of a symbol
+        """
+        res = []
+        for layer in getattr(symbol, "layers", None) or []:
+            picture = getattr(layer, "picture", None)
+            if issubclass(picture.__class__, StdPicture):
+                picture = picture.picture
 
-        if not os.path.exists(svg_path):
-            # didn't work
-            if likely_invalid_path:
-                context.push_warning(
-                    "Invalid path to Inkscape executable -- cannot convert EMF content",
-                    level=Context.CRITICAL,
-                )
-            else:
-                context.push_warning(
-                    "Conversion of EMF content requires a valid path to an Inkscape install setup in the SLYR options",
-                    level=Context.CRITICAL,
+            if (
+                issubclass(picture.__class__, EmfPicture)
+                or (
+                    issubclass(picture.__class__, BmpPicture)
+                    and picture.format == BmpPicture.FORMAT_EMF
                 )
+            ) and picture.content:
+                res.append(picture.content)
+        return res
 
-        else:
-            # remove width/height from svg tag, so that the viewbox is correctly re-calculated
-            with open(svg_path, "rt", encoding="utf-8") as svg_file:
-                doc = QDomDocument()
-                doc.setContent("".join(svg_file.readlines()))
-
-                doc.documentElement().removeAttribute("width")
-                doc.documentElement().removeAttribute("height")
+    @staticmethod
+    def preconvert_emf_pictures(
+        symbols: Iterable, context: Context, max_processes: Optional[int] = None
+    ) -> int:
+        """
+        Converts the EMF pictures used by many symbols in batches, before the
+        symbols themselves are converted. The converted pictures are cached, so
+        that converting the symbols doesn't need to run Inkscape for each picture.
 
-                out = doc.toString(2)
-            with open(svg_path, "wt", encoding="utf-8") as svg_file:
-                svg_file.write(out)
+        See EmfConverter.convert_batch()
+        """
+        contents = []
+        for symbol in symbols:
+            contents.extend(SymbolConverter.emf_picture_contents(symbol))
 
-    # pylint: enable=too-many-branches, too-many-statements
+        return EmfConverter.convert_batch(
+            contents, inkscape_path=context.inkscape_path, max_processes=max_processes
+        )
 
     @staticmethod
     def write_svg(content: str, symbol_name: str, picture_folder: str):
@@ -4080,7 +3995,7 @@ class SymbolConverter:  # pylint: disable=too-many-public-methods
         )
 
         font_family = ConversionUtils.correct_font_capitalisation(font_family)
-        if font_family not in ConversionUtils.available_font_families():
+        if not ConversionUtils.is_font_family_available(font_family):
             context.push_warning("Font {} not available on system".format(font_family))
             return SymbolConverter.append_CharacterMarkerSymbolLayerAsFont(
                 symbol, layer, context
@@ -4216,7 +4131,7 @@ class SymbolConverter:  # pylint: disable=too-many-public-methods
         )
 
         font_family = ConversionUtils.correct_font_capitalisation(font_family)
-        if font_family not in ConversionUtils.available_font_families():
+        if not ConversionUtils.is_font_family_available(font_family):
             context.push_warning("Font {} not available on system".format(font_family))
 
         character = chr(unicode)
@@ -81,7 +81,7 @@ class TextSymbolConverter:
         # we need to sometimes strip 'Italic' or 'Bold' suffixes from the font name stored in the ESRI object
         # in order to match against actual font families
         keep_scanning = True
-        while name not in ConversionUtils.available_font_families() and keep_scanning:
+        while not ConversionUtils.is_font_family_available(name) and keep_scanning:
             keep_scanning = False
             if name.lower().endswith(" italic"):
                 name = name[: -len(" italic")]
@@ -201,7 +201,7 @@ class TextSymbolConverter:
                 text_symbol.font
             )
 
-        if font.family() not in ConversionUtils.available_font_families():
+        if not ConversionUtils.is_font_family_available(font.family()):
             context.push_warning("Font {} not available on system".format(font_family))
 
         font.setKerning(text_symbol.kerning)
@@ -28,10 +28,10 @@ import re
 import unicodedata
 import xml.etree.ElementTree as ET  # nosec B405
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from qgis.PyQt.QtCore import Qt, QPointF, QVariant
-from qgis.PyQt.QtGui import QFontDatabase
+from qgis.PyQt.QtGui import QFontDatabase, QGuiApplication
 from qgis.core import (
     QgsField,
     QgsFields,
@@ -44,6 +44,26 @@ from qgis.core import (
 from ..bintools.extractor import Extractor
 
 
+class FontIndex:
+    """
+    An index of the installed font families, for fast font lookups
+    """
+
+    def __init__(self, families: List[str]):
+        self.families = families
+        self.family_set = set(families)
+        self.lower_case_families: Dict[str, str] = {}
+        for family in families:
+            self.lower_case_families.setdefault(family.lower().strip(), family)
+        self.styles: Dict[str, List[str]] = {}
+
+
+# process-wide font index, built on first use and discarded when
+# the font database changes
+_FONT_INDEX: Optional[FontIndex] = None
+_FONT_INDEX_CONNECTED = False
+
+
 class ConversionUtils:
     """
     Conversion utilities
@@ -299,6 +319,36 @@ class ConversionUtils:
         # Filter out non-Latin characters
         return re.sub(r"[^a-zA-Z0-9_\-]", "_", normalized)
 
+    @staticmethod
+    def font_index() -> FontIndex:
+        """
+        Returns the index of installed fonts
+        """
+        global _FONT_INDEX, _FONT_INDEX_CONNECTED  # pylint: disable=global-statement
+        if _FONT_INDEX is None:
+            if not _FONT_INDEX_CONNECTED:
+                app = QGuiApplication.instance()
+                if app is not None and hasattr(app, "fontDatabaseChanged"):
+                    app.fontDatabaseChanged.connect(
+                        ConversionUtils.invalidate_font_index
+                    )
+                    _FONT_INDEX_CONNECTED = True
+
+            try:
+                families = QFontDatabase().families()
+            except TypeError:
+                families = QFontDatabase.families()
+            _FONT_INDEX = FontIndex(families)
+        return _FONT_INDEX
+
+    @staticmethod
+    def invalidate_font_index():
+        """
+        Discards the index of installed fonts, so that it is rebuilt on next use
+        """
+        global _FONT_INDEX  # pylint: disable=global-statement
+        _FONT_INDEX = None
+
     @staticmethod
     def correct_font_capitalisation(family: str) -> str:
         """
@@ -307,31 +357,38 @@ class ConversionUtils:
 
         Returns the name unchanged if not matched
         """
-        for candidate in ConversionUtils.available_font_families():
-            if candidate.lower().strip() == family.lower().strip():
-                return candidate
+        return ConversionUtils.font_index().lower_case_families.get(
+            family.lower().strip(), family
+        )
 
-        return family
+    @staticmethod
+    def is_font_family_available(family: str) -> bool:
+        """
+        Returns True if a font family is installed
+        """
+        return family in ConversionUtils.font_index().family_set
 
     @staticmethod
     def available_font_families() -> List[str]:
         """
         Returns the installed font families
         """
-        try:
-            return QFontDatabase().families()
-        except TypeError:
-            return QFontDatabase.families()
+        return list(ConversionUtils.font_index().families)
 
     @staticmethod
     def available_font_styles(family: str) -> List[str]:
         """
         Returns the available font styles for a family
         """
-        try:
-            return QFontDatabase().styles(family)
-        except TypeError:
-            return QFontDatabase.styles(family)
+        index = ConversionUtils.font_index()
+        styles = index.styles.get(family)
+        if styles is None:
+            try:
+                styles = QFontDatabase().styles(family)
+            except TypeError:
+                styles = QFontDatabase.styles(family)
+            index.styles[family] = styles
+        return list(styles)
 
     @staticmethod
     def font_style_string(font) -> str:
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+# /***************************************************************************
+#  *                                                                         *
+#  *   This program is free software; you can redistribute it and/or modify  *
+#  *   it under the terms of the GNU General Public License as published by  *
+#  *   the Free Software Foundation; either version 2 of the License, or     *
+#  *   (at your option) any later version.                                   *
+#  *                                                                         *
+#  ***************************************************************************/
+
+"""
+Process pools for parallel conversion
+"""
+
+import multiprocessing
+import multiprocessing.spawn
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import PureWindowsPath
+from typing import Optional, List, Tuple
+
+from qgis.core import QgsApplication, QgsUnitTypes
+
+from ..parser.initalize_registry import initialize_registry
+from .context import Context
+
+# keeps the QGIS application for a worker process alive
+_WORKER_APP = None
+
+# Context attributes which are transferred to worker processes
+WORKER_CONTEXT_ATTRIBUTES = (
+    "original_path",
+    "document_file",
+    "picture_folder",
+    "temporary_picture_folder",
+    "convert_fonts",
+    "apply_conversion_tweaks",
+    "inkscape_path",
+    "convert_esri_fonts_to_simple_markers",
+    "sde_primary_key",
+    "sde_table_name_conversion",
+    "ignore_online_sources",
+    "use_real_world_units",
+    "is_test_mode",
+    "destination_path",
+    "defer_set_path_for_mdb_layers",
+    "wrap_representation_symbols",
+    "use_representation_overrides",
+    "representation_override_field",
+    "representation_renderer_gdb_path",
+    "preferred_file_extension",
+    "upgrade_http_to_https",
+    "vsi_content_prefix",
+    "prefer_maplex",
+)
+
+
+def initialize_worker():
+    """
+    Prepares a worker process for conversion, by starting QGIS
+    and registering all known objects
+    """
+    global _WORKER_APP  # pylint: disable=global-statement
+    if QgsApplication.instance() is None:
+        _WORKER_APP = QgsApplication([], False)
+        _WORKER_APP.initQgis()
+    initialize_registry()
+
+
+def can_spawn_workers() -> bool:
+    """
+    Returns True if worker processes can be spawned from the current process.
+
+    Worker processes are spawned using the executable configured for
+    multiprocessing (sys.executable by default). When running within a host
+    application such as the QGIS desktop application or qgis_process, this
+    is the host application and not a Python interpreter, so workers
+    can't be spawned.
+    """
+    app = QgsApplication.instance()
+    if app is not None and app.platform() == "desktop":
+        return False
+
+    executable = multiprocessing.spawn.get_executable()
+    if not executable:
+        return False
+
+    if isinstance(executable, bytes):
+        executable = os.fsdecode(executable)
+    # PureWindowsPath handles both path separators
+    name = PureWindowsPath(executable).name.lower()
+    return name.startswith(("python", "pypy"))
+
+
+def worker_count(max_workers: Optional[int]) -> int:
+    """
+    Returns the number of worker processes which may be used for a conversion,
+    given the requested maximum number of workers.
+
+    Conversions always run in-process if workers can't be spawned from the
+    current process (see can_spawn_workers()), so 1 is returned regardless
+    of max_workers.
+    """
+    if max_workers is None or max_workers <= 1:
+        return 1
+
+    if not can_spawn_workers():
+        return 1
+
+    return max_workers
+
+
+def create_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Creates a process pool for conversion tasks.
+
+    Worker processes are always spawned (never forked), so that they run
+    their own QGIS application. Accordingly the pool must be created from
+    a standalone Python interpreter, not from within the QGIS desktop application.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initialize_worker,
+    )
+
+
+def context_to_worker_state(context: Context) -> dict:
+    """
+    Returns the picklable settings from a context, for transfer to
+    a worker process
+    """
+    state = {
+        attribute: getattr(context, attribute)
+        for attribute in WORKER_CONTEXT_ATTRIBUTES
+    }
+    state["units"] = int(context.units)
+    return state
+
+
+def context_from_worker_state(state: dict) -> Tuple[Context, List[Tuple[str, str]]]:
+    """
+    Creates a context in a worker process, from settings created by
+    context_to_worker_state().
+
+    Returns the context and a list which collects the (message, level) of
+    all warnings pushed to the context.
+    """
+    # avoid reading the plugin settings in the worker, they are
+    # transferred from the parent process instead
+    settings = {
+        attribute: state[attribute] for attribute in Context.SETTINGS_ATTRIBUTES
+    }
+    settings["units"] = QgsUnitTypes.RenderUnit(settings["units"])
+    context = Context(settings)
+    for attribute, value in state.items():
+        if attribute == "units":
+            value = QgsUnitTypes.RenderUnit(value)
+        setattr(context, attribute, value)
+
+    warnings = []
+
+    def unsupported_object_callback(msg, level=Context.WARNING):
+        warnings.append((msg, level))
+
+    context.unsupported_object_callback = unsupported_object_callback
+    return context, warnings
+
+
+def push_worker_warnings(context: Context, warnings: List[Tuple[str, str]]):
+    """
+    Pushes the warnings collected in a worker process to a context
+    """
+    if not context.unsupported_object_callback:
+        return
+
+    for msg, level in warnings:
+        context.unsupported_object_callback(msg, level=level)
@@ -6,8 +6,22 @@ Extracts colors from a persistent stream binary
 import math
 import itertools
 import operator
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
-from .color_lut import COLOR_LUT
+# The CIELAB lookup table is stored in color_lut.bin, as a sorted array of
+# little endian uint64 keys (see lab_lut_key) followed by the corresponding
+# (r, g, b) bytes for each key. It is loaded on first use.
+COLOR_LUT_PATH = os.path.join(os.path.dirname(__file__), "color_lut.bin")
+
+# offset for the signed a/b components of lookup table keys
+LUT_AB_OFFSET = 1 << 20
+
+_COLOR_LUT = None
 
 
 def xyz_to_rgb(x, y, z):
@@ -136,6 +150,46 @@ def round_lab(l_value, a, b):
     return round_val(l_value), round_val(a), round_val(b)
 
 
+def lab_lut_key(l_value, a, b):
+    """
+    Returns the lookup table key for l/a/b values, packing the values
+    (rounded to 4 decimal places) as fixed point integers into a single integer.
+
+    Returns None if the values are outside the range covered by the lookup table.
+    """
+    lut_l = round(l_value * 10000)
+    lut_a = round(a * 10000) + LUT_AB_OFFSET
+    lut_b = round(b * 10000) + LUT_AB_OFFSET
+    if not (0 <= lut_l < 1 << 20 and 0 <= lut_a < 1 << 21 and 0 <= lut_b < 1 << 21):
+        return None
+
+    return (lut_l << 42) | (lut_a << 21) | lut_b
+
+
+def color_lut():
+    """
+    Returns the CIELAB lookup table, as a tuple of the sorted key array and
+    the packed rgb values.
+
+    The table is read from disk on first use. As the table is held in flat
+    buffers it is never modified by lookups, and its memory remains shared
+    between forked processes.
+    """
+    global _COLOR_LUT  # pylint: disable=global-statement
+    if _COLOR_LUT is None:
+        with open(COLOR_LUT_PATH, "rb") as f:
+            data = f.read()
+
+        count = len(data) // 11
+        keys = array("Q")
+        keys.frombytes(data[: count * 8])
+        if sys.byteorder == "big":
+            keys.byteswap()
+        _COLOR_LUT = (keys, data[count * 8 :])
+
+    return _COLOR_LUT
+
+
 def lookup_lab(l_value, a, b):
     """
     Attempts to lookup an ESRI CIELAB in the manual lookup conversion table.
@@ -143,17 +197,25 @@ def lookup_lab(l_value, a, b):
     formula results in a color difference of more than 1 unit in the red, green
     or blue component when compared to ESRI's internal CIELAB -> RGB conversion.
     """
-    lut_l, lut_a, lut_b = round_lab(l_value, a, b)
-    if (lut_l, lut_a, lut_b) in COLOR_LUT:
-        (r, g, b) = COLOR_LUT[(lut_l, lut_a, lut_b)]
-        return r, g, b
+    key = lab_lut_key(l_value, a, b)
+    if key is None:
+        return None
+
+    keys, values = color_lut()
+    index = bisect_left(keys, key)
+    if index < len(keys) and keys[index] == key:
+        return values[index * 3], values[index * 3 + 1], values[index * 3 + 2]
 
     return None
 
 
+@lru_cache(maxsize=65536)
 def cielab_to_rgb(l_value, a, b):
     """
     Converts an ESRI CIELAB value to a RGB value
+
+    Results are memoized, as documents and style databases typically
+    reuse the same small set of colors many times over.
     """
     lut_result = lookup_lab(l_value, a, b)
     if lut_result is not None:
@@ -163,6 +225,47 @@ def cielab_to_rgb(l_value, a, b):
     return scale_and_round(*apply_gamma(*xyz_to_rgb(*cielab_to_xyz(l_value, a, b))))
 
 
+def cielab_to_rgb_list(
+    values: Iterable[Tuple[float, float, float]],
+) -> List[Tuple[int, int, int]]:
+    """
+    Converts many ESRI CIELAB (l, a, b) values to RGB values at once.
+
+    Each distinct value is converted only once, and the lookup table is
+    probed in key order so that the whole batch is resolved in a single
+    forward pass over the table.
+    """
+    values = list(values)
+    converted = dict.fromkeys(values)
+
+    keyed = []
+    for lab in converted:
+        key = lab_lut_key(*lab)
+        if key is not None:
+            keyed.append((key, lab))
+    keyed.sort()
+
+    keys, rgb_values = color_lut()
+    index = 0
+    for key, lab in keyed:
+        index = bisect_left(keys, key, index)
+        if index < len(keys) and keys[index] == key:
+            converted[lab] = (
+                rgb_values[index * 3],
+                rgb_values[index * 3 + 1],
+                rgb_values[index * 3 + 2],
+            )
+
+    for lab, rgb in converted.items():
+        if rgb is None:
+            # lab value not present in lookup table, use standard conversion formula
+            converted[lab] = scale_and_round(
+                *apply_gamma(*xyz_to_rgb(*cielab_to_xyz(*lab)))
+            )
+
+    return [converted[lab] for lab in values]
+
+
 def matrix_multiply_3(m, v):
     """
     matrix multiply vector by inner production.
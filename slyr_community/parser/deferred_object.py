@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""
+Placeholders for persistent objects whose content is parsed on demand
+"""
+
+from typing import Optional
+
+from .object import Object
+
+
+class ReferenceTableSnapshot(dict):
+    """
+    The object reference table as it was when an object was deferred.
+
+    Reference ids are allocated sequentially, so the snapshot consists of
+    the entries of the stream's reference table below the deferred
+    object's reference id. Objects created while parsing the deferred
+    object are stored in the snapshot itself, and only published to the
+    stream's reference table once the object has been parsed.
+    """
+
+    def __init__(self, table: dict, limit: int):
+        super().__init__()
+        self.table = table
+        self.limit = limit
+
+    def __contains__(self, ref) -> bool:
+        return dict.__contains__(self, ref) or (ref < self.limit and ref in self.table)
+
+    def __getitem__(self, ref):
+        if dict.__contains__(self, ref):
+            return dict.__getitem__(self, ref)
+        if ref < self.limit:
+            return self.table[ref]
+        raise KeyError(ref)
+
+    def get(self, ref, default=None):
+        return self[ref] if ref in self else default
+
+    def publish(self):
+        """
+        Adds the objects created while parsing the deferred object to the
+        stream's reference table. References to the deferred object itself
+        keep pointing at its placeholder.
+        """
+        for ref, obj in dict.items(self):
+            if ref != self.limit:
+                self.table.setdefault(ref, obj)
+
+
+class DeferredObject:
+    """
+    A placeholder for an object which has been skipped over in a stream,
+    and which is only parsed when it is first used.
+
+    The placeholder reports the class of the object it represents, so
+    isinstance() checks do not trigger parsing. The attributes returned by
+    the class' read_deferred_attributes() (such as layer names) are read when
+    the object is skipped, and are also available without parsing. Any other
+    attribute access parses the object (using the stream it was deferred from)
+    and is forwarded to the parsed object.
+    """
+
+    __slots__ = (
+        "_stream",
+        "_object_class",
+        "_buffer",
+        "_offset",
+        "_size",
+        "_debug_string",
+        "_references",
+        "_attributes",
+        "first_ref",
+        "last_ref",
+        "_object",
+    )
+
+    def __init__(
+        self,
+        stream,
+        object_class,
+        buffer,
+        offset: int,
+        size: int,
+        debug_string,
+        references: ReferenceTableSnapshot,
+        first_ref: int,
+        attributes: Optional[dict] = None,
+    ):  # pylint: disable=too-many-arguments
+        """
+        Constructor for DeferredObject
+        :param stream: stream to parse the object from
+        :param object_class: class of the deferred object
+        :param buffer: buffer containing the object
+        :param offset: offset of the object within the buffer
+        :param size: size of the object, in bytes
+        :param debug_string: description of the object
+        :param references: snapshot of the object reference table when the object was skipped
+        :param first_ref: reference id of the deferred object
+        :param attributes: object attributes which are available without parsing
+        """
+        object.__setattr__(self, "_stream", stream)
+        object.__setattr__(self, "_object_class", object_class)
+        object.__setattr__(self, "_buffer", buffer)
+        object.__setattr__(self, "_offset", offset)
+        object.__setattr__(self, "_size", size)
+        object.__setattr__(self, "_debug_string", debug_string)
+        object.__setattr__(self, "_references", references)
+        object.__setattr__(self, "_attributes", attributes or {})
+        object.__setattr__(self, "first_ref", first_ref)
+        # last reference id used by the object and its children, None until known
+        object.__setattr__(self, "last_ref", None)
+        object.__setattr__(self, "_object", None)
+
+    @property
+    def __class__(self):
+        return self._object_class
+
+    def __getattr__(self, name):
+        if self._object is None and name in self._attributes:
+            return self._attributes[name]
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        if name in DeferredObject.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.resolve(), name, value)
+
+    def __repr__(self):
+        if self._object is not None:
+            return repr(self._object)
+        return "<DeferredObject {} at {}>".format(
+            self._object_class.__name__, hex(self._offset)
+        )
+
+    def contains_ref(self, ref: int) -> bool:
+        """
+        Returns True if the given reference id belongs to the deferred object
+        or one of its children
+        """
+        return self.first_ref <= ref and (self.last_ref is None or ref <= self.last_ref)
+
+    def is_resolved(self) -> bool:
+        """
+        Returns True if the deferred object has been parsed
+        """
+        return self._object is not None
+
+    def resolve(self) -> Optional[Object]:
+        """
+        Parses the deferred object (if not already parsed), and returns it
+        """
+        if self._object is None:
+            object.__setattr__(
+                self,
+                "_object",
+                self._stream.resolve_deferred_object(
+                    self,
+                    self._buffer,
+                    self._offset,
+                    self._size,
+                    self._debug_string,
+                    self._references,
+                ),
+            )
+        return self._object
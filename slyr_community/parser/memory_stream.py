@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+Read-only, memory backed file-like objects for zero-copy stream parsing
+"""
+
+import mmap
+import os
+from struct import Struct
+from typing import Tuple
+
+
+class MemoryStream:
+    """
+    A read-only file-like object over a bytes-like buffer (bytes, bytearray,
+    memoryview or mmap), tracking the read position as a plain integer.
+
+    Primitive values can be unpacked directly from the underlying buffer
+    via unpack(), which avoids allocating intermediate bytes objects.
+    """
+
+    def __init__(self, buffer, position: int = 0):
+        """
+        Constructor for MemoryStream
+        :param buffer: bytes-like object to read from
+        :param position: initial read position
+        """
+        self.buffer = memoryview(buffer).cast("B")
+        self.size = len(self.buffer)
+        self.position = position
+        self._mmap = None
+
+    @staticmethod
+    def from_file(path: str) -> "MemoryStream":
+        """
+        Creates a MemoryStream from a memory mapped file
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return MemoryStream(b"")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        res = MemoryStream(mapped)
+        res._mmap = mapped  # pylint: disable=protected-access
+        return res
+
+    def close(self):
+        """
+        Releases the underlying buffer
+        """
+        self.buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def getbuffer(self) -> memoryview:
+        """
+        Returns a memoryview of the complete buffer
+        """
+        return self.buffer
+
+    def getvalue(self) -> bytes:
+        """
+        Returns a copy of the complete buffer contents
+        """
+        return self.buffer.tobytes()
+
+    def tell(self) -> int:
+        """
+        Returns the current position within the stream
+        """
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """
+        Seeks to the given offset
+        """
+        if whence == os.SEEK_SET:
+            self.position = offset
+        elif whence == os.SEEK_CUR:
+            self.position += offset
+        elif whence == os.SEEK_END:
+            self.position = self.size + offset
+        else:
+            raise ValueError("Invalid whence ({})".format(whence))
+        if self.position < 0:
+            raise ValueError("Negative seek position {}".format(self.position))
+        return self.position
+
+    def read(self, length: int = -1) -> bytes:
+        """
+        Reads up to length bytes from the stream
+        """
+        start = self.position
+        if length is None or length < 0:
+            end = self.size
+        else:
+            end = min(start + length, self.size)
+        if end <= start:
+            return b""
+        self.position = end
+        return self.buffer[start:end].tobytes()
+
+    def read_view(self, length: int) -> memoryview:
+        """
+        Reads up to length bytes from the stream, returning a memoryview
+        into the underlying buffer instead of a copy
+        """
+        start = self.position
+        end = min(start + length, self.size)
+        self.position = max(end, start)
+        return self.buffer[start:end]
+
+    def unpack(self, fmt: Struct) -> Tuple:
+        """
+        Unpacks a precompiled struct from the current position, advancing
+        the stream past it.
+
+        Raises struct.error if the stream is truncated.
+        """
+        res = fmt.unpack_from(self.buffer, self.position)
+        self.position += fmt.size
+        return res
+
+    def readable(self) -> bool:  # pylint: disable=missing-function-docstring
+        return True
+
+    def seekable(self) -> bool:  # pylint: disable=missing-function-docstring
+        return True
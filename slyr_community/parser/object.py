@@ -9,47 +9,61 @@ from typing import List, Optional
 from .exceptions import NotImplementedException, PartiallyImplementedException
 
 
+def _format_dict_value(v):
+    """
+    Converts objects contained in a dictionary value to dictionaries
+    """
+    if isinstance(v, Object):
+        return v.to_dict()
+    return v
+
+
+def _add_common_attributes(func):
+    """
+    Adds common attributes to an Object to_dict function
+    """
+
+    @functools.wraps(func)
+    def wrapper(self):
+        """
+        Wrapper which adds common attributes to the to_dict call
+        """
+        d = func(self)
+        # only the outermost call adds common attributes, calls made via
+        # super().to_dict() return the bare dictionary
+        if d is None or type(self).to_dict is not wrapper:
+            return d
+
+        d["type"] = self.__class__.__name__
+        d["version"] = self.version
+        if self.ref_id is not None:
+            d["ref_id"] = self.ref_id
+        if self.stream_offset is not None:
+            d["stream_offset"] = hex(self.stream_offset)
+
+        for k in list(d.keys()):
+            if isinstance(d[k], dict):
+                d[k] = {kk: _format_dict_value(vv) for kk, vv in d[k].items()}
+
+        return d
+
+    wrapper.adds_common_attributes = True
+    return wrapper
+
+
 class Object:
     """
     Base class for objects which can be read from a stream
     """
 
-    def __init__(self):
-        def to_dict_(func):
-            """
-            Adds common attributes to the to_dict function
-            """
+    __slots__ = ("version", "ref_id", "stream_offset")
 
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):  # pylint: disable=unused-argument
-                """
-                Wrapper which adds common attributes to the to_dict call
-                """
-                d = func()
-                if d is not None:
-                    d["type"] = self.__class__.__name__
-                    d["version"] = self.version
-                    if self.ref_id is not None:
-                        d["ref_id"] = self.ref_id
-                    if self.stream_offset is not None:
-                        d["stream_offset"] = hex(self.stream_offset)
-
-                    def format_dict_value(v):
-                        if isinstance(v, Object):
-                            return v.to_dict()
-                        return v
-
-                    for k in list(d.keys()):
-                        if isinstance(d[k], dict):
-                            d[k] = {
-                                kk: format_dict_value(vv) for kk, vv in d[k].items()
-                            }
-
-                return d
-
-            return wrapper
-
-        self.to_dict = to_dict_(self.to_dict)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not getattr(cls.to_dict, "adds_common_attributes", False):
+            cls.to_dict = _add_common_attributes(cls.to_dict)
+
+    def __init__(self):
         self.version: Optional[int] = None
         self.ref_id: Optional[int] = None
         self.stream_offset: Optional[int] = None
@@ -81,6 +95,17 @@ class Object:
         Reads the object from the given stream
         """
 
+    @classmethod
+    def read_deferred_attributes(  # pylint: disable=unused-argument
+        cls, stream, version
+    ) -> dict:
+        """
+        Reads the attributes which are available from a deferred object
+        without parsing the whole object. The stream is positioned at the
+        start of the object's content.
+        """
+        return {}
+
     def children(self) -> List["Object"]:
         """
         Returns a list of all child objects referenced by this object
@@ -3,11 +3,18 @@
 A registry for all known objects which can be decoded from a Stream
 """
 
-from typing import Optional
+import binascii
+from struct import Struct
+from typing import Optional, Iterable, List
 from .exceptions import (
     RequiresLicenseException,
 )
 
+# leading (little endian) fields of a binary CLSID
+CLSID_HEADER = Struct("<LHH")
+
+NULL_CLSID = bytes(16)
+
 
 class ObjectRegistry:
     """
@@ -16,6 +23,12 @@ class ObjectRegistry:
 
     def __init__(self):  # pylint: disable=useless-super-delegation
         self.objects = {}
+        # registered classes, keyed by the raw 16 byte CLSID as stored in streams
+        self.binary_objects = {}
+        # registered classes, keyed by class name
+        self.names = {}
+        # default version for objects created from dictionaries, by class
+        self._dict_versions = {}
         self.classes = []
 
     def register(self, object_class):
@@ -32,12 +45,17 @@ class ObjectRegistry:
 
         # assert cls_id not in self.objects, (object_class, self.objects[cls_id])
         self.objects[cls_id] = object_class
+        self.binary_objects[ObjectRegistry.clsid_to_bytes(cls_id)] = object_class
+        self.names.setdefault(object_class.__name__, object_class)
 
     def reload_clsids(self):
         """
         Reloads all known classes, regenerating clsids
         """
         self.objects = {}
+        self.binary_objects = {}
+        self.names = {}
+        self._dict_versions = {}
         prev_classes = self.classes
         self.classes = []
         for c in prev_classes:
@@ -58,6 +76,19 @@ class ObjectRegistry:
             )
         )
 
+    def create_object_from_bytes(self, clsid: bytes):
+        """
+        Creates a new object of the type associated with a raw 16 byte CLSID
+        """
+        object_class = self.binary_objects.get(clsid)
+        if object_class is not None:
+            return object_class()
+
+        if clsid == NULL_CLSID:
+            return None
+
+        return self.create_object(ObjectRegistry.bytes_to_clsid(clsid))
+
     def create_object_from_dict(self, source: Optional[dict]) -> Optional["Object"]:
         """
         Attempts to create an object from a dictionary
@@ -65,18 +96,32 @@ class ObjectRegistry:
         if source is None:
             return None
         class_name = source["type"]
-        object_class = [c for _, c in self.objects.items() if c.__name__ == class_name]
-        if not object_class:
+        object_class = self.names.get(class_name)
+        if object_class is None:
             raise KeyError("No registered object of type {}".format(class_name))
 
-        res = object_class[0].from_dict(source)
-        res.version = (
-            object_class[0].compatible_versions()[-1]
-            if object_class[0].compatible_versions()
-            else 1
-        )
+        res = object_class.from_dict(source)
+
+        version = self._dict_versions.get(object_class)
+        if version is None:
+            compatible_versions = object_class.compatible_versions()
+            version = compatible_versions[-1] if compatible_versions else 1
+            self._dict_versions[object_class] = version
+
+        res.version = version
         return res
 
+    def objects_from_dicts(
+        self, sources: Iterable[Optional[dict]]
+    ) -> List[Optional["Object"]]:
+        """
+        Creates objects from a list of dictionaries (e.g. a JSON document
+        store), in a single pass. Nested objects are created by the from_dict
+        implementations of each object.
+        """
+        create = self.create_object_from_dict
+        return [create(source) for source in sources]
+
     @staticmethod
     def clsid_to_hex(clsid: str):
         """
@@ -102,6 +147,32 @@ class ObjectRegistry:
         res += g[16:].encode()
         return res
 
+    @staticmethod
+    def clsid_to_bytes(clsid: tuple) -> bytes:
+        """
+        Converts a CLSID tuple (as returned by hex_to_clsid2) to the
+        raw 16 byte value stored in a block
+        """
+        return (
+            CLSID_HEADER.pack(clsid[0], clsid[1], clsid[2])
+            + clsid[3].to_bytes(2, "big")
+            + clsid[4].to_bytes(6, "big")
+        )
+
+    @staticmethod
+    def bytes_to_clsid(value: bytes) -> tuple:
+        """
+        Converts a raw 16 byte CLSID value to a CLSID tuple, equivalent to
+        hex_to_clsid2(binascii.hexlify(value))
+        """
+        if len(value) != 16:
+            return ObjectRegistry.hex_to_clsid2(binascii.hexlify(value))
+
+        return CLSID_HEADER.unpack_from(value) + (
+            int.from_bytes(value[8:10], "big"),
+            int.from_bytes(value[10:], "big"),
+        )
+
     @staticmethod
     def hex_to_clsid(hex_value) -> str:
         """
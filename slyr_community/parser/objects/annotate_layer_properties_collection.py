@@ -30,7 +30,7 @@ class AnnotateLayerPropertiesCollection(Object):
     def read(self, stream: Stream, version):
         count = stream.read_uint("properties count")
         for i in range(count):
-            self.properties.append(stream.read_object("property {}".format(i + 1)))
+            self.properties.append(stream.read_object(("property {}", i + 1)))
             if version > 1:
                 stream.read_int("unknown")  # expected=(0, 1, 2, 3, 4, 70, 71, 72)
         if version > 1:
@@ -25,7 +25,7 @@ class ArrayOfIShader(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("shader count")
         for i in range(count):
-            self.shaders.append(stream.read_object("shader {}".format(i + 1)))
+            self.shaders.append(stream.read_object(("shader {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"shaders": [s.to_dict() for s in self.shaders]}
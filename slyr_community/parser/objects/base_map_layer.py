@@ -45,6 +45,10 @@ class BaseMapLayer(Object):
     def compatible_versions():
         return [11]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):
         self.name = stream.read_string("name")
 
@@ -84,7 +88,7 @@ class BaseMapLayer(Object):
             size = stream.read_int("size")
             stream.read_int("unknown", expected=0)
             start = stream.tell()
-            self.children.append(stream.read_object("child {}".format(i + 1)))
+            self.children.append(stream.read_object(("child {}", i + 1)))
             if stream.tell() != size + start:
                 raise AssertionError(
                     "got size {} expected {}".format(stream.tell() - start, size)
@@ -92,7 +96,7 @@ class BaseMapLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
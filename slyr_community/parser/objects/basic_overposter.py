@@ -25,9 +25,7 @@ class BasicOverposter(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.label_properties.append(
-                stream.read_object("properties {}".format(i + 1))
-            )
+            self.label_properties.append(stream.read_object(("properties {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"properties": [p.to_dict() for p in self.label_properties]}
@@ -172,9 +172,7 @@ class BasicOverposterLayerProperties(Object):
         )
         number_angles = stream.read_int("number of angle places")
         for i in range(number_angles):
-            self.specified_point_angles.append(
-                stream.read_double("angle {}".format(i + 1))
-            )
+            self.specified_point_angles.append(stream.read_double(("angle {}", i + 1)))
         # point placement field??
 
         self.offset = stream.read_double("offset")
@@ -44,7 +44,7 @@ class CadAnnotationLayer(Object):
 
         count = stream.read_int("unknown count")
         for i in range(count):
-            stream.read_ushort("unknown {}".format(i + 1))
+            stream.read_ushort(("unknown {}", i + 1))
 
         self.description = stream.read_string("description")
         self.stored_zoom_max = stream.read_double("stored zoom max")
@@ -38,7 +38,7 @@ class CadDrawingObject(Object):
         stream.read_double("unknown", expected=1)
         count = stream.read_int("unknown count")
         for i in range(count):
-            stream.read_int("unknown {}".format(i + 1))
+            stream.read_int(("unknown {}", i + 1))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"path": self.path, "world_file_path": self.world_file_path}
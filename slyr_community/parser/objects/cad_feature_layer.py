@@ -35,7 +35,7 @@ class CadFeatureLayer(Object):
 
         count = stream.read_int("unknown count")
         for i in range(count):
-            stream.read_ushort("unknown flag {}".format(i + 1), expected=(0, 65535))
+            stream.read_ushort(("unknown flag {}", i + 1), expected=(0, 65535))
 
         if version > 2:
             stream.read_string("unknown", expected="")
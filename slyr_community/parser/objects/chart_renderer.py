@@ -51,8 +51,8 @@ class ChartRenderer(VectorRendererBase):
 
         count = stream.read_int("count")
         for i in range(count):
-            attribute = stream.read_string("attribute {}".format(i + 1))
-            label = stream.read_string("label {}".format(i + 1))
+            attribute = stream.read_string(("attribute {}", i + 1))
+            label = stream.read_string(("label {}", i + 1))
             self.attributes.append(attribute)
             self.labels.append(label)
 
@@ -56,9 +56,9 @@ class ClassBreaksRenderer(VectorRendererBase):
         maxes = []
         mins = []
         for i in range(class_count):
-            maxes.append(stream.read_double("max {}".format(i + 1)))
+            maxes.append(stream.read_double(("max {}", i + 1)))
         for i in range(class_count):
-            mins.append(stream.read_double("min {}".format(i + 1)))
+            mins.append(stream.read_double(("min {}", i + 1)))
         for i in range(len(maxes)):  # pylint: disable=consider-using-enumerate
             self.ranges.append([mins[i], maxes[i]])
 
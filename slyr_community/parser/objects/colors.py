@@ -6,9 +6,11 @@ COMPLETE INTERPRETATION
 """
 
 import binascii
+from typing import List, Tuple
+
 from ..object import Object
 from ..exceptions import InvalidColorException
-from ..color_parser import cielab_to_rgb
+from ..color_parser import cielab_to_rgb, cielab_to_rgb_list
 
 
 class Color(Object):
@@ -41,7 +43,7 @@ class Color(Object):
         self.dither = binascii.hexlify(stream.read(1)) == b"01"
         self.is_null = binascii.hexlify(stream.read(1)) == b"ff"
 
-        stream.log("Read color ({}) of {}".format(self.model, self.to_dict()))
+        stream.log(("Read color ({}) of {}", self.model, self.to_dict()))
 
 
 class RgbColor(Color):
@@ -68,11 +70,22 @@ class RgbColor(Color):
         lab_a = stream.read_double()
         lab_b = stream.read_double()
 
+        if stream.pending_lab_colors is not None:
+            # converted in bulk once the enclosing object has been read
+            stream.pending_lab_colors.append((self, (lab_l, lab_a, lab_b)))
+            return
+
         try:
-            self.red, self.green, self.blue = cielab_to_rgb(lab_l, lab_a, lab_b)
+            self.set_rgb(*cielab_to_rgb(lab_l, lab_a, lab_b))
         except OverflowError as e:
             raise InvalidColorException() from e
 
+    def set_rgb(self, red: int, green: int, blue: int):
+        """
+        Sets the RGB components of the color
+        """
+        self.red, self.green, self.blue = red, green, blue
+
         if self.red > 255 or self.red < 0:
             raise InvalidColorException()
         if self.blue > 255 or self.blue < 0:
@@ -80,6 +93,20 @@ class RgbColor(Color):
         if self.green > 255 or self.green < 0:
             raise InvalidColorException()
 
+    @staticmethod
+    def convert_lab_colors(colors: List[Tuple["RgbColor", Tuple[float, float, float]]]):
+        """
+        Sets the RGB components of many colors from their CIELAB values,
+        converting them in a single batch
+        """
+        try:
+            rgb_values = cielab_to_rgb_list(lab for _, lab in colors)
+        except OverflowError as e:
+            raise InvalidColorException() from e
+
+        for (color, _), rgb in zip(colors, rgb_values):
+            color.set_rgb(*rgb)
+
     def to_dict(self):  # pylint: disable=method-hidden
         return {
             "R": self.red,
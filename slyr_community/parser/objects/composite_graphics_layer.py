@@ -44,12 +44,10 @@ class CompositeGraphicsLayer(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("element count")
         for i in range(count):
-            element_count = stream.read_int("number of elements in {}".format(i + 1))
+            element_count = stream.read_int(("number of elements in {}", i + 1))
             elements = []
             for e in range(element_count):
-                elements.append(
-                    stream.read_object("element {} in {}".format(e + 1, i + 1))
-                )
+                elements.append(stream.read_object(("element {} in {}", e + 1, i + 1)))
             self.groups.append(elements)
 
         self.name = stream.read_string("name")
@@ -73,7 +71,7 @@ class CompositeGraphicsLayer(Object):
         count = stream.read_int("annotation group count")
         for i in range(count):
             group = {}
-            group["name"] = stream.read_string("annotation group name {}".format(i + 1))
+            group["name"] = stream.read_string(("annotation group name {}", i + 1))
             group["associated_layer"] = stream.read_object("associated layer")
 
             group["checked"] = (
@@ -28,7 +28,7 @@ class CompositeXForm(Object):
         stream.read_ushort("unknown", expected=0)
         count = stream.read_int("count")
         for i in range(count):
-            stream.read_object("transform {}".format(i + 1))
+            stream.read_object(("transform {}", i + 1))
 
         if version >= 2:
             stream.read_ushort("unknown flag", expected=0)
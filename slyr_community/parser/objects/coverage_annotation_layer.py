@@ -27,41 +27,44 @@ class CoverageAnnotationLayer(FeatureLayer):
     def compatible_versions():
         return [5]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        layer_version = stream.read_ushort("layer version")
+        return super().read_deferred_attributes(stream, layer_version)
+
     def read(self, stream: Stream, version):
         layer_version = stream.read_ushort("layer version")
         super().read(stream, layer_version)
 
         field_count = stream.read_int("field count")
         for i in range(field_count):
-            self.fields.append(stream.read_object("field {}".format(i + 1)))
+            self.fields.append(stream.read_object(("field {}", i + 1)))
 
         stream.read_int("unknown")
 
         symbol_count = stream.read_int("symbol count")
         for i in range(symbol_count):
-            self.symbol_numbers.append(
-                stream.read_int("symbol number {}".format(i + 1))
-            )
+            self.symbol_numbers.append(stream.read_int(("symbol number {}", i + 1)))
 
         stream.read_int("unknown", expected=0)
 
         count = stream.read_int("unknown count")
         for i in range(count):
-            stream.read_object("text symbol {}".format(i + 1))
+            stream.read_object(("text symbol {}", i + 1))
 
         symbol_count = stream.read_int("text symbol count")
         for i in range(symbol_count):
-            stream.read_object("text symbol {}".format(i + 1))
+            stream.read_object(("text symbol {}", i + 1))
 
         stream.read_int("unknown", expected=0)
 
         count = stream.read_int("count")
         for i in range(count):
-            stream.read_int("unknown {}".format(i + 1))
+            stream.read_int(("unknown {}", i + 1))
 
         level_count = stream.read_int("level count")
         for i in range(level_count):
-            stream.read_ushort("level visibility {}".format(i + 1))
+            stream.read_ushort(("level visibility {}", i + 1))
 
         self.barrier_weight = stream.read_int("barrier weight")
         stream.read_int("unknown", expected=1)
@@ -41,7 +41,7 @@ class LineDecoration(Object):
         # next bit is probably number of decorations?
         count = stream.read_uint("count of decorations")
         for i in range(count):
-            decoration = stream.read_object("decoration element {}/{}".format(i, count))
+            decoration = stream.read_object(("decoration element {}/{}", i, count))
             self.decorations.append(decoration)
 
 
@@ -90,16 +90,14 @@ class SimpleLineDecorationElement(Object):
         """
         self.fixed_angle = not bool(stream.read_uchar())
         stream.log(
-            "detected {}".format(
-                "fixed angle" if self.fixed_angle else "not fixed angle"
-            )
+            ("detected {}", "fixed angle" if self.fixed_angle else "not fixed angle")
         )
         self.flip_first = bool(stream.read_uchar())
         stream.log(
-            "detected {}".format("flip first" if self.flip_first else "no flip first")
+            ("detected {}", "flip first" if self.flip_first else "no flip first")
         )
         self.flip_all = bool(stream.read_uchar())
-        stream.log("detected {}".format("flip all" if self.flip_all else "no flip all"))
+        stream.log(("detected {}", "flip all" if self.flip_all else "no flip all"))
 
         self.position_as_ratio = stream.read_ushort("position as ratio") != 0
 
@@ -112,4 +110,4 @@ class SimpleLineDecorationElement(Object):
         # alone. E.g. 2 positions = 0, 1. 3 positions = 0, 0.5, 1
         for _ in range(marker_number_positions):
             self.marker_positions.append(stream.read_double())
-        stream.log("marker positions are {}".format(self.marker_positions))
+        stream.log(("marker positions are {}", self.marker_positions))
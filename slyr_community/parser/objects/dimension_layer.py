@@ -23,6 +23,11 @@ class DimensionLayer(FeatureLayer):
     def compatible_versions():
         return [4]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        layer_version = stream.read_ushort("layer version number")
+        return super().read_deferred_attributes(stream, layer_version)
+
     def read(self, stream: Stream, version):
         layer_version_number = stream.read_ushort("layer version number")
         super().read(stream, layer_version_number)
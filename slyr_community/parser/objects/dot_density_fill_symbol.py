@@ -51,9 +51,9 @@ class DotDensityFillSymbol(Object):
 
         marker_count = stream.read_int("marker count")
         for i in range(marker_count):
-            self.markers.append(stream.read_object("marker {}".format(i + 1)))
+            self.markers.append(stream.read_object(("marker {}", i + 1)))
         for i in range(marker_count):
-            self.dot_counts.append(stream.read_int("dot count {}".format(i + 1)))
+            self.dot_counts.append(stream.read_int(("dot count {}", i + 1)))
 
         self.background_color = stream.read_object("background color")
 
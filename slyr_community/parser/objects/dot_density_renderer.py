@@ -44,7 +44,7 @@ class DotDensityRenderer(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("field count")
         for i in range(count):
-            self.fields.append(stream.read_string("field {}".format(i + 1)))
+            self.fields.append(stream.read_string(("field {}", i + 1)))
             self.field_aliases.append(stream.read_string("alias"))
 
         stream.read_ushort("unknown", expected=1)
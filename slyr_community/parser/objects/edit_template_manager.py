@@ -27,7 +27,7 @@ class EditTemplateManager(Object):
     def read(self, stream: Stream, version):
         templates_count = stream.read_int("template count")
         for i in range(templates_count):
-            self.templates.append(stream.read_object("template {}".format(i + 1)))
+            self.templates.append(stream.read_object(("template {}", i + 1)))
 
         if version > 1:
             stream.read_uchar("unknown", expected=1)
@@ -38,7 +38,7 @@ class ElementCollection(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.elements.append(stream.read_object("element {}".format(i + 1)))
+            self.elements.append(stream.read_object(("element {}", i + 1)))
             if version > 2:
                 self.linked_feature_ids.append(stream.read_int("linked feature id"))
                 stream.read_ushort("unknown", expected=65535)
@@ -60,7 +60,7 @@ class FeatureClassName(Object):
         if version == 2:
             extra = stream.read_ushort("topology count??")
             for i in range(extra):
-                stream.read_object("topology {}??".format(i + 1))
+                stream.read_object(("topology {}??", i + 1))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {
@@ -120,7 +120,7 @@ class FgdbFeatureClassName(FeatureClassName):
         if version == 1:
             extra = stream.read_ushort("topology count??")
             for i in range(extra):
-                stream.read_object("topology {}??".format(i + 1))
+                stream.read_object(("topology {}??", i + 1))
 
     def to_dict(self):  # pylint: disable=method-hidden
         res = super().to_dict()
@@ -219,9 +219,7 @@ class GpkgFeatureClassName(FeatureClassName):
         if version == 1:
             extra = stream.read_ushort("topology count??")
             for i in range(extra):
-                self.topologies.append(
-                    stream.read_object("topology {}??".format(i + 1))
-                )
+                self.topologies.append(stream.read_object(("topology {}??", i + 1)))
         self.query = stream.read_object("query")
 
     def to_dict(self):  # pylint: disable=method-hidden
@@ -24,8 +24,7 @@ class FeatureIDSet(Object):
 
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
-        for i in range(count):
-            self.features.append(stream.read_int("id {}".format(i + 1)))
+        self.features = stream.read_ints(count, "ids").tolist()
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"features": self.features}
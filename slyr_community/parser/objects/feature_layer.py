@@ -197,6 +197,10 @@ class FeatureLayer(Object):
             return "attribute_first"
         raise AssertionError("Unhandled order")
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):  # pylint: disable=too-many-locals,too-many-return-statements,too-many-branches,too-many-statements
         self.name = stream.read_string("name")
         self.datasource_type = stream.read_string("datasource_type")
@@ -250,7 +254,7 @@ class FeatureLayer(Object):
 
         count = stream.read_int("link count")
         for i in range(count):
-            self.hyperlinks.append(stream.read_object("hyperlink {}".format(i + 1)))
+            self.hyperlinks.append(stream.read_object(("hyperlink {}", i + 1)))
 
         self.selection_color = stream.read_object("selection color")
 
@@ -262,7 +266,7 @@ class FeatureLayer(Object):
         classes = stream.read_uint("field info count")
         for i in range(classes):
             key = stream.read_string("key")
-            self.field_info[key] = stream.read_object("field {}".format(i + 1))
+            self.field_info[key] = stream.read_object(("field {}", i + 1))
 
         self.annotation_collection = stream.read_object("annotation collection")
 
@@ -273,7 +277,7 @@ class FeatureLayer(Object):
         self.features_excluded_from_rendering = stream.read_object("excluded features")
         count = stream.read_int("selection set")
         for i in range(count):
-            self.selection_set.append(stream.read_int("selection {}".format(i + 1)))
+            self.selection_set.append(stream.read_int(("selection {}", i + 1)))
 
         self.scale_symbols = stream.read_ushort("scale symbols") != 0
 
@@ -294,7 +298,7 @@ class FeatureLayer(Object):
 
         rel_count = stream.read_int("number of relationships")
         for i in range(rel_count):
-            self.relations.append(stream.read_object("relation {}".format(i + 1)))
+            self.relations.append(stream.read_object(("relation {}", i + 1)))
 
         self.hyperlink_macro_name = stream.read_string("hyperlink macro name")
         self.area_of_interest = stream.read_object("area of interest")
@@ -304,9 +308,7 @@ class FeatureLayer(Object):
         if version >= 15:
             remote_count = stream.read_int("remote object count")
             for i in range(remote_count):
-                size = (
-                    stream.read_int("size {}".format(i)) + 20
-                )  # 20 = object header size
+                size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
                 pos = stream.tell()
                 stream.read_int("unknown", expected=0)
 
@@ -376,8 +378,8 @@ class FeatureLayer(Object):
 
         count = stream.read_int("unknown filter count")
         for i in range(count):
-            stream.read_string("unknown filter {}?".format(i + 1))
-            stream.read_string("unknown filter name {}?".format(i + 1))
+            stream.read_string(("unknown filter {}?", i + 1))
+            stream.read_string(("unknown filter name {}?", i + 1))
 
         if version <= 24:
             return
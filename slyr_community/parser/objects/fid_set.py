@@ -22,8 +22,7 @@ class FidSet(Object):
 
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
-        for i in range(count):
-            self.fids.append(stream.read_int("fid {}".format(i + 1)))
+        self.fids = stream.read_ints(count, "fids").tolist()
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"fids": self.fids}
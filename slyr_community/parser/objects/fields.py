@@ -28,7 +28,7 @@ class Fields(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.fields.append(stream.read_object("field {}".format(i + 1)))
+            self.fields.append(stream.read_object(("field {}", i + 1)))
 
         for i, _ in enumerate(self.fields):
             stream.read_int("unknown", expected=(i, 0xFFFFFFFF))
@@ -3,6 +3,9 @@
 Serializable object subclass
 """
 
+from array import array
+from typing import List, Sequence, Tuple
+
 from ..exceptions import NotImplementedException, UnreadableSymbolException
 from ..object import Object
 from ..stream import Stream
@@ -22,6 +25,19 @@ class Segment:
     SEGMENT_ARC_INTERIOR_POINT = 11
     SEGMENT_ARC_CENTER_POINT = 12
 
+    __slots__ = (
+        "start_point_index",
+        "segment_type",
+        "vertex",
+        "is_ccw",
+        "cp1",
+        "cp2",
+        "center",
+        "radius_major_axis",
+        "minor_major_ratio",
+        "rotation",
+    )
+
     def __repr__(self):
         return "<Segment: {} from {}>".format(
             self.segment_type_to_string(self.segment_type), self.start_point_index
@@ -161,6 +177,8 @@ class Geometry(Object):
                 "Could not convert geometry type string {}".format(string)
             )
 
+    __slots__ = ("crs", "x_min", "x_max", "y_min", "y_max", "segments")
+
     def __init__(self):  # pylint: disable=useless-super-delegation
         super().__init__()
         self.crs = None
@@ -179,9 +197,9 @@ class Geometry(Object):
 
         for i in range(segment_modifiers):
             start_point_index = stream.read_int(
-                "curve segment {} start point index".format(i + 1)
+                ("curve segment {} start point index", i + 1)
             )
-            segment_type = stream.read_int("curved segment {} type".format(i + 1))
+            segment_type = stream.read_int(("curved segment {} type", i + 1))
 
             if segment_type == Segment.SEGMENT_ELLIPTICAL_ARC:
                 stream.log("Reading elliptical arc")
@@ -280,3 +298,79 @@ class Geometry(Object):
             "y_max": self.y_max,
             "segments": [s.to_dict() for s in self.segments],
         }
+
+
+class MultiPartGeometry(Geometry):
+    """
+    Base class for geometries consisting of one or more parts of vertices.
+
+    The vertices of all parts are stored as a flat array of interleaved
+    x/y coordinates, with part_offsets holding the index of the first vertex
+    of each part (followed by the total vertex count).
+    """
+
+    __slots__ = ("coordinates", "part_offsets")
+
+    def __init__(self):  # pylint: disable=useless-super-delegation
+        super().__init__()
+        self.coordinates = array("d")
+        self.part_offsets = array("L", [0])
+
+    def read_parts(self, stream: Stream, part_count: int, total_vertices: int):
+        """
+        Reads the part index and vertices for part_count parts from the stream
+        """
+        index = stream.read_int("first index", expected=0)
+        offsets = array("L", [0])
+        vertex_count = 0
+        for next_index in stream.read_ints(part_count - 1, "indices"):
+            vertex_count += max(next_index - index, 0)
+            offsets.append(vertex_count)
+            index = next_index
+        vertex_count += max(total_vertices - index, 0)
+        offsets.append(vertex_count)
+
+        self.coordinates = stream.read_doubles(vertex_count * 2, "vertices")
+        self.part_offsets = offsets
+
+    def part_count(self) -> int:
+        """
+        Returns the number of parts in the geometry
+        """
+        return len(self.part_offsets) - 1
+
+    def part(self, index: int) -> List[Tuple[float, float]]:
+        """
+        Returns the vertices of the part with matching index, as (x, y) tuples
+        """
+        coordinates = self.coordinates[
+            self.part_offsets[index] * 2 : self.part_offsets[index + 1] * 2
+        ]
+        return list(zip(coordinates[0::2], coordinates[1::2]))
+
+    @property
+    def parts(self) -> List[List[Tuple[float, float]]]:
+        """
+        Returns a list of the vertices of all parts, as (x, y) tuples.
+
+        The list is created on each call, modifying it does not
+        affect the geometry.
+        """
+        return [self.part(i) for i in range(self.part_count())]
+
+    @parts.setter
+    def parts(self, parts: Sequence[Sequence[Sequence[float]]]):
+        coordinates = array("d")
+        offsets = array("L", [0])
+        for part in parts:
+            for x, y in part:
+                coordinates.append(x)
+                coordinates.append(y)
+            offsets.append(len(coordinates) // 2)
+        self.coordinates = coordinates
+        self.part_offsets = offsets
+
+    def to_dict(self):  # pylint: disable=method-hidden
+        res = super().to_dict()
+        res["parts"] = self.parts
+        return res
@@ -16,6 +16,8 @@ class GeometryBag(Geometry):
     def cls_id():
         return "10b5f5c0-3781-11d2-bcc5-0000f875bcce"
 
+    __slots__ = ("envelope", "geometries")
+
     def __init__(self):  # pylint: disable=useless-super-delegation
         super().__init__()
         self.envelope = None
@@ -27,7 +29,7 @@ class GeometryBag(Geometry):
         self.envelope = stream.read_object("envelope")
 
         for i in range(count):
-            self.geometries.append(stream.read_object("geometry {}".format(i + 1)))
+            self.geometries.append(stream.read_object(("geometry {}", i + 1)))
 
         self.crs = stream.read_object("crs")
         stream.read_uchar("unknown", expected=0)
@@ -33,7 +33,7 @@ class GeometryDef(Object):
         count = stream.read_int("spatial index grid count")
         for i in range(count):
             self.spatial_index_grid_sizes.append(
-                stream.read_double("spatial index grid size {}".format(i + 1))
+                stream.read_double(("spatial index grid size {}", i + 1))
             )
 
         self.geometry_type = stream.read_int("geometry type")
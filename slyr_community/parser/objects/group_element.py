@@ -45,7 +45,7 @@ class GroupElement(Element):
 
         count = stream.read_int("count")
         for i in range(count):
-            self.elements.append(stream.read_object("element {}".format(i + 1)))
+            self.elements.append(stream.read_object(("element {}", i + 1)))
 
         if version > 2:
             stream.read_object("shape")
@@ -46,6 +46,10 @@ class GroupLayer(Object):
         else:
             return "<GroupLayer: {}>".format(self.name)
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):  # pylint: disable=too-many-statements
         self.name = stream.read_string("name")
         self.visible = stream.read_ushort("visible") == 0xFFFF
@@ -67,7 +71,7 @@ class GroupLayer(Object):
                 stream.read_int("unknown", expected=0)
 
             self.children.append(
-                stream.read_object("layer {}".format(i + 1), expected_size=size)
+                stream.read_object(("layer {}", i + 1), expected_size=size)
             )
 
             if not stream.tolerant and size >= 0:
@@ -87,9 +91,7 @@ class GroupLayer(Object):
         if version > 4:
             remote_count = stream.read_int("remote object count")
             for i in range(remote_count):
-                size = (
-                    stream.read_int("size {}".format(i)) + 20
-                )  # 20 = object header size
+                size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
                 pos = stream.tell()
                 stream.read_int("unknown", expected=0)
                 try:
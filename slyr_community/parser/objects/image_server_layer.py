@@ -129,7 +129,7 @@ class ImageServerLayer(Object):
         count = stream.read_ushort("unknown count")
         for i in range(count):
             stream.read_ushort("unknown", expected=13)
-            self.extensions.append(stream.read_object("extension {}".format(i + 1)))
+            self.extensions.append(stream.read_object(("extension {}", i + 1)))
 
         stream.read_ushort(expected=13)
         self.envelope = stream.read_object("envelope")
@@ -187,7 +187,7 @@ class ImageServerLayer(Object):
             count = stream.read_int("count")
             for i in range(count):
                 stream.read_ushort("unknown", expected=13)
-                stream.read_object("field info {}".format(i + 1))
+                stream.read_object(("field info {}", i + 1))
 
             stream.read_ushort(expected=8)
             self.definition_query = stream.read_stringv2("definition query")
@@ -279,7 +279,7 @@ class ImageServerLayer(Object):
             count = stream.read_int("band count?")
             for i in range(count):
                 stream.read_ushort("unknown", expected=13)
-                stream.read_object("band histogram? {}".format(i + 1))
+                stream.read_object(("band histogram? {}", i + 1))
 
             stream.read_ushort(expected=11)
             stream.read_ushort("unknown", expected=0)
@@ -52,6 +52,10 @@ class InternetTiledLayer(Object):
     def compatible_versions():
         return [2]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):
         self.name = stream.read_string("name")
         self.identifier = stream.read_string("identifier")
@@ -73,7 +77,7 @@ class InternetTiledLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
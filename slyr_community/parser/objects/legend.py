@@ -85,7 +85,7 @@ class Legend(Element):
 
         count = stream.read_int("count")
         for i in range(count):
-            self.items.append(stream.read_object("item {}".format(i + 1)))
+            self.items.append(stream.read_object(("item {}", i + 1)))
 
         if version > 2:
             self.right_to_left = stream.read_ushort("right to left") != 0
@@ -23,7 +23,7 @@ class LegendGroups(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.groups.append(stream.read_object("legend group {}".format(i + 1)))
+            self.groups.append(stream.read_object(("legend group {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"groups": [g.to_dict() for g in self.groups]}
@@ -107,7 +107,7 @@ class SimpleLineSymbol(LineSymbolLayer):
         self.width = stream.read_double("width")
 
         self.line_type = self.read_line_type(stream)
-        stream.log("read line type of {}".format(self.line_type))
+        stream.log(("read line type of {}", self.line_type))
         self.symbol_level = SymbolLayer.read_symbol_level(stream)
 
 
@@ -43,4 +43,4 @@ class LineTemplate(Object):
         pattern = ""
         for p in self.pattern_parts:
             pattern += "-" * int(p[0]) + "." * int(p[1])
-        stream.log("deciphered line pattern {} ending".format(pattern))
+        stream.log(("deciphered line pattern {} ending", pattern))
@@ -23,7 +23,7 @@ class LODInfos(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.levels.append(stream.read_object("level {}".format(i + 1)))
+            self.levels.append(stream.read_object(("level {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"levels": [l.to_dict() for l in self.levels]}
@@ -24,7 +24,7 @@ class LongArray(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.values.append(stream.read_int("value {}".format(i + 1)))
+            self.values.append(stream.read_int(("value {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"values": self.values}
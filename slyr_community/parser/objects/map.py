@@ -135,9 +135,20 @@ class Map(Object):
                 size = stream.read_int("size") + 8
                 stream.read_int("unknown", expected=0)
 
-            self.root_groups.append(
-                stream.read_object("root group {}".format(i + 1), expected_size=size)
-            )
+            if size >= 0 and i < layer_count - 1:
+                # the last root group is always read immediately, as its
+                # reference id marks the end of the previous group's references
+                self.root_groups.append(
+                    stream.read_deferred_object(
+                        ("root group {}", i + 1),
+                        expected_size=size,
+                        end=start + size,
+                    )
+                )
+            else:
+                self.root_groups.append(
+                    stream.read_object(("root group {}", i + 1), expected_size=size)
+                )
 
             if not stream.tolerant and size >= 0:
                 if stream.tell() != start + size:
@@ -157,7 +168,7 @@ class Map(Object):
 
         count = stream.read_int("count")
         for i in range(count):
-            self.elements.append(stream.read_object("element {}".format(i + 1)))
+            self.elements.append(stream.read_object(("element {}", i + 1)))
 
         # full extent
         self.full_extent_x_min = stream.read_double("full extent x min")
@@ -172,7 +183,7 @@ class Map(Object):
 
         bookmark_count = stream.read_int("number of bookmarks")
         for i in range(bookmark_count):
-            self.bookmarks.append(stream.read_object("bookmark {}".format(i + 1)))
+            self.bookmarks.append(stream.read_object(("bookmark {}", i + 1)))
 
         stream.read_ushort("unknown flag", expected=65535)
 
@@ -183,7 +194,7 @@ class Map(Object):
         count = stream.read_int("standalone table count")
         for i in range(count):
             self.standalone_tables.append(
-                stream.read_object("standalone table {}".format(i + 1))
+                stream.read_object(("standalone table {}", i + 1))
             )
 
         self.illumination_properties = stream.read_object("illumination")
@@ -263,13 +274,13 @@ class Map(Object):
             count = stream.read_int("masked count")
             for i in range(count):
                 masked_layer = stream.read_object(
-                    "masked layer {}".format(i + 1), expect_existing=True
+                    ("masked layer {}", i + 1), expect_existing=True
                 )
                 masking_count = stream.read_int("masked by count")
                 masked = []
                 for j in range(masking_count):
                     masked_by = stream.read_object(
-                        "masked by layer {}".format(j + 1), expect_existing=True
+                        ("masked by layer {}", j + 1), expect_existing=True
                     )
                     if version > 30:
                         levels = stream.read_string("levels")
@@ -301,18 +312,18 @@ class Map(Object):
             if groups:
                 for i in range(len(groups)):
                     stream.read_ushort(
-                        "unknown masking related {}".format(i + 1), expected=(0, 1, 2)
+                        ("unknown masking related {}", i + 1), expected=(0, 1, 2)
                     )
                     masked_count = stream.read_int("number of masked layers in group")
                     for j in range(masked_count):
-                        stream.read_object("layer BEING MASKED ref {}".format(j + 1))
+                        stream.read_object(("layer BEING MASKED ref {}", j + 1))
                         masking_count = stream.read_int("number of masking layers")
                         for k in range(masking_count):
-                            stream.read_object("LAYER MASKING ref {}".format(k + 1))
+                            stream.read_object(("LAYER MASKING ref {}", k + 1))
                             stream.read_string("symbol levels")
 
                     stream.read_ushort(
-                        "unknown masking related flag {}".format(i + 1),
+                        ("unknown masking related flag {}", i + 1),
                         expected=(0, 65535),
                     )
 
@@ -336,7 +347,7 @@ class Map(Object):
             count = stream.read_int("count of clipping exempt layers")
             for i in range(count):
                 self.clipping_exempt_layers.append(
-                    stream.read_object("clipping exempt layer {}".format(i + 1))
+                    stream.read_object(("clipping exempt layer {}", i + 1))
                 )
 
             self.clipping_type = stream.read_int("clipping type")
@@ -356,7 +367,7 @@ class Map(Object):
         if version > 35:
             scale_count = stream.read_int("scale count")
             for i in range(scale_count):
-                self.scales.append(stream.read_double("scale {}".format(i + 1)))
+                self.scales.append(stream.read_double(("scale {}", i + 1)))
 
             stream.read_int("unknown", expected=0)
 
@@ -37,11 +37,11 @@ class MapFrame(Element):
         if version >= 4:
             count = stream.read_int("grid count")
             for i in range(count):
-                self.grids.append(stream.read_object("grid {}".format(i + 1)))
+                self.grids.append(stream.read_object(("grid {}", i + 1)))
 
             count = stream.read_int("locator count")
             for i in range(count):
-                self.locators.append(stream.read_object("locator {}".format(i + 1)))
+                self.locators.append(stream.read_object(("locator {}", i + 1)))
         else:
             extent_type = stream.read_int("maybe extent type??")
             if extent_type in (0, 1, 2):
@@ -52,11 +52,11 @@ class MapFrame(Element):
 
             count = stream.read_int("grid count")
             for i in range(count):
-                self.grids.append(stream.read_object("grid {}".format(i + 1)))
+                self.grids.append(stream.read_object(("grid {}", i + 1)))
 
             count = stream.read_int("locator count")
             for i in range(count):
-                self.locators.append(stream.read_object("locator {}".format(i + 1)))
+                self.locators.append(stream.read_object(("locator {}", i + 1)))
 
         internal_version = stream.read_ushort("internal version", expected=(1, 2))
         stream.read_ushort("unknown", expected=(2, 3))
@@ -32,9 +32,9 @@ class MapOptimizationLayoutExtension(Object):
             stream.read_int("unknown", expected=(10009, 24033, 30005))
             stream.read_int("unknown", expected=(1, 2))
             stream.read_object("converter option")
-            object_count = stream.read_int("unknown object count {}".format(i + 1))
+            object_count = stream.read_int(("unknown object count {}", i + 1))
             for j in range(object_count):
-                stream.read_object("linked object {}".format(j + 1))
+                stream.read_object(("linked object {}", j + 1))
 
         if version > 1:
             stream.read_string("unknown", expected="")
@@ -43,13 +43,11 @@ class MapServerIdentifySublayer(Object):
         stream.read_ushort("unknown", expected=(0, 0xFFFF))
         child_count = stream.read_int("child count")
         for i in range(child_count):
-            self.children.append(stream.read_object("child {}".format(i + 1)))
+            self.children.append(stream.read_object(("child {}", i + 1)))
 
         legend_count = stream.read_int("legend count")
         for i in range(legend_count):
-            self.legend_groups.append(
-                stream.read_object("legend group {}".format(i + 1))
-            )
+            self.legend_groups.append(stream.read_object(("legend group {}", i + 1)))
 
         stream.read_int("unknown", expected=0)
         stream.read_int("unknown", expected=0)
@@ -78,7 +76,7 @@ class MapServerIdentifySublayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
@@ -58,6 +58,10 @@ class MapServerLayer(Object):
     def compatible_versions():
         return [6, 10, 13, 14]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):
         self.name = stream.read_string("name")
         stream.read_string("unknown", expected="")
@@ -78,7 +82,7 @@ class MapServerLayer(Object):
 
         count = stream.read_int("sub layer count")
         for i in range(count):
-            self.children.append(stream.read_object("sub layer {}".format(i)))
+            self.children.append(stream.read_object(("sub layer {}", i)))
 
         self.background_color = stream.read_object("background color")
 
@@ -90,7 +94,7 @@ class MapServerLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
@@ -180,13 +184,11 @@ class MapServerBasicSublayer(Object):
 
         count = stream.read_int("sub layer count")
         for i in range(count):
-            self.sublayers.append(stream.read_object("sublayer {}".format(i + 1)))
+            self.sublayers.append(stream.read_object(("sublayer {}", i + 1)))
 
         count = stream.read_int("legend group count")
         for i in range(count):
-            self.legend_groups.append(
-                stream.read_object("legend group {}".format(i + 1))
-            )
+            self.legend_groups.append(stream.read_object(("legend group {}", i + 1)))
 
         stream.read_int("unknown", expected=0)
         stream.read_int("unknown", expected=0)
@@ -213,7 +215,7 @@ class MapServerBasicSublayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
@@ -286,13 +288,11 @@ class MapServerSubLayer(Object):
 
         child_count = stream.read_int("child count")
         for i in range(child_count):
-            self.children.append(stream.read_object("child {}".format(i + 1)))
+            self.children.append(stream.read_object(("child {}", i + 1)))
 
         count = stream.read_int("legend group count")
         for i in range(count):
-            self.legend_groups.append(
-                stream.read_object("legend group {}".format(i + 1))
-            )
+            self.legend_groups.append(stream.read_object(("legend group {}", i + 1)))
 
         stream.read_int("unknown", expected=0)
         stream.read_int("unknown", expected=0)
@@ -321,7 +321,7 @@ class MapServerSubLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
@@ -32,6 +32,10 @@ class MapServerRESTLayer(Object):
     def compatible_versions():
         return [7]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):
         self.name = stream.read_string("name")
         self.url = stream.read_string("url")
@@ -94,11 +98,11 @@ class MapServerRESTLayer(Object):
 
         count = stream.read_int("sub layer count")
         for i in range(count):
-            self.sublayers.append(stream.read_object("sub layer {}".format(i + 1)))
+            self.sublayers.append(stream.read_object(("sub layer {}", i + 1)))
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
 
@@ -203,7 +207,7 @@ class MapServerRESTSubLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
 
@@ -234,7 +238,7 @@ class MapServerRESTSubLayer(Object):
 
         count = stream.read_int("child count")
         for i in range(count):
-            self.children.append(stream.read_object("child {}".format(i + 1)))
+            self.children.append(stream.read_object(("child {}", i + 1)))
 
         stream.read_ushort("unknown")  # , expected=(0, 74))
         stream.read_ushort("unknown")  # , expected=0)
@@ -64,7 +64,7 @@ class MaplexLabelStackingProperties(Object):
         self.stacking_justification = stream.read_int("stacking justification")
         stacking_separator_count = stream.read_int("stacking_separator_count")
         for i in range(stacking_separator_count):
-            separator = stream.read_stringv2("separator {}".format(i + 1))
+            separator = stream.read_stringv2(("separator {}", i + 1))
             visible = stream.read_ushort("visible") != 0
             forced_split = stream.read_ushort("forced split") != 0
             split_after = stream.read_ushort("split after") != 0
@@ -23,7 +23,7 @@ class MaplexDictionaries(Object):
     def read(self, stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.dictionaries.append(stream.read_object("Dictionary {}".format(i + 1)))
+            self.dictionaries.append(stream.read_object(("Dictionary {}", i + 1)))
 
     def to_dict(self):
         return {"dictionaries": [e.to_dict() for e in self.dictionaries]}
@@ -50,7 +50,7 @@ class MaplexDictionary(Object):
     def read(self, stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.entries.append(stream.read_object("Entry {}".format(i + 1)))
+            self.entries.append(stream.read_object(("Entry {}", i + 1)))
         self.name = stream.read_string("name")
 
     def to_dict(self):
@@ -182,7 +182,7 @@ class MaplexKeyNumberGroups(Object):
     def read(self, stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.groups.append(stream.read_object("group {}".format(i + 1)))
+            self.groups.append(stream.read_object(("group {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"groups": [g.to_dict() for g in self.groups]}
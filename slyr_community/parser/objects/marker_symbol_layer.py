@@ -81,7 +81,7 @@ class SimpleMarkerSymbol(MarkerSymbolLayer):
                     hex(stream.tell() - 4), type_code
                 )
             )
-        stream.log("found a {}".format(type_dict[type_code]), 4)
+        stream.log(("found a {}", type_dict[type_code]), 4)
         self.type = type_dict[type_code]
 
         self.symbol_level = SymbolLayer.read_symbol_level(stream)
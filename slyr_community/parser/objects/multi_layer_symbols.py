@@ -52,9 +52,7 @@ class MultiLayerLineSymbol(MultiLayerSymbol):
 
         number_layers = stream.read_uint("layer count")
         for i in range(number_layers):
-            layer = stream.read_object(
-                "symbol layer {}/{}".format(i + 1, number_layers)
-            )
+            layer = stream.read_object(("symbol layer {}/{}", i + 1, number_layers))
             self.layers.extend([layer])
 
         for layer in self.layers:
@@ -87,9 +85,7 @@ class MultiLayerFillSymbol(MultiLayerSymbol):
 
         number_layers = stream.read_int("layers")
         for i in range(number_layers):
-            layer = stream.read_object(
-                "symbol layer {}/{}".format(i + 1, number_layers)
-            )
+            layer = stream.read_object(("symbol layer {}/{}", i + 1, number_layers))
             self.layers.extend([layer])
 
         for layer in self.layers:
@@ -156,9 +152,7 @@ class MultiLayerMarkerSymbol(MultiLayerSymbol):
         # useful stuff
         number_layers = stream.read_int("layers")
         for i in range(number_layers):
-            layer = stream.read_object(
-                "symbol layer {}/{}".format(i + 1, number_layers)
-            )
+            layer = stream.read_object(("symbol layer {}/{}", i + 1, number_layers))
             self.layers.extend([layer])
 
         for layer in self.layers:
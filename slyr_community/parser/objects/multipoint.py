@@ -3,6 +3,8 @@
 Serializable object subclass
 """
 
+from array import array
+
 from .geometry import Geometry
 from ..stream import Stream
 
@@ -16,9 +18,12 @@ class Multipoint(Geometry):
     def cls_id():
         return "00a5cb40-52da-11d0-a8f2-00608c85ede5"
 
+    __slots__ = ("coordinates",)
+
     def __init__(self):  # pylint: disable=useless-super-delegation
         super().__init__()
-        self.points = []
+        # interleaved x/y coordinates of all points
+        self.coordinates = array("d")
 
     @staticmethod
     def compatible_versions():
@@ -35,10 +40,7 @@ class Multipoint(Geometry):
         self.y_max = stream.read_double("y max")
 
         count = stream.read_int("count")
-        for i in range(count):
-            x = stream.read_double("x {}".format(i + 1))
-            y = stream.read_double("y {}".format(i + 1))
-            self.points.append([x, y])
+        self.coordinates = stream.read_doubles(count * 2, "points")
 
         # likely here:
         # - if wkb type is 18 we need to read two doubles of z min/max, then
@@ -50,6 +52,20 @@ class Multipoint(Geometry):
             raise AssertionError(f"{stream.tell()}, {size + start}")
         self.crs = stream.read_object("crs")
 
+    @property
+    def points(self):
+        """
+        Returns a list of the [x, y] coordinates of all points.
+
+        The list is created on each call, modifying it does not
+        affect the geometry.
+        """
+        return [[x, y] for x, y in zip(self.coordinates[0::2], self.coordinates[1::2])]
+
+    @points.setter
+    def points(self, points):
+        self.coordinates = array("d", [c for p in points for c in p[:2]])
+
     def to_dict(self):  # pylint: disable=method-hidden
         res = super().to_dict()
         res["points"] = self.points
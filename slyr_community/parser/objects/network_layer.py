@@ -36,6 +36,11 @@ class NetworkLayer(Object):
     def compatible_versions():
         return None
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        stream.read_ushort("unknown")
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):
         stream.read_ushort("unknown", expected=0)
         self.name = stream.read_string("name")
@@ -58,7 +63,7 @@ class NetworkLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
 
@@ -93,8 +98,8 @@ class NetworkLayer(Object):
         count = stream.read_int("count")
 
         for i in range(count):
-            _ = stream.read_ushort("renderer visible {} ".format(i + 1)) != 0
-            stream.read_object("renderer {}".format(i + 1))
+            _ = stream.read_ushort(("renderer visible {} ", i + 1)) != 0
+            stream.read_object(("renderer {}", i + 1))
 
             stream.read_int("unknown", expected=0)
             stream.read_int("unknown", expected=0)
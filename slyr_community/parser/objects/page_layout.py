@@ -52,13 +52,13 @@ class PageLayout(Object):
         count = stream.read_int("element count??")
         for i in range(count):
             if version > 6:
-                size = stream.read_int("size of element {}".format(i + 1))
+                size = stream.read_int(("size of element {}", i + 1))
                 stream.read_int("unknown", expected=0)  # maybe some element flags?
             else:
                 size = None
 
             start = stream.tell()
-            self.elements.append(stream.read_object("element {}".format(i + 1)))
+            self.elements.append(stream.read_object(("element {}", i + 1)))
             if version > 6:
                 if stream.tell() != size + start:
                     raise AssertionError(
@@ -78,13 +78,13 @@ class PageLayout(Object):
         count = stream.read_int("count")
         for i in range(count):
             stream.read_raw_clsid(
-                "guide snap {}".format(i),
+                ("guide snap {}", i),
                 expected="fc27fab1-db88-11d1-8778-0000f8751720",
             )
         count = stream.read_int("count")
         for i in range(count):
             stream.read_raw_clsid(
-                "unknown {}".format(i + 1),
+                ("unknown {}", i + 1),
                 expected=(
                     "fc27fab1-db88-11d1-8778-0000f8751720",
                     "fc27fab2-db88-11d1-8778-0000f8751720",
@@ -142,7 +142,7 @@ class PageLayout(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
 
@@ -181,7 +181,7 @@ class PageLayout(Object):
 
         count = stream.read_int("data frame count?")
         for i in range(count):
-            stream.read_int("unknown {}".format(i + 1), expected=0)
+            stream.read_int(("unknown {}", i + 1), expected=0)
 
         if version > 14:
             for i in range(count):
@@ -137,7 +137,7 @@ class BmpPicture(Picture):
         """
         Reads the object from the given stream
         """
-        stream.log("Reading pixmap of type {}".format(version))
+        stream.log(("Reading pixmap of type {}", version))
         self.content = self.read_from_stream(stream)
 
     def read_from_stream(self, stream: Stream):
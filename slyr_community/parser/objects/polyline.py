@@ -3,11 +3,11 @@
 Serializable object subclass
 """
 
-from .geometry import Geometry
+from .geometry import MultiPartGeometry
 from ..stream import Stream
 
 
-class Polyline(Geometry):
+class Polyline(MultiPartGeometry):
     """
     Polyline
     """
@@ -16,9 +16,7 @@ class Polyline(Geometry):
     def cls_id():
         return "30707210-52d5-11d0-a8f2-00608c85ede5"
 
-    def __init__(self):  # pylint: disable=useless-super-delegation
-        super().__init__()
-        self.parts = []
+    __slots__ = ()
 
     @staticmethod
     def compatible_versions():
@@ -37,21 +35,7 @@ class Polyline(Geometry):
         parts = stream.read_int("parts")
         total_vertices = stream.read_int("total vertices")
         if total_vertices > 0:
-            index = stream.read_int("first index", expected=0)
-            counts = []
-            for p in range(1, parts):
-                next_index = stream.read_int("index {}".format(p + 1))
-                counts.append(next_index - index)
-                index = next_index
-            counts.append(total_vertices - index)
-
-            for count in counts:
-                part = []
-                for i in range(count):
-                    x = stream.read_double("x {}".format(i + 1))
-                    y = stream.read_double("y {}".format(i + 1))
-                    part.append((x, y))
-                self.parts.append(part)
+            self.read_parts(stream, parts, total_vertices)
 
             # likely here:
             # - if polyline z (wkb_type = 13), read two doubles of z range,
@@ -71,8 +55,3 @@ class Polyline(Geometry):
             raise AssertionError(f"{stream.tell() - start}, {size}")
 
         self.crs = stream.read_object("crs")
-
-    def to_dict(self):  # pylint: disable=method-hidden
-        res = super().to_dict()
-        res["parts"] = self.parts
-        return res
@@ -6,6 +6,7 @@ COMPLETE INTERPRETATION
 """
 
 from ..object import Object
+from .colors import RgbColor
 
 
 class ColorRamp(Object):
@@ -91,8 +92,21 @@ class PresetColorRamp(ColorRamp):
         stream.read(4)
 
         color_count = stream.read_uint("Number of colors")
-        for i in range(color_count):
-            self.colors.append(stream.read_object("Color {}".format(i + 1)))
+
+        # RGB colors are converted from CIELAB in one batch after they are read.
+        # When debugging they are converted one by one, so that the logged
+        # colors are correct.
+        batch = stream.pending_lab_colors is None and not stream.debug
+        if batch:
+            stream.pending_lab_colors = []
+        try:
+            for i in range(color_count):
+                self.colors.append(stream.read_object(("Color {}", i + 1)))
+            if batch:
+                RgbColor.convert_lab_colors(stream.pending_lab_colors)
+        finally:
+            if batch:
+                stream.pending_lab_colors = None
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"colors": [c.to_dict() for c in self.colors]}
@@ -127,11 +141,11 @@ class MultiPartColorRamp(ColorRamp):
         self.ramp_name_type = stream.read_stringv2("ramp name type")
         count = stream.read_uint("Number of parts")
         for i in range(count):
-            self.parts.append(stream.read_object("Part {}".format(i + 1)))
+            self.parts.append(stream.read_object(("Part {}", i + 1)))
 
         if version > 1:
             for i in range(count):
-                self.part_lengths.append(stream.read_double("Length {}".format(i + 1)))
+                self.part_lengths.append(stream.read_double(("Length {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {
@@ -52,7 +52,7 @@ class RasterCatalogLayer(Object):
     def read(self, stream: Stream, version):
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 4
+            size = stream.read_int(("size {}", i)) + 4
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
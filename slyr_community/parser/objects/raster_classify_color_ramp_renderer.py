@@ -70,7 +70,7 @@ class RasterClassifyColorRampRenderer(RasterRenderer):
         class_count = stream.read_int("class count")
         breaks = []
         for i in range(class_count):
-            breaks.append(stream.read_double("max {}".format(i + 1)))
+            breaks.append(stream.read_double(("max {}", i + 1)))
         self.breaks = breaks
 
         self.sort_classes_ascending = stream.read_ushort("sort classes ascending") != 0
@@ -87,9 +87,7 @@ class RasterClassifyColorRampRenderer(RasterRenderer):
         if has_excluded_values:
             count = stream.read_int("excluded range count")
             for i in range(count):
-                self.excluded_ranges.append(
-                    stream.read_double("range {}".format(i + 1))
-                )
+                self.excluded_ranges.append(stream.read_double(("range {}", i + 1)))
 
         has_excluded_ranges = stream.read_ushort("has excluded ranges") != 0
         stream.read_ushort("unknown", expected=0)
@@ -100,9 +98,7 @@ class RasterClassifyColorRampRenderer(RasterRenderer):
         if has_excluded_ranges:
             count = stream.read_int("excluded range count")
             for i in range(count):
-                self.excluded_values.append(
-                    stream.read_double("range {}".format(i + 1))
-                )
+                self.excluded_values.append(stream.read_double(("range {}", i + 1)))
 
         self.excluded_show_class = stream.read_ushort("excluded show class") != 0
         self.legend = stream.read_object("excluded legend class")
@@ -30,11 +30,11 @@ class RasterColorMapRenderer(RasterRenderer):
 
         count = stream.read_int("group count")
         for i in range(count):
-            self.groups.append(stream.read_object("legend group {}".format(i + 1)))
+            self.groups.append(stream.read_object(("legend group {}", i + 1)))
 
         count = stream.read_int("colors count?")
         for i in range(count):
-            self.values.append(stream.read_int("value {}".format(i + 1)))
+            self.values.append(stream.read_int(("value {}", i + 1)))
 
         super().read(stream, version)
 
@@ -27,7 +27,7 @@ class RasterDiscreteColorRenderer(RasterRenderer):
 
         self.number_of_colors = stream.read_int("number of colors")
         for i in range(self.number_of_colors):
-            stream.read_int("unknown {}".format(i + 1))
+            stream.read_int(("unknown {}", i + 1))
 
         self.ramp_name = stream.read_string("ramp name")
         self.color_ramp = stream.read_object("color ramp")
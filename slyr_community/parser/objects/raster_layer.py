@@ -69,6 +69,11 @@ class RasterLayer(Object):
     def compatible_versions():
         return [2, 7, 11, 12, 13, 16, 17, 18]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        stream.read_ushort("unknown")
+        return {"name": stream.read_string("name")}
+
     # pylint: disable=too-many-branches, too-many-statements
     def read(self, stream: Stream, version):
         stream.custom_props["raster_layer_version"] = version
@@ -114,7 +119,7 @@ class RasterLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 4
+            size = stream.read_int(("size {}", i)) + 4
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
@@ -150,7 +155,7 @@ class RasterLayer(Object):
 
         number_of_relations = stream.read_int("number of relations")
         for i in range(number_of_relations):
-            self.relations.append(stream.read_object("relation {}".format(i + 1)))
+            self.relations.append(stream.read_object(("relation {}", i + 1)))
 
         self.custom_extent = stream.read_object(
             'custom extent/"current setting of the layer"'
@@ -239,7 +244,7 @@ class RasterLayer(Object):
         if version > 16:
             count = stream.read_int("number of histograms")
             for i in range(count):
-                stream.read_object("histogram {}".format(i + 1))
+                stream.read_object(("histogram {}", i + 1))
 
     # pylint: enable=too-many-branches, too-many-statements
 
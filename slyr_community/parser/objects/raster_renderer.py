@@ -132,7 +132,7 @@ class RasterRenderer(Object):
                     raise AssertionError("Size mismatch")
                 # some per band value?
                 for i in range(3):
-                    res = stream.read_int("unknown {}".format(i + 1))
+                    res = stream.read_int(("unknown {}", i + 1))
                     if res == 0:
                         # probably a width/height in pixels
                         stream.read_ushort("unknown a", expected=(0, 60020, 65504))
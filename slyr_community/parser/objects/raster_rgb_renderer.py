@@ -252,7 +252,7 @@ class RasterRgbRendererColorComponents(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.components.append(stream.read_double("component {}".format(i + 1)))
+            self.components.append(stream.read_double(("component {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"components": self.components}
@@ -309,7 +309,7 @@ class RasterRgbPanSharpeningProperties(Object):
 
         band_count = stream.read_int("band count")
         for i in range(band_count):
-            stream.read_string("band name {}".format(i + 1))
+            stream.read_string(("band name {}", i + 1))
 
         self.transform = stream.read_object("transform")
         self.extent = stream.read_object("envelope")
@@ -318,7 +318,7 @@ class RasterRgbPanSharpeningProperties(Object):
         if res:
             band_count = stream.read_int("band count")
             for i in range(band_count):
-                stream.read_string("band name {}".format(i + 1))
+                stream.read_string(("band name {}", i + 1))
             stream.read_object("unknown transform")
             stream.read_object("unknown envelope")
 
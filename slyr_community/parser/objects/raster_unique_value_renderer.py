@@ -56,9 +56,7 @@ class RasterUniqueValueRenderer(RasterRenderer):
 
         count = stream.read_int("group count")
         for i in range(count):
-            self.legend_groups.append(
-                stream.read_object("legend group {}".format(i + 1))
-            )
+            self.legend_groups.append(stream.read_object(("legend group {}", i + 1)))
 
         if version <= 2:
             stream.read_double("unknown", expected=0)
@@ -81,15 +79,15 @@ class RasterUniqueValueRenderer(RasterRenderer):
                 num_values += 1
                 # variant type
                 value_type = stream.read_ushort(
-                    "value type {}".format(j + 1), expected=(5, 8)
+                    ("value type {}", j + 1), expected=(5, 8)
                 )
 
-                stream.read_ushort("unknown {}".format(j + 1))  # , expected=0)
-                stream.read_int("unknown {}".format(j + 1))  # , expected=0)
+                stream.read_ushort(("unknown {}", j + 1))  # , expected=0)
+                stream.read_int(("unknown {}", j + 1))  # , expected=0)
 
-                stream.read_double("unknown {}".format(j + 1))  # , expected=0) value??
+                stream.read_double(("unknown {}", j + 1))  # , expected=0) value??
 
-                values.append(stream.read_variant(value_type, "value {}".format(j + 1)))
+                values.append(stream.read_variant(value_type, ("value {}", j + 1)))
 
             if values:
                 self.values.append(values)
@@ -105,7 +103,7 @@ class RasterUniqueValueRenderer(RasterRenderer):
             prev_count = count
             count = stream.read_int("value count", expected=prev_count)
             for i in range(count):
-                v = stream.read_double("value {}".format(i + 1))
+                v = stream.read_double(("value {}", i + 1))
                 c = stream.read_int("count")
                 self.backup_value_count.append([v, c])
 
@@ -40,30 +40,30 @@ class RepresentationRenderer(Object):
         stream.read_int("unknown", expected=0)
         count = stream.read_int("feature class count")
         for i in range(count):
-            stream.read_object("class {}".format(i + 1))
-            stream.read_object("relationship {}".format(i + 1))
+            stream.read_object(("class {}", i + 1))
+            stream.read_object(("relationship {}", i + 1))
 
         stream.read_ushort("unknown", expected=(0, 65535))
 
         count = stream.read_int("count")
         for i in range(count):
-            stream.read_int("rule id? {}".format(i + 1))
+            stream.read_int(("rule id? {}", i + 1))
 
-            some_count = stream.read_int("some count {}".format(i + 1))
+            some_count = stream.read_int(("some count {}", i + 1))
             for j in range(some_count):
                 stream.read_int(
-                    "unknown inner a {}".format(j),
+                    ("unknown inner a {}", j),
                     expected=0xFFFFFFFF if j == 0 else j - 1,
                 )
                 stream.read_int(
-                    "unknown inner b {}".format(j),
+                    ("unknown inner b {}", j),
                     expected=(0xFFFFFFFF, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
                 )
 
         count = stream.read_int("count")
         for i in range(count):
             self.hidden_legend_items.append(
-                stream.read_int("hidden legend item {}".format(i + 1))
+                stream.read_int(("hidden legend item {}", i + 1))
             )
 
     def to_dict(self):  # pylint: disable=method-hidden
@@ -30,32 +30,32 @@ class RepresentationRule(Object):
 
         count = stream.read_int("effect count")
         for i in range(count):
-            stream.read_string("effect name {}".format(i + 1))
-            size = stream.read_int("size {}".format(i + 1))
+            stream.read_string(("effect name {}", i + 1))
+            size = stream.read_int(("size {}", i + 1))
             stream.read_int("unknown", expected=0)
             start = stream.tell()
-            self.effects.append(stream.read_object("effect {}".format(i + 1)))
+            self.effects.append(stream.read_object(("effect {}", i + 1)))
             if stream.tell() != start + size:
                 raise AssertionError("Size mismatch")
 
         stream.read_int("total objects?")
         count = stream.read_int("layer count")
         for i in range(count):
-            self.layers.append(stream.read_object("layer {}".format(i + 1)))
+            self.layers.append(stream.read_object(("layer {}", i + 1)))
 
         field_override_count = stream.read_int("field override count")
         for i in range(field_override_count):
             # note effect_index is 1 based
-            effect_index = stream.read_int("effect_index {}".format(i + 1))
-            attribute_index = stream.read_int("attribute index {}".format(i + 1))
-            field_name = stream.read_string("field name {}".format(i + 1))
+            effect_index = stream.read_int(("effect_index {}", i + 1))
+            attribute_index = stream.read_int(("attribute index {}", i + 1))
+            field_name = stream.read_string(("field name {}", i + 1))
             self.field_overrides[effect_index][attribute_index] = field_name
 
         count = stream.read_int("unknown count")
         # expected=len(self.effects) + len(self.layers))
         # maybe something to do with ordering?
         for i in range(count):
-            stream.read_int("unknown {}".format(i + 1))  # , expected=i + 1)
+            stream.read_int(("unknown {}", i + 1))  # , expected=i + 1)
 
         self.map_level = stream.read_int("map level")
 
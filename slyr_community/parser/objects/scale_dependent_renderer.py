@@ -28,8 +28,8 @@ class ScaleDependentRenderer(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.breaks.append(stream.read_double("break {}".format(i + 1)))
-            self.renderers.append(stream.read_object("renderer {}".format(i + 1)))
+            self.breaks.append(stream.read_double(("break {}", i + 1)))
+            self.renderers.append(stream.read_object(("renderer {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {
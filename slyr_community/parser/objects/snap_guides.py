@@ -23,7 +23,7 @@ class SnapGuides(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.guides.append(stream.read_double("guide {}".format(i + 1)))
+            self.guides.append(stream.read_double(("guide {}", i + 1)))
         stream.read_ushort("visible??")  # , expected=65535)
         stream.read_int("draw level??", expected=32)
 
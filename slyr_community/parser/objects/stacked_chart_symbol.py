@@ -57,8 +57,8 @@ class StackedChartSymbol(Object):
 
         count = stream.read_int("count")
         for i in range(count):
-            self.symbols.append(stream.read_object("fill symbol {}".format(i + 1)))
-            self.values.append(stream.read_double("value {}".format(i + 1)))
+            self.symbols.append(stream.read_object(("fill symbol {}", i + 1)))
+            self.values.append(stream.read_double(("value {}", i + 1)))
 
         self.callout = stream.read_object("line callout")
 
@@ -62,7 +62,7 @@ class StandaloneTable(Object):
 
         rel_count = stream.read_int("number of relationships")
         for i in range(rel_count):
-            self.relations.append(stream.read_object("relation {}".format(i + 1)))
+            self.relations.append(stream.read_object(("relation {}", i + 1)))
 
         stream.read_int("unknown", expected=0)
         stream.read_int("unknown", expected=0)
@@ -111,7 +111,7 @@ class StandaloneTable(Object):
 
                     i += 1
                     first = False
-                    r = stream.read_signed_int("unknown sequence value {}".format(i))
+                    r = stream.read_signed_int(("unknown sequence value {}", i))
 
         stream.read_int("unknown", expected=0)
 
@@ -168,9 +168,7 @@ class StandaloneTable(Object):
         if version > 13:
             remote_count = stream.read_int("remote object count")
             for i in range(remote_count):
-                size = (
-                    stream.read_int("size {}".format(i)) + 20
-                )  # 20 = object header size
+                size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
                 pos = stream.tell()
                 stream.read_int("unknown", expected=0)
                 try:
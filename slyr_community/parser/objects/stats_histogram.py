@@ -41,11 +41,9 @@ class StatsHistogram(Object):
 
         if version == 1:
             # wrong!
-            for i in range(256):
-                stream.read_double("unknown {}".format(i + 1))
+            stream.read_doubles(256, "unknown")
         elif version in (2, 4):
-            for i in range(256):
-                stream.read_double("unknown {}".format(i + 1))
+            stream.read_doubles(256, "unknown")
 
             # looks like a scale?
             stream.read_double("unknown")
@@ -55,8 +53,7 @@ class StatsHistogram(Object):
                 stream.read_int("unknown")
         else:
             count = stream.read_int("count?")
-            for i in range(count):
-                stream.read_double("unknown {}".format(i + 1))
+            stream.read_doubles(count, "unknown")
 
             stream.read_double(
                 "unknown"
@@ -65,8 +62,7 @@ class StatsHistogram(Object):
                 "unknown"
             )  # expected=(0, 1, 0.6196078431372549, 1.008130081300813, 1.0076923076923077, 1.0067567567567568, 1.005813953488372, 1.003921568627451))
             count = stream.read_int("unknown count")
-            for i in range(count):
-                stream.read_double("unknown")
+            stream.read_doubles(count, "unknown")
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {
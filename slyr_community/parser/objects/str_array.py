@@ -23,7 +23,7 @@ class StrArray(Object):
     def read(self, stream: Stream, version):
         count = stream.read_int("count")
         for i in range(count):
-            self.strings.append(stream.read_string("string {}".format(i + 1)))
+            self.strings.append(stream.read_string(("string {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {"strings": self.strings}
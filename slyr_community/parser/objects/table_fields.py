@@ -46,13 +46,13 @@ class TableFields(Object):
 
         count = stream.read_int("field count")
         for i in range(count):
-            field_name = stream.read_string("field {}".format(i + 1))
-            field_width = stream.read_int("field width {}".format(i + 1))
+            field_name = stream.read_string(("field {}", i + 1))
+            field_width = stream.read_int(("field width {}", i + 1))
             self.field_widths[field_name] = field_width
 
         for i in range(count):
-            self.fields.append(stream.read_object("field {}".format(i + 1)))
-            self.field_info.append(stream.read_object("field info {}".format(i + 1)))
+            self.fields.append(stream.read_object(("field {}", i + 1)))
+            self.field_info.append(stream.read_object(("field info {}", i + 1)))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {
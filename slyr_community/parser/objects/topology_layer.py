@@ -36,6 +36,10 @@ class TopologyLayer(Object):
     def compatible_versions():
         return [5]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):
         self.name = stream.read_string("name")
         self.visible = stream.read_ushort("visible") != 0
@@ -65,8 +69,8 @@ class TopologyLayer(Object):
 
         count = stream.read_int("unknown count")
         for i in range(count):
-            stream.read_int("unknown {}".format(i + 1))
-            stream.read_ushort("unknown {}".format(i + 1))
+            stream.read_int(("unknown {}", i + 1))
+            stream.read_ushort(("unknown {}", i + 1))
 
     def to_dict(self):  # pylint: disable=method-hidden
         return {}
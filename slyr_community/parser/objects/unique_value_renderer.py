@@ -52,7 +52,7 @@ class UniqueValueRenderer(VectorRendererBase):
 
         group_count = stream.read_uint("group count")
         for i in range(group_count):
-            self.groups.append(stream.read_object("legend group {}".format(i + 1)))
+            self.groups.append(stream.read_object(("legend group {}", i + 1)))
 
         _ = stream.read_object("unknown")
 
@@ -24,7 +24,7 @@ class UniqueValues(Object):
         stream.read_ushort("unknown", expected=0)
         count = stream.read_int("count")
         for i in range(count):
-            variant_type = stream.read_ushort("type {}".format(i + 1))
+            variant_type = stream.read_ushort(("type {}", i + 1))
             stream.read_ushort("unknown")  # , expected=(0, 19, 329))
             stream.read_int("unknown")  # , expected=(0, 50878752))
             stream.read_int("unknown")  # sometimes 0, sometimes same as value?
@@ -68,7 +68,7 @@ class WmsMapLayer(Object):
         stream.read_int("unknown", expected=0)
         root_group_count = stream.read_int("root group count")
         for i in range(root_group_count):
-            self.children.append(stream.read_object("directory {}".format(i + 1)))
+            self.children.append(stream.read_object(("directory {}", i + 1)))
 
         stream.read_ushort("unknown flag")
         self.description = stream.read_string("description")
@@ -80,7 +80,7 @@ class WmsMapLayer(Object):
 
         remote_count = stream.read_int("remote object count")
         for i in range(remote_count):
-            size = stream.read_int("size {}".format(i)) + 20  # 20 = object header size
+            size = stream.read_int(("size {}", i)) + 20  # 20 = object header size
             pos = stream.tell()
             stream.read_int("unknown", expected=0)
             try:
@@ -152,6 +152,10 @@ class WmsGroupLayer(Object):
     def compatible_versions():
         return [1]
 
+    @classmethod
+    def read_deferred_attributes(cls, stream: Stream, version) -> dict:
+        return {"name": stream.read_string("name")}
+
     def read(self, stream: Stream, version):
         self.name = stream.read_string("name")
         self.visible = stream.read_ushort("visibility") != 0
@@ -164,7 +168,7 @@ class WmsGroupLayer(Object):
 
         count = stream.read_int("child count")
         for i in range(count):
-            self.children.append(stream.read_object("child {}".format(i + 1)))
+            self.children.append(stream.read_object(("child {}", i + 1)))
 
         stream.read_ushort("unknown flag")
         stream.read_int("unknown", expected=0)
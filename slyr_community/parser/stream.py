@@ -6,11 +6,11 @@ Binary stream representing persistent objects
 # pylint: disable=too-many-lines
 
 import binascii
+from array import array
 import os
 from datetime import datetime, timedelta
-from io import BytesIO
-from struct import unpack, error
-from typing import Optional, List
+from struct import Struct, error
+from typing import Dict, Optional, List, Tuple, Union
 
 from .exceptions import (
     UnsupportedVersionException,
@@ -21,9 +21,34 @@ from .exceptions import (
     UnknownClsidException,
     PartiallyImplementedException,
 )
+from .deferred_object import DeferredObject, ReferenceTableSnapshot
+from .memory_stream import MemoryStream
 from .object import Object
 from .object_registry import ObjectRegistry, REGISTRY
 
+UCHAR = Struct("<B")
+DOUBLE = Struct("<d")
+UINT32 = Struct("<L")
+INT32 = Struct("<i")
+LONG32 = Struct("<l")
+USHORT = Struct("<H")
+
+# a debug label, either a string or a (template, *args) tuple
+DebugLabel = Union[str, Tuple]
+
+
+def debug_label(label: DebugLabel) -> str:
+    """
+    Returns the text for a debug label.
+
+    Labels are either strings, or (template, *args) tuples which are only
+    formatted when debugging, so that call sites don't need to build
+    label strings during normal parsing.
+    """
+    if isinstance(label, tuple):
+        return label[0].format(*(debug_label(arg) for arg in label[1:]))
+    return label
+
 
 class Stream:  # pylint: disable=too-many-public-methods
     """
@@ -69,6 +94,8 @@ class Stream:  # pylint: disable=too-many-public-methods
         :param offset: offset to start reading at
         """
         self.io_stream = io_stream
+        # the original document, for extracting streams from compound documents
+        self._source = io_stream
         self.debug = debug
         self.is_layer = force_layer
         self.debug_depth = 0
@@ -79,6 +106,15 @@ class Stream:  # pylint: disable=too-many-public-methods
         self.tolerant = tolerant
         self.parse_doc_structure_only = parse_doc_structure_only
         self.allow_shortcuts = True
+        # if True, read_deferred_object skips over objects instead of parsing them
+        self.defer_objects = False
+        # deferred objects which have not yet been parsed
+        self.deferred_objects = []
+        # > 0 while parsing deferred objects, which are read out of reference order
+        self._resolve_depth = 0
+        # if a list, RgbColor objects append themselves and their CIELAB values
+        # here instead of converting them, see RgbColor.convert_lab_colors
+        self.pending_lab_colors = None
 
         # OLE document properties
         self.sector_size = 0
@@ -93,7 +129,10 @@ class Stream:  # pylint: disable=too-many-public-methods
         self.directories = {}
         self.first_dir_sector = None
         self.mini_sector_cutoff = 4096
+        self._mini_stream = None
 
+        # byte ranges covered by OLE structures, as (start, end) tuples.
+        # Only populated when debugging.
         self.header_bytes = []
         self.sat_bytes = []
         self.dir_bytes = []
@@ -186,7 +225,7 @@ class Stream:  # pylint: disable=too-many-public-methods
                         self.io_stream = templates_stream
                         count = self.read_int("template count")
                         for i in range(count):
-                            self.read_string("template path {}".format(i + 1))
+                            self.read_string(("template path {}", i + 1))
                             self.read_int("unknown", expected=1)
                         self.read_int("unknown", expected=(3, 5))
 
@@ -270,6 +309,29 @@ class Stream:  # pylint: disable=too-many-public-methods
         if offset > 0:
             self.io_stream.seek(offset)
 
+    @property
+    def io_stream(self):
+        """
+        Returns the underlying file-like object the stream reads from.
+        """
+        return self._io_stream
+
+    @io_stream.setter
+    def io_stream(self, io_stream):
+        """
+        Sets the underlying file-like object to read from.
+
+        MemoryStream objects are unpacked in place, other file-like objects
+        are read into temporary buffers.
+        """
+        self._io_stream = io_stream
+        if isinstance(io_stream, MemoryStream):
+            self._unpack = io_stream.unpack
+        elif io_stream is not None:
+            self._unpack = lambda fmt: fmt.unpack(io_stream.read(fmt.size))
+        else:
+            self._unpack = None
+
     def tell(self) -> int:
         """
         Returns the current position within the stream.
@@ -295,7 +357,7 @@ class Stream:  # pylint: disable=too-many-public-methods
         """
         self.io_stream.seek(self.io_stream.tell() - length)
 
-    def log(self, message: str, offset: int = 0):
+    def log(self, message: DebugLabel, offset: int = 0):
         """
         Logs a debug message
         """
@@ -303,7 +365,7 @@ class Stream:  # pylint: disable=too-many-public-methods
             print(
                 "{}{} at {}".format(
                     "   " * self.debug_depth,
-                    message,
+                    debug_label(message),
                     hex(self.io_stream.tell() - offset),
                 )
             )
@@ -354,8 +416,29 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         self.debug = prev_debug
 
-        for i in range(self.tell()):
-            self.header_bytes.append(i)
+        self._record_bytes(self.header_bytes, 0, self.tell())
+
+    def byte_coverage(self) -> Dict[str, List[int]]:
+        """
+        Returns the byte offsets covered by each OLE structure (only
+        available when debugging)
+        """
+        return {
+            name: [i for start, end in ranges for i in range(start, end)]
+            for name, ranges in (
+                ("header", self.header_bytes),
+                ("sat", self.sat_bytes),
+                ("dir", self.dir_bytes),
+                ("mini_fat", self.mini_fat_bytes),
+            )
+        }
+
+    def _record_bytes(self, target: list, start: int, end: int):
+        """
+        Records a byte range as being covered by an OLE structure, if debugging
+        """
+        if self.debug:
+            target.append((start, end))
 
     def _build_sat(self):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         """
@@ -363,55 +446,46 @@ class Stream:  # pylint: disable=too-many-public-methods
         """
 
         # first 109 entries follow the header
-        self.difat = []
         start = self.tell()
-        for i in range(109):
-            s = self.read_int()
-            if s not in (0xFFFFFFFE, 0xFFFFFFFF):
-                self.difat.append(s)
-
-        for i in range(start, self.tell()):
-            self.sat_bytes.append(i)
+        self.difat = [
+            s for s in self.read_ints(109) if s not in (0xFFFFFFFE, 0xFFFFFFFF)
+        ]
+        self._record_bytes(self.sat_bytes, start, self.tell())
 
         current_sector = self.difat_first_sector
 
         while current_sector not in (0xFFFFFFFE, 0xFFFFFFFF):
             offset = (current_sector + 1) * self.sector_size
             self.seek(offset)
-            for _ in range(127):
-                s = self.read_int()
-                if s not in (0xFFFFFFFE, 0xFFFFFFFF):
-                    self.difat.append(s)
+            self.difat.extend(
+                s for s in self.read_ints(127) if s not in (0xFFFFFFFE, 0xFFFFFFFF)
+            )
 
             current_sector = self.read_int()
 
-            for i in range(offset, self.tell()):
-                self.sat_bytes.append(i)
+            self._record_bytes(self.sat_bytes, offset, self.tell())
 
         self.fat = []
         # read sectors in master sat to build up sat
         for sector in self.difat:
             offset = (sector + 1) * self.sector_size
             self.seek(offset)
-            for _ in range(128):
-                self.fat.append(self.read_int())
+            self.fat.extend(self.read_ints(128))
 
-            for i in range(offset, self.tell()):
-                self.sat_bytes.append(i)
+            self._record_bytes(self.sat_bytes, offset, self.tell())
 
         # mini fat
-        self.mini_fat = []
         small_sat_stream = self._read_fat_stream(
-            self.mini_fat_first, self.mini_fat_sector_count * self.sector_size
+            self.mini_fat_first,
+            self.mini_fat_sector_count * self.sector_size,
+            self.mini_fat_bytes,
         )
         # TODO - use correct length!
-        while True:
-            try:
-                self.mini_fat.append(unpack("<L", small_sat_stream.read(4))[0])
-            except error:
-                break
-            except IndexError:
-                break
+        self.mini_fat = list(
+            Struct("<{}L".format(small_sat_stream.size // UINT32.size)).unpack_from(
+                small_sat_stream.getbuffer()
+            )
+        )
 
         # extract directory listing
         current_sector = self.first_dir_sector
@@ -467,31 +541,33 @@ class Stream:  # pylint: disable=too-many-public-methods
                     }
 
             current_sector = self.fat[current_sector]
-            for i in range(offset, self.tell()):
-                self.dir_bytes.append(i)
+            self._record_bytes(self.dir_bytes, offset, self.tell())
 
-    def _read_fat_stream(self, sector, length):
+    def _read_fat_stream(self, sector, length, coverage: Optional[list] = None):
         """
         Reads a stream from FAT
         """
+        # always read from the document itself, regardless of which extracted
+        # stream is currently being parsed
+        source = self._source
         current_sector = sector
-        stream = BytesIO()
+        chunks = []
         read = 0
         while current_sector not in (0xFFFFFFFE, 0xFFFFFFFF):
             offset = (current_sector + 1) * self.sector_size
-            self.seek(offset)
+            source.seek(offset)
             to_read = min(self.sector_size, length - read)
 
-            stream.write(self.read(to_read))
+            chunk = source.read(to_read)
+            chunks.append(chunk)
             read += self.sector_size
 
             current_sector = self.fat[current_sector]
 
-            for i in range(offset, self.tell()):
-                self.mini_fat_bytes.append(i)
+            if coverage is not None:
+                self._record_bytes(coverage, offset, offset + len(chunk))
 
-        stream.seek(0)
-        return stream
+        return MemoryStream(b"".join(chunks))
 
     def extract_file_from_stream(self, name):
         """
@@ -503,62 +579,46 @@ class Stream:  # pylint: disable=too-many-public-methods
         directory = self.directories[name]
         stream_length = directory["stream_length"]
         self.log("stream length {}".format(stream_length))
-        use_short_stream = stream_length < self.mini_sector_cutoff
+        if stream_length >= self.mini_sector_cutoff:
+            return self._read_fat_stream(directory["first_sector"], stream_length)
 
-        if use_short_stream:
-            current_sector = self.mini_fat_first
-            stream_length = self.mini_fat_size
-        else:
-            current_sector = directory["first_sector"]
+        self.log("using short stream")
+        current_sector = directory["first_sector"]
+        self.log("first sector {}".format(current_sector))
 
-        # have to build the full binary, even if using short streams
-        complete_sat_bin = BytesIO()
+        # short streams are stored within the root mini stream, which is
+        # only assembled once per document
+        mini_stream = self._get_mini_stream()
         read = 0
-        while current_sector >= 0:
-            if current_sector in (0xFFFFFFFE, 0xFFFFFFFF):
-                break
-
-            offset = (current_sector + 1) * self.sector_size
-            self.seek(offset)
-            to_read = min(self.sector_size, stream_length - read)
-
-            complete_sat_bin.write(self.read(to_read))
-            read += self.sector_size
-
-            current_sector = self.fat[current_sector]
-
-        complete_sat_bin.seek(0)
-
-        if use_short_stream:
-            self.log("using short stream")
-            current_sector = directory["first_sector"]
-            stream_length = directory["stream_length"]
-            self.log("first sector {}".format(current_sector))
-
-            read = 0
+        chunks = []
+        while current_sector not in (0xFFFFFFFE, 0xFFFFFFFF):
+            offset = current_sector * self.mini_fat_sector_size
+            to_read = min(self.mini_fat_sector_size, stream_length - read)
+            chunks.append(mini_stream[offset : offset + to_read])
 
-            small_stream_bin = BytesIO()
-            while current_sector not in (0xFFFFFFFE, 0xFFFFFFFF):
-                offset = current_sector * self.mini_fat_sector_size
-                complete_sat_bin.seek(offset)
-                to_read = min(self.mini_fat_sector_size, stream_length - read)
-                small_stream_bin.write(complete_sat_bin.read(to_read))
+            read += self.mini_fat_sector_size
+            current_sector = self.mini_fat[current_sector]
 
-                read += self.mini_fat_sector_size
-                current_sector = self.mini_fat[current_sector]
+        return MemoryStream(b"".join(chunks))
 
-            small_stream_bin.seek(0)
-            return small_stream_bin
-        else:
-            return complete_sat_bin
+    def _get_mini_stream(self) -> memoryview:
+        """
+        Returns the root mini stream, which holds the contents of all short
+        streams in the document
+        """
+        if self._mini_stream is None:
+            self._mini_stream = self._read_fat_stream(
+                self.mini_fat_first, self.mini_fat_size
+            ).getbuffer()
+        return self._mini_stream
 
-    def read_uchar(self, debug_string: str = "", expected=None) -> int:
+    def read_uchar(self, debug_string: DebugLabel = "", expected=None) -> int:
         """
         Reads a uchar from the stream.
         """
-        res = unpack("<B", self.io_stream.read(1))[0]
-        if debug_string:
-            self.log("read uchar {} of {}".format(debug_string, res), 1)
+        res = self._unpack(UCHAR)[0]
+        if self.debug and debug_string:
+            self.log("read uchar {} of {}".format(debug_label(debug_string), res), 1)
 
         if not self.tolerant and expected is not None:
             try:
@@ -570,13 +630,13 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return res
 
-    def read_double(self, debug_string: str = "", expected=None) -> float:
+    def read_double(self, debug_string: DebugLabel = "", expected=None) -> float:
         """
         Reads a double from the stream.
         """
-        res = unpack("<d", self.io_stream.read(8))[0]
-        if debug_string:
-            self.log("read double {} of {}".format(debug_string, res), 8)
+        res = self._unpack(DOUBLE)[0]
+        if self.debug and debug_string:
+            self.log("read double {} of {}".format(debug_label(debug_string), res), 8)
 
         if not self.tolerant and expected is not None:
             try:
@@ -588,18 +648,18 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return res
 
-    def read_int(self, debug_string: str = "", expected=None) -> int:
+    def read_int(self, debug_string: DebugLabel = "", expected=None) -> int:
         """
         Reads an int from the stream.
         :return:
         """
         try:
-            res = unpack("<L", self.io_stream.read(4))[0]
+            res = self._unpack(UINT32)[0]
         except error as e:  # struct.error
             raise UnreadableSymbolException("Truncated integer") from e
 
-        if debug_string:
-            self.log("read int {} of {}".format(debug_string, res), 4)
+        if self.debug and debug_string:
+            self.log("read int {} of {}".format(debug_label(debug_string), res), 4)
 
         if not self.tolerant and expected is not None:
             try:
@@ -611,14 +671,14 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return res
 
-    def read_uint(self, debug_string: str = "", expected=None) -> int:
+    def read_uint(self, debug_string: DebugLabel = "", expected=None) -> int:
         """
         Reads an uint from the stream.
         :return:
         """
-        res = unpack("<I", self.io_stream.read(4))[0]
-        if debug_string:
-            self.log("read uint {} of {}".format(debug_string, res), 4)
+        res = self._unpack(UINT32)[0]
+        if self.debug and debug_string:
+            self.log("read uint {} of {}".format(debug_label(debug_string), res), 4)
 
         if not self.tolerant and expected is not None:
             try:
@@ -630,14 +690,16 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return res
 
-    def read_signed_int(self, debug_string: str = "", expected=None) -> int:
+    def read_signed_int(self, debug_string: DebugLabel = "", expected=None) -> int:
         """
         Reads a signed int from the stream.
         :return:
         """
-        res = unpack("<i", self.io_stream.read(4))[0]
-        if debug_string:
-            self.log("read signed int {} of {}".format(debug_string, res), 4)
+        res = self._unpack(INT32)[0]
+        if self.debug and debug_string:
+            self.log(
+                "read signed int {} of {}".format(debug_label(debug_string), res), 4
+            )
 
         if not self.tolerant and expected is not None:
             try:
@@ -649,14 +711,14 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return res
 
-    def read_ulong(self, debug_string: str = "", expected=None) -> int:
+    def read_ulong(self, debug_string: DebugLabel = "", expected=None) -> int:
         """
         Reads an ulong from the stream.
         :return:
         """
-        res = unpack("<l", self.io_stream.read(4))[0]
-        if debug_string:
-            self.log("read ulong {} of {}".format(debug_string, res), 4)
+        res = self._unpack(LONG32)[0]
+        if self.debug and debug_string:
+            self.log("read ulong {} of {}".format(debug_label(debug_string), res), 4)
 
         if not self.tolerant and expected is not None:
             try:
@@ -668,14 +730,14 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return res
 
-    def read_ushort(self, debug_string: str = "", expected=None) -> int:
+    def read_ushort(self, debug_string: DebugLabel = "", expected=None) -> int:
         """
         Reads an unsigned short from the stream.
         :return:
         """
-        res = unpack("<H", self.io_stream.read(2))[0]
-        if debug_string:
-            self.log("read ushort {} of {}".format(debug_string, res), 2)
+        res = self._unpack(USHORT)[0]
+        if self.debug and debug_string:
+            self.log("read ushort {} of {}".format(debug_label(debug_string), res), 2)
 
         if not self.tolerant and expected is not None:
             try:
@@ -687,30 +749,81 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return res
 
-    def read_clsid(self, debug_string: str = "") -> str:
+    def read_doubles(self, count: int, debug_string: DebugLabel = "") -> array:
+        """
+        Reads an array of count doubles from the stream.
+        """
+        res = array("d", self._unpack(Struct("<{}d".format(max(count, 0)))))
+        if self.debug and debug_string:
+            self.log(
+                "read {} doubles {} of {}".format(
+                    count, debug_label(debug_string), list(res)
+                ),
+                DOUBLE.size * count,
+            )
+        return res
+
+    def read_ints(self, count: int, debug_string: DebugLabel = "") -> array:
+        """
+        Reads an array of count ints from the stream.
+        """
+        try:
+            res = array("L", self._unpack(Struct("<{}L".format(max(count, 0)))))
+        except error as e:  # struct.error
+            raise UnreadableSymbolException("Truncated integer array") from e
+
+        if self.debug and debug_string:
+            self.log(
+                "read {} ints {} of {}".format(
+                    count, debug_label(debug_string), list(res)
+                ),
+                UINT32.size * count,
+            )
+        return res
+
+    def read_xy_pairs(self, count: int, debug_string: DebugLabel = "") -> List[tuple]:
+        """
+        Reads an array of count interleaved x/y double pairs from the stream,
+        returning a list of (x, y) tuples.
+        """
+        values = self.read_doubles(count * 2, debug_string)
+        return list(zip(values[0::2], values[1::2]))
+
+    def read_clsid(self, debug_string: DebugLabel = "") -> str:
         """
         Reads a CLSID from the stream
         """
-        clsid_bin = binascii.hexlify(self.io_stream.read(16))
+        return ObjectRegistry.bytes_to_clsid(self.read_binary_clsid(debug_string))
 
-        clsid = ObjectRegistry.hex_to_clsid2(clsid_bin)
-        if debug_string and clsid != "00000000-0000-0000-0000-000000000000":
+    def read_binary_clsid(self, debug_string: DebugLabel = "") -> bytes:
+        """
+        Reads a raw 16 byte CLSID from the stream
+        """
+        clsid = self.io_stream.read(16)
+        if self.debug and debug_string:
             self.log(
                 "Found {} clsid of {}".format(
-                    debug_string, ObjectRegistry.hex_to_clsid(clsid_bin)
+                    debug_label(debug_string),
+                    ObjectRegistry.hex_to_clsid(binascii.hexlify(clsid)),
                 ),
                 16,
             )
         return clsid
 
-    def read_raw_clsid(self, debug_string: str = "", expected=None) -> str:
+    def read_raw_clsid(self, debug_string: DebugLabel = "", expected=None) -> str:
         """
         Reads a CLSID from the stream
         """
         clsid_bin = binascii.hexlify(self.io_stream.read(16))
         clsid = ObjectRegistry.hex_to_clsid(clsid_bin)
-        if debug_string and clsid != "00000000-0000-0000-0000-000000000000":
-            self.log("Found {} clsid of {}".format(debug_string, clsid), 16)
+        if (
+            self.debug
+            and debug_string
+            and clsid != "00000000-0000-0000-0000-000000000000"
+        ):
+            self.log(
+                "Found {} clsid of {}".format(debug_label(debug_string), clsid), 16
+            )
 
         if not self.tolerant and expected is not None:
             if isinstance(expected, (tuple, list)):
@@ -723,7 +836,11 @@ class Stream:  # pylint: disable=too-many-public-methods
         return clsid
 
     def read_string(
-        self, debug_string: str = "", no_terminator=False, expected=None, size=None
+        self,
+        debug_string: DebugLabel = "",
+        no_terminator=False,
+        expected=None,
+        size=None,
     ) -> str:
         """
         Decodes a string from the binary
@@ -732,41 +849,36 @@ class Stream:  # pylint: disable=too-many-public-methods
         a four-byte unsigned integer, and then writes that many characters
         to the stream'
         """
-        if debug_string:
-            self.log("start {}".format(debug_string))
+        if self.debug and debug_string:
+            self.log("start {}".format(debug_label(debug_string)))
 
-        length = (
-            size
-            if size is not None
-            else self.read_uint("{} string length".format(debug_string))
-        )
+        if size is not None:
+            length = size
+        elif self.debug:
+            length = self.read_uint(("{} string length", debug_string))
+        else:
+            length = self._unpack(UINT32)[0]
         if length < 2:
             raise UnreadableSymbolException(
                 "Invalid length of string {}".format(length)
             )
 
-        self.log("string of length {}".format(int(length / 2 - 1)), 4)
+        if self.debug:
+            self.log("string of length {}".format(int(length / 2 - 1)), 4)
         if not no_terminator:
             buffer = self.io_stream.read(length - 2)
         else:
             buffer = self.io_stream.read(length)
         string = buffer.decode("utf-16")
-        if not no_terminator:
-            terminator = binascii.hexlify(self.io_stream.read(2))
-        else:
-            terminator = None
-        if terminator is not None and terminator != b"0000":
+        if not no_terminator and self.io_stream.read(2) != b"\x00\x00":
             raise UnreadableSymbolException("Invalid string terminator")
 
-        res = ""
-        for char in string:
-            if char in ("\ufffe", "\uffff"):
-                self.log('Found unicode fffe/ffff "not a character", stripping')
-            else:
-                res += char
-        string = res
+        if "\ufffe" in string or "\uffff" in string:
+            self.log('Found unicode fffe/ffff "not a character", stripping')
+            string = string.replace("\ufffe", "").replace("\uffff", "")
 
-        self.log('found string "{}"'.format(string))
+        if self.debug:
+            self.log('found string "{}"'.format(string))
 
         if not self.tolerant and expected is not None:
             if isinstance(expected, (tuple, list)):
@@ -778,27 +890,32 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return string
 
-    def read_stringv2(self, debug_string: str = "", expected=None) -> str:
+    def read_stringv2(self, debug_string: DebugLabel = "", expected=None) -> str:
         """
         Decodes a string from the binary, alternative method
         """
-        if debug_string:
-            self.log("start {}".format(debug_string))
+        if self.debug and debug_string:
+            self.log("start {}".format(debug_label(debug_string)))
 
-        length = self.read_uint("{} string length".format(debug_string))
+        if self.debug:
+            length = self.read_uint(("{} string length", debug_string))
+        else:
+            length = self._unpack(UINT32)[0]
         if length < 0:
             raise UnreadableSymbolException(
                 "Invalid length of string {}".format(length)
             )
 
-        self.log("string of length {}".format(length), 4)
+        if self.debug:
+            self.log("string of length {}".format(length), 4)
         if length != 0:
             buffer = self.io_stream.read(length * 2)
             string = buffer.decode("utf-16")
-            terminator = binascii.hexlify(self.io_stream.read(2))
+            terminator = self.io_stream.read(2)
 
-            self.log('found string "{}"'.format(string))
-            if terminator != b"0000":
+            if self.debug:
+                self.log('found string "{}"'.format(string))
+            if terminator != b"\x00\x00":
                 raise UnreadableSymbolException("Invalid string terminator")
         else:
             string = ""
@@ -817,12 +934,14 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return string
 
-    def read_string_terminated(self, debug_string: str = "", expected=None) -> str:
+    def read_string_terminated(
+        self, debug_string: DebugLabel = "", expected=None
+    ) -> str:
         """
         Decodes a string from the binary, with no length but scanning for terminators
         """
-        if debug_string:
-            self.log("start {}".format(debug_string))
+        if self.debug and debug_string:
+            self.log("start {}".format(debug_label(debug_string)))
 
         string = ""
         res = self.read(2)
@@ -830,7 +949,8 @@ class Stream:  # pylint: disable=too-many-public-methods
             string += res.decode("utf-16")
             res = self.read(2)
 
-        self.log('found string "{}"'.format(string))
+        if self.debug:
+            self.log('found string "{}"'.format(string))
 
         if not self.tolerant and expected is not None:
             if isinstance(expected, (tuple, list)):
@@ -846,29 +966,32 @@ class Stream:  # pylint: disable=too-many-public-methods
 
         return string
 
-    def read_ascii(self, debug_string: str = "", expected=None, length=None) -> str:
+    def read_ascii(
+        self, debug_string: DebugLabel = "", expected=None, length=None
+    ) -> str:
         """
         Decodes an ascii string from the binary
         """
-        if debug_string:
-            self.log("start {}".format(debug_string))
+        if self.debug and debug_string:
+            self.log("start {}".format(debug_label(debug_string)))
 
-        length = (
-            length if length is not None else unpack("<L", self.io_stream.read(4))[0]
-        )
+        length = length if length is not None else self._unpack(UINT32)[0]
 
-        self.log("string of length {}".format(int(length)), 4)
+        if self.debug:
+            self.log("string of length {}".format(int(length)), 4)
         if length == 0:
             return ""
 
-        self.log("ascii of length {}".format(length))
+        if self.debug:
+            self.log("ascii of length {}".format(length))
         # encoding?
         b = self.read(length)
         # trim trailing null characters, seen sometimes!!
         b = b.rstrip(b"\x00")
 
         res = b.decode("latin-1")
-        self.log('found ascii "{}"'.format(res))
+        if self.debug:
+            self.log('found ascii "{}"'.format(res))
 
         if not self.tolerant and expected is not None:
             if isinstance(expected, (tuple, list)):
@@ -906,7 +1029,7 @@ class Stream:  # pylint: disable=too-many-public-methods
 
     def read_object(
         self,  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
-        debug_string: str = "",
+        debug_string: DebugLabel = "",
         allow_reference=True,
         expect_existing=False,
         expected_size=None,
@@ -915,9 +1038,9 @@ class Stream:  # pylint: disable=too-many-public-methods
         Creates and reads a new object from the stream
         """
         start = self.tell()
-        clsid = self.read_clsid(debug_string)
+        clsid = self.read_binary_clsid(debug_string)
         try:
-            res = REGISTRY.create_object(clsid)
+            res = REGISTRY.create_object_from_bytes(clsid)
         except UnknownClsidException as e:
             self.log(str(e), 16)
 
@@ -927,14 +1050,15 @@ class Stream:  # pylint: disable=too-many-public-methods
             if self.is_layer:
                 this_ref = self.read_uint("ref id")
                 self.rewind(4)
-                self.unknown_objects[this_ref] = clsid
+                self.unknown_objects[this_ref] = ObjectRegistry.bytes_to_clsid(clsid)
 
             raise e
 
-        if res is not None:
-            self.log("** {} **".format(res.__class__.__name__), 16)
-        else:
-            self.log("{} not found".format(debug_string), 16)
+        if self.debug:
+            if res is not None:
+                self.log("** {} **".format(res.__class__.__name__), 16)
+            else:
+                self.log("{} not found".format(debug_label(debug_string)), 16)
 
         if res is not None:
             res.stream_offset = start
@@ -950,6 +1074,9 @@ class Stream:  # pylint: disable=too-many-public-methods
                     self.debug_depth -= 1
                     return res
 
+                if self.deferred_objects and this_ref not in self.objects[-1]:
+                    self._read_deferred_ref(this_ref, expect_existing)
+
                 if this_ref in self.objects[-1]:
                     old_res = self.objects[-1][this_ref]
                     self.log(
@@ -971,6 +1098,7 @@ class Stream:  # pylint: disable=too-many-public-methods
                     return None  # res
                 elif (
                     not self.tolerant
+                    and not self._resolve_depth
                     and self.objects[-1]
                     and this_ref < max(self.objects[-1].keys())
                 ):
@@ -1000,9 +1128,10 @@ class Stream:  # pylint: disable=too-many-public-methods
                             )
                         )
                 else:
-                    self.log(
-                        "storing {} as {}".format(res.__class__.__name__, this_ref)
-                    )
+                    if self.debug:
+                        self.log(
+                            "storing {} as {}".format(res.__class__.__name__, this_ref)
+                        )
                     res.ref_id = this_ref
                     self.objects[-1][this_ref] = res
 
@@ -1046,22 +1175,148 @@ class Stream:  # pylint: disable=too-many-public-methods
                 self.not_implemented_objects[this_ref] = res.__class__
                 raise e
 
-            self.log("ended {}".format(res.__class__.__name__))
-
             if self.debug:
+                self.log("ended {}".format(res.__class__.__name__))
                 print("")
             self.debug_depth -= 1
 
         return res
 
-    def read_embedded_file(self, debug_string: str = "") -> bin:
+    def read_deferred_object(
+        self,
+        debug_string: DebugLabel = "",
+        expected_size=None,
+        end: Optional[int] = None,
+    ):
+        """
+        Reads an object which ends at a known offset, deferring parsing of the
+        object until it is first used. A DeferredObject placeholder is returned
+        in place of the object.
+
+        The object following a deferred object in the stream must be a new
+        object, and not a reference to an existing object.
+
+        Objects are only deferred if defer_objects is set and the stream is
+        memory backed (and not debugging), otherwise the object is read immediately.
+        """
+        start = self.tell()
+        if (
+            not self.defer_objects
+            or self.debug
+            or not self.is_layer
+            or end is None
+            or end < start + 20
+            or not isinstance(self.io_stream, MemoryStream)
+        ):
+            return self.read_object(debug_string, expected_size=expected_size)
+
+        object_class = REGISTRY.binary_objects.get(self.read_binary_clsid())
+        this_ref = self.read_uint()
+        if (
+            object_class is None
+            or not object_class.supports_references()
+            or this_ref == 0
+            or this_ref in self.objects[-1]
+        ):
+            self.seek(start)
+            return self.read_object(debug_string, expected_size=expected_size)
+
+        for deferred in self.deferred_objects:
+            if deferred.last_ref is None:
+                deferred.last_ref = this_ref - 1
+
+        res = DeferredObject(
+            self,
+            object_class,
+            self.io_stream.getbuffer(),
+            start,
+            expected_size,
+            debug_string,
+            ReferenceTableSnapshot(self.objects[-1], this_ref),
+            this_ref,
+            self._read_deferred_attributes(object_class),
+        )
+        self.objects[-1][this_ref] = res
+        self.deferred_objects.append(res)
+        self.seek(end)
+        return res
+
+    def _read_deferred_attributes(self, object_class) -> dict:
+        """
+        Reads the attributes of a deferred object which are available without
+        parsing the object, from the start of the object's content
+        """
+        try:
+            compatible_versions = object_class.compatible_versions()
+            version = 1
+            if compatible_versions is not None:
+                version = self.read_ushort()
+                if version not in compatible_versions:
+                    return {}
+            return object_class.read_deferred_attributes(self, version)
+        except (
+            NotImplementedException,
+            PartiallyImplementedException,
+            UnreadableSymbolException,
+            UnicodeDecodeError,
+            error,
+        ):
+            return {}
+
+    def resolve_deferred_object(
+        self,
+        deferred: DeferredObject,
+        buffer,
+        offset: int,
+        expected_size,
+        debug_string: DebugLabel,
+        references: ReferenceTableSnapshot,
+    ) -> Optional[Object]:  # pylint: disable=too-many-arguments
+        """
+        Parses an object previously skipped by read_deferred_object
+        """
+        if deferred in self.deferred_objects:
+            self.deferred_objects.remove(deferred)
+
+        prev_io_stream = self.io_stream
+        self.io_stream = MemoryStream(buffer, position=offset)
+        self.objects.append(references)
+        self._resolve_depth += 1
+        try:
+            res = self.read_object(debug_string, expected_size=expected_size)
+        finally:
+            self._resolve_depth -= 1
+            del self.objects[-1]
+            self.io_stream = prev_io_stream
+
+        references.publish()
+        return res
+
+    def _read_deferred_ref(self, ref: int, expect_existing: bool):
+        """
+        Called when an unknown reference id is encountered while deferred
+        objects are pending. Parses any deferred objects which contain the
+        reference.
+        """
+        for deferred in self.deferred_objects:
+            if deferred.last_ref is None:
+                # the object following a deferred object is a new object,
+                # so its reference marks the end of the deferred object's references
+                deferred.last_ref = ref - 1
+
+        refs = (ref, ref - 1) if expect_existing else (ref,)
+        for deferred in list(self.deferred_objects):
+            if any(deferred.contains_ref(r) for r in refs):
+                deferred.resolve()
+
+    def read_embedded_file(self, debug_string: DebugLabel = "") -> bin:
         """
         Reads an embedded file stored within the stream.
         """
         embedded_file_length = self.read_int("binary length")
         self.log(
             "Found embedded file {} of length {}".format(
-                debug_string, embedded_file_length
+                debug_label(debug_string), embedded_file_length
             )
         )
         try:
@@ -1072,15 +1327,15 @@ class Stream:  # pylint: disable=too-many-public-methods
     def read_variant(
         self,  # pylint: disable=too-many-branches
         variant_type=None,
-        debug_string: str = "",
+        debug_string: DebugLabel = "",
         expected=None,
         use_alternate_string_parser: bool = False,
     ):
         """
         Reads a variant value from the stream
         """
-        if debug_string:
-            self.log("reading variant {}".format(debug_string))
+        if self.debug and debug_string:
+            self.log("reading variant {}".format(debug_label(debug_string)))
         if variant_type is None:
             variant_type = self.read_ushort("type")
         if variant_type == Stream.VBSTRING:
@@ -1120,7 +1375,7 @@ class Stream:  # pylint: disable=too-many-public-methods
             value = self.read_uchar("value")
         elif variant_type == 8197:  # esriAttributeTypeDash
             count = self.read_int("number of dashes")
-            value = [self.read_double("value {}".format(idx)) for idx in range(count)]
+            value = [self.read_double(("value {}", idx)) for idx in range(count)]
         else:
             raise UnreadableSymbolException(
                 "Unknown property type {}".format(variant_type)
@@ -1170,7 +1425,7 @@ class Stream:  # pylint: disable=too-many-public-methods
 
     def read_index_array(
         self,
-        debug_string: str = "",
+        debug_string: DebugLabel = "",
     ) -> List[int]:
         """
         Reads an indexed array from the stream
@@ -1179,7 +1434,7 @@ class Stream:  # pylint: disable=too-many-public-methods
             debug_string = "unknown"
 
         # the total number of items expected in the final array
-        total_count = self.read_int("{} index array count".format(debug_string))
+        total_count = self.read_int(("{} index array count", debug_string))
 
         if total_count == 0:
             return []
@@ -1187,7 +1442,7 @@ class Stream:  # pylint: disable=too-many-public-methods
         indices = []
 
         while len(indices) < total_count:
-            val = self.read_signed_int("{} index node".format(len(indices)))
+            val = self.read_signed_int(("{} index node", len(indices)))
             # peek at the next value to see if it's a range marker (negative number)
             next_pos = self.tell()
             modifier = self.read_signed_int("potential_range_modifier")
@@ -12,8 +12,55 @@ from ..exceptions import EmptyDocumentException, DocumentTypeException
 class MapDocument:
     """
     Represents a map document (e.g. .mxd)
+
+    If created with lazy=True, only the document version and metadata
+    streams are read on construction. The remaining streams are extracted
+    and parsed on first access of an attribute which depends on them, e.g.
+    accessing page_layout triggers parsing of the page layout. In this
+    case io_stream must remain open for the lifetime of the document.
+
+    Lazy documents also defer parsing of the layers in each data frame.
+    Map.root_groups will contain DeferredObject placeholders, which are
+    only parsed when the layer (or an object referencing it) is used.
     """
 
+    STAGE_DEFAULTS = 1
+    STAGE_MAPS = 2
+    STAGE_LAYOUT = 3
+
+    # attributes populated by each parsing stage. Stages must be parsed in order,
+    # as objects in later streams may reference objects from earlier streams
+    STAGE_ATTRIBUTES = {
+        STAGE_DEFAULTS: {
+            "default_toc_symbol_width": 12,
+            "default_toc_symbol_height": 12,
+            "default_fill": None,
+            "default_line": None,
+            "default_marker": None,
+            "default_area_patch": None,
+            "default_line_patch": None,
+            "default_text_symbol": None,
+            "default_callout_symbol": None,
+            "template_paths": list,
+            "toc_view_mode": "Display",
+            "selection_environment": None,
+            "style_gallery": None,
+        },
+        STAGE_MAPS: {
+            "frames": list,
+        },
+        STAGE_LAYOUT: {
+            "page_layout": None,
+            "layout_read_error": None,
+        },
+    }
+
+    LAZY_ATTRIBUTES = {
+        attribute: stage
+        for stage, attributes in STAGE_ATTRIBUTES.items()
+        for attribute in attributes
+    }
+
     def __init__(
         self,
         io_stream,
@@ -23,6 +70,7 @@ class MapDocument:
         check_length=False,
         read_layouts=False,
         metadata_only=False,
+        lazy=False,
     ):
         self.version = ""
         self.major_version = 0
@@ -37,27 +85,18 @@ class MapDocument:
         self.last_saved = None
         self.last_printed = None
         self.last_exported = None
-        self.frames = []
-        self.default_toc_symbol_width = 12
-        self.default_toc_symbol_height = 12
-        self.default_fill = None
-        self.default_line = None
-        self.default_marker = None
-        self.default_area_patch = None
-        self.default_line_patch = None
-        self.default_text_symbol = None
-        self.default_callout_symbol = None
-        self.template_paths = []
-        self.toc_view_mode = "Display"
-        self.selection_environment = None
-        self.style_gallery = None
-        self.page_layout = None
         self.active_frame = None
         self.use_relative_sources = False
         self.default_database = None
         self.table_properties = None
         self.layout_read_error: Optional[str] = None
 
+        self._stream: Optional[Stream] = None
+        self._loaded_stage = 0
+        self._tolerant = tolerant
+        self._check_length = check_length
+        self._document_stream = None
+
         if io_stream.read(4) != b"\xd0\xcf\x11\xe0":
             raise DocumentTypeException()
 
@@ -81,16 +120,6 @@ class MapDocument:
             "Mx Document Version Info"
         )
         metadata_stream = stream.extract_file_from_stream("Metadata")
-        templates_stream = stream.extract_file_from_stream("Templates")
-        style_gallery_stream = stream.extract_file_from_stream("StyleGallery")
-        drawing_defaults_stream = stream.extract_file_from_stream("DrawingDefaults")
-        document_stream = stream.extract_file_from_stream("Mx Document")
-        maps_stream = stream.extract_file_from_stream("Maps")
-        page_layout_stream = stream.extract_file_from_stream("PageLayout")
-
-        view_stream = None
-        table_properties_stream = None
-        document_database_stream = None
 
         if version_stream:
             stream.io_stream = version_stream
@@ -132,9 +161,91 @@ class MapDocument:
                         )
                     )
 
-        if templates_stream and not metadata_only:
+        if metadata_only:
+            # leave the remaining streams untouched
+            for attributes in MapDocument.STAGE_ATTRIBUTES.values():
+                self._set_default_attributes(attributes)
+            return
+
+        self._stream = stream
+        if lazy:
+            stream.defer_objects = True
+            return
+
+        self._load_stage(MapDocument.STAGE_MAPS)
+        if not tolerant or read_layouts:
+            self._load_stage(MapDocument.STAGE_LAYOUT)
+        else:
+            self._set_default_attributes(
+                MapDocument.STAGE_ATTRIBUTES[MapDocument.STAGE_LAYOUT]
+            )
+            self._finish_loading()
+
+    def __getattr__(self, name):
+        """
+        Triggers lazy parsing of the stream which populates the attribute
+        """
+        stage = MapDocument.LAZY_ATTRIBUTES.get(name)
+        if stage is None or self.__dict__.get("_stream") is None:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(
+                    self.__class__.__name__, name
+                )
+            )
+
+        self._load_stage(stage)
+        return self.__dict__[name]
+
+    def _set_default_attributes(self, attributes: dict):
+        """
+        Sets the default values for a set of stage attributes
+        """
+        for attribute, default in attributes.items():
+            setattr(self, attribute, default() if callable(default) else default)
+
+    def _load_stage(self, stage: int):
+        """
+        Parses all streams up to and including the specified stage
+        """
+        while self._loaded_stage < stage and self._stream is not None:
+            self._loaded_stage += 1
+            self._set_default_attributes(
+                MapDocument.STAGE_ATTRIBUTES[self._loaded_stage]
+            )
+            if self._loaded_stage == MapDocument.STAGE_DEFAULTS:
+                self._read_defaults_streams(self._stream)
+            elif self._loaded_stage == MapDocument.STAGE_MAPS:
+                self._read_maps_streams(self._stream)
+            elif self._loaded_stage == MapDocument.STAGE_LAYOUT:
+                self._read_layout_stream(self._stream)
+                self._finish_loading()
+
+    def _finish_loading(self):
+        """
+        Called after all required streams have been parsed
+        """
+        # search for holes in references
+        if not self._tolerant:
+            for i in range(len(self._stream.objects[-1])):
+                if i not in self._stream.objects[-1] and not any(
+                    d.contains_ref(i) for d in self._stream.deferred_objects
+                ):
+                    print("WARNING: missing ref {}".format(i))
+
+        # release the stream, and with it the source document
+        self._stream = None
+
+    def _read_defaults_streams(self, stream: Stream):
+        """
+        Reads the Templates, StyleGallery and DrawingDefaults streams
+        """
+        check_length = self._check_length
+        has_drawing_defaults = "DrawingDefaults" in stream.directories
+
+        templates_stream = stream.extract_file_from_stream("Templates")
+        if templates_stream:
             stream.io_stream = templates_stream
-            self.read_templates(stream, bool(drawing_defaults_stream))
+            self.read_templates(stream, has_drawing_defaults)
             if check_length:
                 pos = templates_stream.tell()
                 templates_stream.seek(0, os.SEEK_END)
@@ -145,7 +256,8 @@ class MapDocument:
                         )
                     )
 
-        if style_gallery_stream and not metadata_only:
+        style_gallery_stream = stream.extract_file_from_stream("StyleGallery")
+        if style_gallery_stream:
             stream.io_stream = style_gallery_stream
             self.read_style_gallery(stream)
             if check_length:
@@ -158,7 +270,8 @@ class MapDocument:
                         )
                     )
 
-        if drawing_defaults_stream and not metadata_only:
+        drawing_defaults_stream = stream.extract_file_from_stream("DrawingDefaults")
+        if drawing_defaults_stream:
             stream.io_stream = drawing_defaults_stream
             self.read_drawing_defaults(stream)
             if check_length:
@@ -171,16 +284,26 @@ class MapDocument:
                         )
                     )
 
-        if document_stream and not metadata_only:
+    def _read_maps_streams(self, stream: Stream):
+        """
+        Reads the data frames, from either the Mx Document or Maps stream
+        """
+        check_length = self._check_length
+        document_stream = stream.extract_file_from_stream("Mx Document")
+        if document_stream:
             stream.objects[-1] = {}
             stream.io_stream = document_stream
             stream.read_int("unknown", expected=1)
             stream.read_int("unknown", expected=1)
             stream.read_int("unknown", expected=1)
+            # the page layout follows the maps in the document stream
+            self._document_stream = document_stream
+            maps_stream = None
         else:
+            maps_stream = stream.extract_file_from_stream("Maps")
             stream.io_stream = maps_stream
 
-        if stream.io_stream and not metadata_only:
+        if stream.io_stream:
             self.read_maps(stream, bool(document_stream))
             if not document_stream and check_length:
                 pos = maps_stream.tell()
@@ -191,76 +314,21 @@ class MapDocument:
                             hex(pos), hex(maps_stream.tell())
                         )
                     )
-            elif document_stream:
-                if not tolerant or read_layouts:
-                    try:
-                        self.read_layout(stream)
-                    except Exception as e:
-                        self.layout_read_error = str(e)
-
-        if page_layout_stream and not document_stream and not metadata_only:
-            stream.io_stream = page_layout_stream
-            if not tolerant or read_layouts:
-                try:
-                    self.read_layout(stream)
-                except Exception as e:
-                    self.layout_read_error = str(e)
-                if False and check_length:
-                    pos = page_layout_stream.tell()
-                    page_layout_stream.seek(0, os.SEEK_END)
-                    if pos != page_layout_stream.tell():
-                        raise AssertionError(
-                            "Did not read to end of PageLayout stream. Read to {} of {}".format(
-                                hex(pos), hex(page_layout_stream.tell())
-                            )
-                        )
 
-        if view_stream and not metadata_only:
-            stream.io_stream = view_stream
-            if not tolerant:
-                self.read_view(stream)
-                if check_length:
-                    pos = view_stream.tell()
-                    view_stream.seek(0, os.SEEK_END)
-                    if pos != view_stream.tell():
-                        raise AssertionError(
-                            "Did not read to end of View stream. Read to {} of {}".format(
-                                hex(pos), hex(view_stream.tell())
-                            )
-                        )
-
-        if table_properties_stream and not metadata_only:
-            if not tolerant:
-                stream.io_stream = table_properties_stream
-                self.table_properties = stream.read_object("table properties")
-                if check_length:
-                    pos = table_properties_stream.tell()
-                    table_properties_stream.seek(0, os.SEEK_END)
-                    if pos != table_properties_stream.tell():
-                        raise AssertionError(
-                            "Did not read to end of TableProperties stream. Read to {} of {}".format(
-                                hex(pos), hex(table_properties_stream.tell())
-                            )
-                        )
-
-        if document_database_stream and not tolerant and not metadata_only:
-            stream.io_stream = document_database_stream
-            self.default_database = stream.read_object("default database")
-            if check_length:
-                pos = document_database_stream.tell()
-                document_database_stream.seek(0, os.SEEK_END)
-                if pos != document_database_stream.tell():
-                    raise AssertionError(
-                        "Did not read to end of DocumentDatabase stream. Read to {} of {}".format(
-                            hex(pos), hex(document_database_stream.tell())
-                        )
-                    )
+    def _read_layout_stream(self, stream: Stream):
+        """
+        Reads the page layout, from either the Mx Document or PageLayout stream
+        """
+        if self._document_stream:
+            stream.io_stream = self._document_stream
+        else:
+            stream.io_stream = stream.extract_file_from_stream("PageLayout")
 
-        # search for holes in references
-        if not tolerant:
-            for i in range(len(stream.objects[-1])):
-                if i not in stream.objects[-1]:
-                    print("WARNING: missing ref {}".format(i))
+        if stream.io_stream:
+            try:
+                self.read_layout(stream)
+            except Exception as e:
+                self.layout_read_error = str(e)
 
     def read_version(self, stream):
         """
@@ -334,9 +402,7 @@ class MapDocument:
         """
         count = stream.read_int("template count")
         for i in range(count):
-            self.template_paths.append(
-                stream.read_string("template path {}".format(i + 1))
-            )
+            self.template_paths.append(stream.read_string(("template path {}", i + 1)))
             stream.read_int("unknown", expected=1)
         stream.read_int("unknown", expected=(3, 5))
 
@@ -365,7 +431,7 @@ class MapDocument:
             )  # , expected=(0, 11, 2061745644852025.5, 4.3257934243725296e-268, 1.213859894000235e-304))
             string_count = stream.read_int("string count")
             for i in range(string_count):
-                stream.read_string("unknown string {}".format(i + 1))
+                stream.read_string(("unknown string {}", i + 1))
                 stream.read_ushort("unknown", expected=65535)
 
             self.toc_view_mode = stream.read_string(
@@ -416,7 +482,7 @@ class MapDocument:
             raise EmptyDocumentException()
 
         for i in range(data_frame_count):
-            self.frames.append(stream.read_object("data frame {}".format(i + 1)))
+            self.frames.append(stream.read_object(("data frame {}", i + 1)))
 
         if not is_document_stream:
             # maybe related to relative sources??
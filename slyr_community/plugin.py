@@ -60,6 +60,8 @@ class ConfigOptionsPage(OPTIONS_WIDGET, QgsOptionsPageWidget):
         self.setObjectName("slyrOptions")
         self.inkscape_path_widget.setStorageMode(QgsFileWidget.StorageMode.GetFile)
         self.mdbtools_path_widget.setStorageMode(QgsFileWidget.StorageMode.GetDirectory)
+        self.symbol_cache_path_widget.setStorageMode(QgsFileWidget.StorageMode.SaveFile)
+        self.symbol_cache_path_widget.setFilter("SQLite databases (*.sqlite *.db)")
 
         if not Extractor.is_windows():
             self.label_mdb_tools_win.hide()
@@ -94,9 +96,18 @@ class ConfigOptionsPage(OPTIONS_WIDGET, QgsOptionsPageWidget):
         self.inkscape_path_widget.setFilePath(
             s.value("/plugins/slyr/inkscape_path", "inkscape")
         )
+        self.enable_emf_cache.setChecked(
+            int(s.value("/plugins/slyr/enable_emf_cache", 1))
+        )
+        self.force_inkscape_emf.setChecked(
+            int(s.value("/plugins/slyr/force_inkscape_emf", 0))
+        )
         self.mdbtools_path_widget.setFilePath(
             s.value("/plugins/slyr/mdbtools_path", "")
         )
+        self.symbol_cache_path_widget.setFilePath(
+            s.value("/plugins/slyr/symbol_cache_path", "")
+        )
 
         self.sde_primary_key_line_edit.setText(
             s.value("/plugins/slyr/sde_primary_key", "OBJECTID")
@@ -137,7 +148,18 @@ class ConfigOptionsPage(OPTIONS_WIDGET, QgsOptionsPageWidget):
         )
         s.setValue("/plugins/slyr/symbol_units", self.symbol_units.currentData())
         s.setValue("/plugins/slyr/inkscape_path", self.inkscape_path_widget.filePath())
+        s.setValue(
+            "/plugins/slyr/enable_emf_cache",
+            0 if not self.enable_emf_cache.isChecked() else 1,
+        )
+        s.setValue(
+            "/plugins/slyr/force_inkscape_emf",
+            0 if not self.force_inkscape_emf.isChecked() else 1,
+        )
         s.setValue("/plugins/slyr/mdbtools_path", self.mdbtools_path_widget.filePath())
+        s.setValue(
+            "/plugins/slyr/symbol_cache_path", self.symbol_cache_path_widget.filePath()
+        )
         s.setValue(
             "/plugins/slyr/apply_tweaks", 0 if not self.apply_tweaks.isChecked() else 1
         )
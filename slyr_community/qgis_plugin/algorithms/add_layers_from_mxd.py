@@ -16,6 +16,7 @@ from qgis.core import QgsProcessingParameterFile, QgsProcessingFeedback
 from .algorithm import SlyrAlgorithm
 from ...converters.context import Context
 from ...converters.project import ProjectConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...parser.exceptions import (
     UnreadableSymbolException,
     NotImplementedException,
@@ -137,9 +138,11 @@ class AddLayersFromMxd(SlyrAlgorithm):
 
             conversion_context.unsupported_object_callback = unsupported_object_callback
 
-            ProjectConverter.add_layers_to_project(
-                context.project(), self.input_file, self.obj, conversion_context
-            )
+            with SymbolConversionCache.from_settings() as symbol_cache:
+                conversion_context.symbol_cache = symbol_cache
+                ProjectConverter.add_layers_to_project(
+                    context.project(), self.input_file, self.obj, conversion_context
+                )
         return {}
 
     # pylint: enable=missing-docstring,unused-argument
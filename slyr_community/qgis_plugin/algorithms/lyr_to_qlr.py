@@ -25,6 +25,7 @@ from qgis.core import (
 from .algorithm import SlyrAlgorithm
 from ...converters.context import Context
 from ...converters.layers import LayerConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...parser.exceptions import (
     UnreadableSymbolException,
     UnsupportedVersionException,
@@ -205,17 +206,19 @@ class LyrToQlr(SlyrAlgorithm):
             feedback.reportError(err, fatalError=False)
             return {self.ERROR: err, self.CONVERTED: False, self.OUTPUT: None}
 
-        try:
-            res, error = LayerConverter.object_to_qlr(
-                obj,
-                input_file,
-                output_file,
-                conversion_context,
-                use_relative_paths=use_relative_paths,
-            )
-        except NotImplementedException as e:
-            feedback.reportError(str(e), fatalError=True)
-            return {self.ERROR: str(e), self.CONVERTED: False, self.OUTPUT: None}
+        with SymbolConversionCache.from_settings() as symbol_cache:
+            conversion_context.symbol_cache = symbol_cache
+            try:
+                res, error = LayerConverter.object_to_qlr(
+                    obj,
+                    input_file,
+                    output_file,
+                    conversion_context,
+                    use_relative_paths=use_relative_paths,
+                )
+            except NotImplementedException as e:
+                feedback.reportError(str(e), fatalError=True)
+                return {self.ERROR: str(e), self.CONVERTED: False, self.OUTPUT: None}
 
         if not res:
             raise QgsProcessingException(error)
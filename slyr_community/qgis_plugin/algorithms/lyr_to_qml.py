@@ -22,6 +22,7 @@ from qgis.core import (
 from .algorithm import SlyrAlgorithm
 from ...converters.context import Context
 from ...converters.layers import LayerConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...parser.exceptions import (
     UnreadableSymbolException,
     NotImplementedException,
@@ -164,17 +165,19 @@ class LyrToQml(SlyrAlgorithm):
         conversion_context.project = context.project()
         conversion_context.can_place_annotations_in_main_annotation_layer = False
 
-        try:
-            LayerConverter.layers_to_qml(
-                obj,
-                input_file,
-                output_file,
-                on_error=on_error,
-                context=conversion_context,
-            )
-        except NotImplementedException as e:
-            feedback.reportError(str(e), fatalError=True)
-            return {self.ERROR: str(e), self.CONVERTED: False, self.OUTPUT: None}
+        with SymbolConversionCache.from_settings() as symbol_cache:
+            conversion_context.symbol_cache = symbol_cache
+            try:
+                LayerConverter.layers_to_qml(
+                    obj,
+                    input_file,
+                    output_file,
+                    on_error=on_error,
+                    context=conversion_context,
+                )
+            except NotImplementedException as e:
+                feedback.reportError(str(e), fatalError=True)
+                return {self.ERROR: str(e), self.CONVERTED: False, self.OUTPUT: None}
 
         return {self.OUTPUT: output_file, self.ERROR: None, self.CONVERTED: True}
 
@@ -25,6 +25,7 @@ from qgis.core import (
 from .algorithm import SlyrAlgorithm
 from ...converters.context import Context
 from ...converters.layers import LayerConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...converters.vector_renderer import VectorRendererConverter
 from ...parser.exceptions import (
     UnreadableSymbolException,
@@ -174,29 +175,31 @@ class LyrToStyleXml(SlyrAlgorithm):
             symbol_names.add(candidate.lower())
             return candidate
 
-        layers = LayerConverter.unique_layer_name_map(obj)
-        for name, layer in layers.items():
-            feedback.pushInfo("Extracting symbols from {}".format(name))
-            symbols = VectorRendererConverter.extract_symbols_from_renderer(
-                layer,
-                conversion_context,
-                default_name=name,
-                base_name=name if len(layers) > 1 else "",
-            )
-
-            for k, v in symbols.items():
-                unique_name = make_name_unique(k)
-                if k != unique_name:
-                    feedback.pushInfo(
-                        "Corrected to unique name of {}".format(unique_name)
-                    )
-
-                if isinstance(v, QgsSymbol):
-                    style.addSymbol(unique_name, v, True)
-                elif isinstance(v, QgsColorRamp):
-                    style.addColorRamp(unique_name, v, True)
-                elif isinstance(v, QgsTextFormat):
-                    style.addTextFormat(unique_name, v, True)
+        with SymbolConversionCache.from_settings() as symbol_cache:
+            conversion_context.symbol_cache = symbol_cache
+            layers = LayerConverter.unique_layer_name_map(obj)
+            for name, layer in layers.items():
+                feedback.pushInfo("Extracting symbols from {}".format(name))
+                symbols = VectorRendererConverter.extract_symbols_from_renderer(
+                    layer,
+                    conversion_context,
+                    default_name=name,
+                    base_name=name if len(layers) > 1 else "",
+                )
+
+                for k, v in symbols.items():
+                    unique_name = make_name_unique(k)
+                    if k != unique_name:
+                        feedback.pushInfo(
+                            "Corrected to unique name of {}".format(unique_name)
+                        )
+
+                    if isinstance(v, QgsSymbol):
+                        style.addSymbol(unique_name, v, True)
+                    elif isinstance(v, QgsColorRamp):
+                        style.addColorRamp(unique_name, v, True)
+                    elif isinstance(v, QgsTextFormat):
+                        style.addTextFormat(unique_name, v, True)
 
         style.exportXml(output_file)
         return {self.OUTPUT: output_file}
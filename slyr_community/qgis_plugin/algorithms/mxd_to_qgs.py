@@ -17,6 +17,7 @@ from qgis.core import (
     QgsProcessingParameterFile,
     QgsProcessingParameterFileDestination,
     QgsProcessingParameterBoolean,
+    QgsProcessingParameterNumber,
     QgsProcessingParameterDefinition,
     QgsProcessingException,
 )
@@ -24,6 +25,7 @@ from qgis.core import (
 from .algorithm import SlyrAlgorithm
 from ...converters.context import Context
 from ...converters.project import ProjectConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...parser.exceptions import (
     UnreadableSymbolException,
     NotImplementedException,
@@ -43,6 +45,7 @@ class ConvertMxdToQgs(SlyrAlgorithm):
     INPUT = "INPUT"
     OUTPUT = "OUTPUT"
     TEST_MODE = "TEST_MODE"
+    WORKERS = "WORKERS"
 
     # pylint: disable=missing-docstring,unused-argument
 
@@ -84,6 +87,18 @@ class ConvertMxdToQgs(SlyrAlgorithm):
         )
         self.addParameter(param_test_mode)
 
+        workers_param = QgsProcessingParameterNumber(
+            self.WORKERS,
+            "Number of worker processes (only available from standalone Python scripts)",
+            QgsProcessingParameterNumber.Type.Integer,
+            defaultValue=1,
+            minValue=1,
+        )
+        workers_param.setFlags(
+            workers_param.flags() | QgsProcessingParameterDefinition.Flag.FlagAdvanced
+        )
+        self.addParameter(workers_param)
+
         self.addParameter(
             QgsProcessingParameterFileDestination(
                 self.OUTPUT,
@@ -106,10 +121,15 @@ class ConvertMxdToQgs(SlyrAlgorithm):
         input_file = self.parameterAsString(parameters, self.INPUT, context)
         output_file = self.parameterAsFileOutput(parameters, self.OUTPUT, context)
         test_mode = self.parameterAsBool(parameters, self.TEST_MODE, context)
+        max_workers = self.parameterAsInt(parameters, self.WORKERS, context)
 
         slyr_context = Context()
         slyr_context.ignore_online_sources = test_mode
-        p = self.convert_project(input_file, feedback, slyr_context)
+        with SymbolConversionCache.from_settings() as symbol_cache:
+            slyr_context.symbol_cache = symbol_cache
+            p = self.convert_project(
+                input_file, feedback, slyr_context, max_workers=max_workers
+            )
         if p and not test_mode and not p.write(output_file):
             raise QgsProcessingException(
                 "Error writing to output file: {}".format(p.error())
@@ -120,9 +140,14 @@ class ConvertMxdToQgs(SlyrAlgorithm):
     # pylint: enable=missing-docstring,unused-argument
 
     @staticmethod
-    def convert_project(input_file, feedback, slyr_context: Context):
+    def convert_project(
+        input_file, feedback, slyr_context: Context, max_workers: int = 1
+    ):
         """
         Converts an MXD project
+
+        Layers are converted in parallel if max_workers is greater than 1
+        (when worker processes can be spawned only, see worker_count()).
         """
         warnings = set()
         info = set()
@@ -184,7 +209,7 @@ class ConvertMxdToQgs(SlyrAlgorithm):
 
             try:
                 p = ProjectConverter.convert_project(
-                    input_file, doc, context=slyr_context
+                    input_file, doc, context=slyr_context, max_workers=max_workers
                 )
             except NotImplementedException as e:
                 feedback.reportError(str(e), fatalError=True)
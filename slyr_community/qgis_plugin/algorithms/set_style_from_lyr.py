@@ -21,6 +21,7 @@ from qgis.core import (
 from .algorithm import SlyrAlgorithm
 from ...converters.context import Context
 from ...converters.layers import LayerConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...converters.vector_renderer import VectorRendererConverter
 from ...parser.objects.group_layer import GroupLayer
 from ...parser.stream import Stream
@@ -101,9 +102,11 @@ class StyleFromLyr(SlyrAlgorithm):
             if not LayerConverter.is_layer(feature_layer):
                 raise QgsProcessingException("Could not read LYR")
 
-            renderer = VectorRendererConverter.convert_renderer(
-                feature_layer.renderer, feature_layer, conversion_context, layer
-            )
+            with SymbolConversionCache.from_settings() as symbol_cache:
+                conversion_context.symbol_cache = symbol_cache
+                renderer = VectorRendererConverter.convert_renderer(
+                    feature_layer.renderer, feature_layer, conversion_context, layer
+                )
             if renderer:
                 layer.setRenderer(renderer)
                 layer.triggerRepaint()
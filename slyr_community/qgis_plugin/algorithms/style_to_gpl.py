@@ -72,12 +72,6 @@ class StyleToGpl(SlyrAlgorithm):
         if not res:
             return False, error
 
-        if not Extractor.is_mdb_tools_binary_available():
-            return (
-                False,
-                'The MDB tools "mdb-export" utility is required to convert .style databases. Please setup a path to the MDB tools utility in the Settings - Options dialog, under the SLYR tab.',
-            )
-
         return True, None
 
     def initAlgorithm(self, config=None):
@@ -11,7 +11,6 @@ Converts .style databases to QGIS Style XML databases
 #  *                                                                         *
 #  ***************************************************************************/
 
-from io import BytesIO
 from pathlib import Path
 
 from qgis.PyQt.QtCore import QVariant, QRegularExpression
@@ -22,6 +21,7 @@ from qgis.core import (
     QgsProcessingParameterFileDestination,
     QgsProcessingParameterFeatureSink,
     QgsProcessingParameterEnum,
+    QgsProcessingParameterNumber,
     QgsProcessingOutputNumber,
     QgsProcessingParameterString,
     QgsProcessingException,
@@ -38,16 +38,9 @@ from qgis.core import (
 from .algorithm import SlyrAlgorithm
 from ...bintools.extractor import Extractor, MissingBinaryException
 from ...converters.context import Context
-from ...converters.geometry import GeometryConverter
-from ...converters.symbols import SymbolConverter
-from ...parser.exceptions import (
-    UnreadableSymbolException,
-    UnsupportedVersionException,
-    NotImplementedException,
-    UnknownClsidException,
-    UnreadablePictureException,
-)
-from ...parser.stream import Stream
+from ...converters.style_database import StyleDatabaseConverter
+from ...converters.symbol_cache import SymbolConversionCache
+from ...converters.worker_pool import worker_count
 
 try:
     from qgis.core import QgsLegendPatchShape  # pylint: disable=ungrouped-imports
@@ -65,6 +58,7 @@ class StyleToQgisXml(SlyrAlgorithm):
     REPORT = "REPORT"
     OBJECT_TYPES = "OBJECT_TYPES"
     FILTER = "FILTER"
+    WORKERS = "WORKERS"
     ALL_OBJECT_TYPES = [
         Extractor.FILL_SYMBOLS,
         Extractor.LINE_SYMBOLS,
@@ -114,14 +108,6 @@ class StyleToQgisXml(SlyrAlgorithm):
         if not res:
             return False, error
 
-        if not Extractor.is_mdb_tools_binary_available():
-            return False, (
-                'The MDB tools "mdb-export" utility is required '
-                "to convert .style databases. Please setup a "
-                "path to the MDB tools utility in the "
-                "Settings - Options dialog, under the SLYR tab."
-            )
-
         return True, None
 
     def group(self):
@@ -159,6 +145,18 @@ class StyleToQgisXml(SlyrAlgorithm):
         )
         self.addParameter(filter_param)
 
+        workers_param = QgsProcessingParameterNumber(
+            self.WORKERS,
+            "Number of worker processes (only available from standalone Python scripts)",
+            QgsProcessingParameterNumber.Type.Integer,
+            defaultValue=1,
+            minValue=1,
+        )
+        workers_param.setFlags(
+            workers_param.flags() | QgsProcessingParameterDefinition.Flag.FlagAdvanced
+        )
+        self.addParameter(workers_param)
+
         self.addParameter(
             QgsProcessingParameterFileDestination(
                 self.OUTPUT, "Destination XML file", fileFilter="XML files (*.xml)"
@@ -267,6 +265,11 @@ class StyleToQgisXml(SlyrAlgorithm):
                 QRegularExpression.PatternOption.CaseInsensitiveOption,
             )
 
+        # worker processes can only be spawned from a standalone Python interpreter
+        max_workers = worker_count(
+            self.parameterAsInt(parameters, self.WORKERS, context)
+        )
+
         fields = QgsFields()
         fields.append(QgsField("name", QVariant.String, "", 60))
         fields.append(QgsField("warning", QVariant.String, "", 250))
@@ -278,6 +281,11 @@ class StyleToQgisXml(SlyrAlgorithm):
 
         results = {}
 
+        # settings are read once, and shared by the contexts for each symbol
+        base_context = Context()
+        # style databases often contain duplicate symbols
+        base_context.symbol_cache = SymbolConversionCache.from_settings()
+
         symbol_names = set()
 
         def make_name_unique(original_name):
@@ -305,92 +313,65 @@ class StyleToQgisXml(SlyrAlgorithm):
             feedback.pushInfo("Importing {} from {}".format(symbol_type, input_file))
 
             try:
-                raw_symbols = Extractor.extract_styles(input_file, symbol_type)
+                raw_symbols = Extractor.iter_styles(input_file, symbol_type)
             except MissingBinaryException:
                 raise QgsProcessingException(  # pylint: disable=raise-missing-from
                     'The MDB tools "mdb-export" utility is required to convert .style databases. Please setup a path to the MDB tools utility in the SLYR options panel.'
                 )
 
-            feedback.pushInfo(
-                'Found {} symbols of type "{}"\n\n'.format(
-                    len(raw_symbols), symbol_type
+            # symbols are read lazily, so the total is only known up front
+            # when it can be read directly from the database
+            symbol_count = Extractor.count_styles(input_file, symbol_type)
+            if symbol_count is not None:
+                feedback.pushInfo(
+                    'Found {} symbols of type "{}"\n\n'.format(
+                        symbol_count, symbol_type
+                    )
                 )
-            )
 
             if feedback.isCanceled():
                 break
 
             unreadable = 0
-            for index, raw_symbol in enumerate(raw_symbols):
-                feedback.setProgress(
-                    index / len(raw_symbols) * type_percent + type_percent * type_index
-                )
-                if feedback.isCanceled():
-                    break
-                name = raw_symbol[Extractor.NAME]
-                if not name:
-                    name = "unnamed"
-
-                if type_filter_re and not type_filter_re.match(name).hasMatch():
-                    continue
+            read_count = 0
+
+            def prepared_symbols():  # pylint: disable=cell-var-from-loop
+                """
+                Yields the (name, unique name, blob, key) of symbols to convert
+                """
+                nonlocal read_count
+                for index, raw_symbol in enumerate(raw_symbols):
+                    read_count = index + 1
+                    if feedback.isCanceled():
+                        break
+                    name = raw_symbol[Extractor.NAME]
+                    if not name:
+                        name = "unnamed"
+
+                    if type_filter_re and not type_filter_re.match(name).hasMatch():
+                        continue
 
-                tags = raw_symbol[Extractor.TAGS].split(";")
-                feedback.pushInfo("{}/{}: {}".format(index + 1, len(raw_symbols), name))
+                    tags = raw_symbol[Extractor.TAGS].split(";")
+                    if symbol_count is not None:
+                        feedback.pushInfo(
+                            "{}/{}: {}".format(index + 1, symbol_count, name)
+                        )
+                    else:
+                        feedback.pushInfo("{}: {}".format(index + 1, name))
 
-                unique_name = make_name_unique(name)
-                if name != unique_name:
-                    feedback.pushInfo(
-                        "Corrected to unique name of {}".format(unique_name)
-                    )
+                    unique_name = make_name_unique(name)
+                    if name != unique_name:
+                        feedback.pushInfo(
+                            "Corrected to unique name of {}".format(unique_name)
+                        )
 
-                handle = BytesIO(raw_symbol[Extractor.BLOB])
-                stream = Stream(handle)
-
-                f = QgsFeature()
-                try:
-                    symbol = stream.read_object()
-                except UnreadableSymbolException as e:
-                    feedback.reportError(
-                        "Error reading symbol {}: {}".format(name, e), False
-                    )
-                    unreadable += 1
-                    if sink:
-                        f.setAttributes([name, "Error reading symbol: {}".format(e)])
-                        sink.addFeature(f)
-                    continue
-                except NotImplementedException as e:
-                    feedback.reportError(
-                        "Parsing {} is not supported: {}".format(name, e), False
-                    )
-                    unreadable += 1
-                    if sink:
-                        f.setAttributes([name, "Parsing not supported: {}".format(e)])
-                        sink.addFeature(f)
-                    continue
-                except UnsupportedVersionException as e:
-                    feedback.reportError(
-                        "Cannot read {} version: {}".format(name, e), False
-                    )
-                    unreadable += 1
-                    if sink:
-                        f.setAttributes([name, "Version not supported: {}".format(e)])
-                        sink.addFeature(f)
-                    continue
-                except UnknownClsidException as e:
-                    feedback.reportError(str(e), False)
-                    unreadable += 1
-                    if sink:
-                        f.setAttributes([name, "Unknown object: {}".format(e)])
-                        sink.addFeature(f)
-                    continue
-                except UnreadablePictureException as e:
-                    feedback.reportError(str(e), False)
-                    unreadable += 1
-                    if sink:
-                        f.setAttributes([name, "Unreadable picture: {}".format(e)])
-                        sink.addFeature(f)
-                    continue
+                    key = (index, name, unique_name, tags)
+                    yield name, unique_name, raw_symbol[Extractor.BLOB], key
 
+            def create_callback(name):
+                """
+                Creates a callback for warnings raised while converting a symbol
+                """
                 warnings = set()
                 info = set()
 
@@ -414,44 +395,65 @@ class StyleToQgisXml(SlyrAlgorithm):
 
                     if sink:
                         feat = QgsFeature()
-                        feat.setAttributes([name, msg])  # pylint: disable=cell-var-from-loop
+                        feat.setAttributes([name, msg])
                         sink.addFeature(feat)
 
-                context = Context()
-                context.symbol_name = unique_name
-                context.unsupported_object_callback = unsupported_object_callback
+                return unsupported_object_callback
+
+            def convert_in_process(symbols):  # pylint: disable=cell-var-from-loop
+                """
+                Converts symbols in this process, reporting warnings as they are raised
+                """
+                for name, unique_name, blob, key in symbols:
+                    symbol_context = base_context.for_symbol(unique_name)
+                    symbol_context.unsupported_object_callback = create_callback(name)
+                    qgis_symbol, error = StyleDatabaseConverter.convert_symbol(
+                        symbol_type, name, blob, symbol_context
+                    )
+                    yield key, qgis_symbol, error, []
 
-                if symbol_type in (Extractor.AREA_PATCHES, Extractor.LINE_PATCHES):
-                    if symbol_type == Extractor.LINE_PATCHES:
-                        geom = GeometryConverter.convert_geometry(symbol.polyline)
-                        qgis_symbol = QgsLegendPatchShape(
-                            QgsSymbol.SymbolType.Line, geom, symbol.preserve_aspect
-                        )
-                    elif symbol_type == Extractor.AREA_PATCHES:
-                        geom = GeometryConverter.convert_geometry(symbol.polygon)
-                        qgis_symbol = QgsLegendPatchShape(
-                            QgsSymbol.SymbolType.Fill, geom, symbol.preserve_aspect
-                        )
-                else:
-                    try:
-                        qgis_symbol = SymbolConverter.Symbol_to_QgsSymbol(
-                            symbol, context
-                        )
+            # EMF pictures are converted in batches ahead of the symbols which
+            # use them, instead of running Inkscape once for each picture. Only
+            # the symbols matching the filter are considered.
+            symbols_to_convert = StyleDatabaseConverter.with_preconverted_emf_pictures(
+                symbol_type, prepared_symbols(), lambda symbol: symbol[2], base_context
+            )
 
-                    except NotImplementedException as e:
-                        feedback.reportError(str(e), False)
-                        unreadable += 1
-                        if sink:
-                            f.setAttributes([name, str(e)])
-                            sink.addFeature(f)
-                        continue
-                    except UnreadablePictureException as e:
-                        feedback.reportError(str(e), False)
-                        unreadable += 1
-                        if sink:
-                            f.setAttributes([name, "Unreadable picture: {}".format(e)])
-                            sink.addFeature(f)
-                        continue
+            if max_workers > 1:
+                converted_symbols = StyleDatabaseConverter.convert_symbols(
+                    symbol_type, symbols_to_convert, base_context, max_workers
+                )
+            else:
+                converted_symbols = convert_in_process(symbols_to_convert)
+
+            for (
+                (index, name, unique_name, tags),
+                qgis_symbol,
+                error,
+                warnings,
+            ) in converted_symbols:
+                if symbol_count:
+                    feedback.setProgress(
+                        index / symbol_count * type_percent + type_percent * type_index
+                    )
+                if feedback.isCanceled():
+                    break
+
+                if warnings:
+                    # warnings raised in a worker process
+                    callback = create_callback(name)
+                    for msg, level in warnings:
+                        callback(msg, level=level)
+
+                if error:
+                    message, report_message = error
+                    feedback.reportError(message, False)
+                    unreadable += 1
+                    if sink:
+                        f = QgsFeature()
+                        f.setAttributes([name, report_message])
+                        sink.addFeature(f)
+                    continue
 
                 if isinstance(qgis_symbol, QgsSymbol):
                     style.addSymbol(unique_name, qgis_symbol, True)
@@ -498,30 +500,32 @@ class StyleToQgisXml(SlyrAlgorithm):
                             raise AssertionError("Could not tag symbol")
 
             if symbol_type == Extractor.FILL_SYMBOLS:
-                results[self.FILL_SYMBOL_COUNT] = len(raw_symbols)
+                results[self.FILL_SYMBOL_COUNT] = read_count
                 results[self.UNREADABLE_FILL_SYMBOLS] = unreadable
             elif symbol_type == Extractor.LINE_SYMBOLS:
-                results[self.LINE_SYMBOL_COUNT] = len(raw_symbols)
+                results[self.LINE_SYMBOL_COUNT] = read_count
                 results[self.UNREADABLE_LINE_SYMBOLS] = unreadable
             elif symbol_type == Extractor.MARKER_SYMBOLS:
-                results[self.MARKER_SYMBOL_COUNT] = len(raw_symbols)
+                results[self.MARKER_SYMBOL_COUNT] = read_count
                 results[self.UNREADABLE_MARKER_SYMBOLS] = unreadable
             elif symbol_type == Extractor.COLOR_RAMPS:
-                results[self.COLOR_RAMP_COUNT] = len(raw_symbols)
+                results[self.COLOR_RAMP_COUNT] = read_count
                 results[self.UNREADABLE_COLOR_RAMPS] = unreadable
             elif symbol_type == Extractor.TEXT_SYMBOLS:
-                results[self.TEXT_FORMAT_COUNT] = len(raw_symbols)
+                results[self.TEXT_FORMAT_COUNT] = read_count
                 results[self.UNREADABLE_TEXT_FORMATS] = unreadable
             elif symbol_type in (Extractor.MAPLEX_LABELS, Extractor.LABELS):
-                results[self.LABEL_SETTINGS_COUNT] += len(raw_symbols)
+                results[self.LABEL_SETTINGS_COUNT] += read_count
                 results[self.UNREADABLE_LABEL_SETTINGS] += unreadable
             elif symbol_type == Extractor.LINE_PATCHES:
-                results[self.LINE_PATCH_COUNT] = len(raw_symbols)
+                results[self.LINE_PATCH_COUNT] = read_count
                 results[self.UNREADABLE_LINE_PATCHES] = unreadable
             elif symbol_type == Extractor.AREA_PATCHES:
-                results[self.AREA_PATCH_COUNT] = len(raw_symbols)
+                results[self.AREA_PATCH_COUNT] = read_count
                 results[self.UNREADABLE_AREA_PATCHES] = unreadable
 
+        base_context.symbol_cache.close()
+
         style.exportXml(output_file)
         results[self.OUTPUT] = output_file
         results[self.REPORT] = dest
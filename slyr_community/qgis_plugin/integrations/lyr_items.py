@@ -40,6 +40,7 @@ from .browser_utils import BrowserUtils
 from ..gui_utils import GuiUtils
 from ...converters.context import Context
 from ...converters.layers import LayerConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...converters.vector_layer import VectorLayerConverter
 from ...converters.vector_renderer import VectorRendererConverter
 
@@ -213,15 +214,18 @@ class LyrDropHandler(QgsCustomDropHandler):
 
         obj = stream.read_object()
 
-        if LayerConverter.is_layer(obj):
-            add_layer(obj, QgsProject.instance().layerTreeRoot())
-        elif LayerConverter.is_group(obj):
-            add_group(obj, QgsProject.instance().layerTreeRoot())
-        else:
-            iface.messageBar().pushCritical(
-                "SLYR", "{} layers are not yet supported".format(obj.__class__.__name__)
-            )
-            return True
+        with SymbolConversionCache.from_settings() as symbol_cache:
+            context.symbol_cache = symbol_cache
+            if LayerConverter.is_layer(obj):
+                add_layer(obj, QgsProject.instance().layerTreeRoot())
+            elif LayerConverter.is_group(obj):
+                add_group(obj, QgsProject.instance().layerTreeRoot())
+            else:
+                iface.messageBar().pushCritical(
+                    "SLYR",
+                    "{} layers are not yet supported".format(obj.__class__.__name__),
+                )
+                return True
 
         if warnings or errors or info:
             message = ""
@@ -572,10 +576,12 @@ class EsriLyrItem(QgsDataItem):
                 else:
                     add_layer(c, group_node)
 
-        if isinstance(self.object, (GroupLayer, BaseMapLayer)):
-            add_group(self.object, QgsProject.instance().layerTreeRoot())
-        else:
-            add_layer(self.object, QgsProject.instance().layerTreeRoot())
+        with SymbolConversionCache.from_settings() as symbol_cache:
+            context.symbol_cache = symbol_cache
+            if isinstance(self.object, (GroupLayer, BaseMapLayer)):
+                add_group(self.object, QgsProject.instance().layerTreeRoot())
+            else:
+                add_layer(self.object, QgsProject.instance().layerTreeRoot())
 
         return True
 
@@ -608,24 +614,26 @@ class EsriLyrItem(QgsDataItem):
 
         layers = LayerConverter.unique_layer_name_map(root_object)
 
-        for name, layer in layers.items():
-            if not isinstance(layer, FeatureLayer):
-                continue
-
-            symbols = VectorRendererConverter.extract_symbols_from_renderer(
-                layer,
-                context,
-                default_name=name,
-                base_name=name if len(layers) > 1 else "",
-            )
+        with SymbolConversionCache.from_settings() as symbol_cache:
+            context.symbol_cache = symbol_cache
+            for name, layer in layers.items():
+                if not isinstance(layer, FeatureLayer):
+                    continue
+
+                symbols = VectorRendererConverter.extract_symbols_from_renderer(
+                    layer,
+                    context,
+                    default_name=name,
+                    base_name=name if len(layers) > 1 else "",
+                )
 
-            for k, v in symbols.items():
-                if isinstance(v, QgsSymbol):
-                    style.addSymbol(k, v, True)
-                elif isinstance(v, QgsColorRamp):
-                    style.addColorRamp(k, v, True)
-                elif isinstance(v, QgsTextFormat):
-                    style.addTextFormat(k, v, True)
+                for k, v in symbols.items():
+                    if isinstance(v, QgsSymbol):
+                        style.addSymbol(k, v, True)
+                    elif isinstance(v, QgsColorRamp):
+                        style.addColorRamp(k, v, True)
+                    elif isinstance(v, QgsTextFormat):
+                        style.addTextFormat(k, v, True)
 
         dlg = QgsStyleManagerDialog(style, readOnly=True)
         dlg.setFavoritesGroupVisible(False)
@@ -670,13 +678,15 @@ class EsriLyrItem(QgsDataItem):
             context = Context()
             context.project = QgsProject.instance()
             context.can_place_annotations_in_main_annotation_layer = False
-            res, error = LayerConverter.object_to_qlr(
-                self.object,
-                input_path,
-                dest_path,
-                context,
-                definitions=self.definitions,
-            )
+            with SymbolConversionCache.from_settings() as symbol_cache:
+                context.symbol_cache = symbol_cache
+                res, error = LayerConverter.object_to_qlr(
+                    self.object,
+                    input_path,
+                    dest_path,
+                    context,
+                    definitions=self.definitions,
+                )
             if not res:
                 iface.messageBar().pushMessage(
                     "Save as QLR", error, Qgis.MessageLevel.Critical
@@ -727,14 +737,16 @@ class EsriLyrItem(QgsDataItem):
             context = Context()
             context.project = QgsProject.instance()
             context.can_place_annotations_in_main_annotation_layer = False
-            LayerConverter.layers_to_qml(
-                self.object,
-                input_path,
-                dest_path,
-                context=context,
-                on_error=on_error,
-                definitions=self.definitions,
-            )
+            with SymbolConversionCache.from_settings() as symbol_cache:
+                context.symbol_cache = symbol_cache
+                LayerConverter.layers_to_qml(
+                    self.object,
+                    input_path,
+                    dest_path,
+                    context=context,
+                    on_error=on_error,
+                    definitions=self.definitions,
+                )
 
         if not errors:
             iface.messageBar().pushMessage(
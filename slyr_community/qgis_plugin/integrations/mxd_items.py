@@ -32,6 +32,7 @@ from ..gui_utils import GuiUtils
 
 from ...converters.context import Context
 from ...converters.project import ProjectConverter
+from ...converters.symbol_cache import SymbolConversionCache
 from ...parser.exceptions import EmptyDocumentException, DocumentTypeException
 
 from ...parser.exceptions import RequiresLicenseException
@@ -142,6 +143,7 @@ class MxdDropHandler(QgsCustomDropHandler):
 
             conversion_context.project = QgsProject.instance()
             conversion_context.unsupported_object_callback = unsupported_object_callback
+            conversion_context.symbol_cache = SymbolConversionCache.from_settings()
 
             blocker = None
             if isinstance(obj, MapDocument):
@@ -215,6 +217,8 @@ class MxdDropHandler(QgsCustomDropHandler):
             else:
                 return False
 
+            conversion_context.symbol_cache.close()
+
         try:
             QgsProject.instance().setOriginalPath(input_file)
         except AttributeError:
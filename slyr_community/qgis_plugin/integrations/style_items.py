@@ -12,12 +12,10 @@ Browser and app integrations for STYLE file integration with QGIS
 #  ***************************************************************************/
 
 import html
-from functools import partial
-from io import BytesIO
 
 from processing import execAlgorithmDialog
 from qgis.PyQt.QtCore import QFileInfo, QDir, QCoreApplication
-from qgis.PyQt.QtWidgets import QAction, QProgressDialog, QPushButton
+from qgis.PyQt.QtWidgets import QAction, QProgressDialog
 from qgis.core import (
     Qgis,
     QgsDataItem,
@@ -32,25 +30,14 @@ from qgis.core import (
     QgsLegendPatchShape,
 )
 from qgis.gui import QgsCustomDropHandler, QgsStyleManagerDialog
-from qgis.utils import iface
 
 from .browser_utils import BrowserUtils
 from ..gui_utils import GuiUtils
 
 from ...bintools.extractor import Extractor, MissingBinaryException
 from ...converters.context import Context
-from ...converters.geometry import GeometryConverter
-from ...converters.symbols import SymbolConverter
-
-from ...parser.exceptions import (
-    UnreadableSymbolException,
-    UnsupportedVersionException,
-    NotImplementedException,
-    UnknownClsidException,
-    UnreadablePictureException,
-)
-
-from ...parser.stream import Stream
+from ...converters.style_database import StyleDatabaseConverter
+from ...converters.symbol_cache import SymbolConversionCache
 
 
 class StyleDropHandler(QgsCustomDropHandler):
@@ -72,19 +59,6 @@ class StyleDropHandler(QgsCustomDropHandler):
         Opens a .style file
         """
 
-        if (
-            input_file.lower().endswith(".style")
-            and not Extractor.is_mdb_tools_binary_available()
-        ):
-            message_bar = iface.messageBar()
-            widget = message_bar.createMessage("SLYR", "MDB Tools utility not found")
-            settings_button = QPushButton(
-                "Configure…", pressed=partial(BrowserUtils.open_settings, widget)
-            )
-            widget.layout().addWidget(settings_button)
-            message_bar.pushWidget(widget, Qgis.MessageLevel.Critical)
-            return True
-
         style = QgsStyle()
         style.createMemoryDatabase()
 
@@ -152,9 +126,15 @@ class StyleDropHandler(QgsCustomDropHandler):
 
         type_percent = 100 / len(types_to_extract)
 
+        # settings are read once, and shared by the contexts for each symbol
+        base_context = Context()
+        base_context.project = QgsProject.instance()
+        # style databases often contain duplicate symbols
+        base_context.symbol_cache = SymbolConversionCache.from_settings()
+
         for type_index, symbol_type in enumerate(types_to_extract):
             try:
-                raw_symbols = Extractor.extract_styles(input_file, symbol_type)
+                raw_symbols = Extractor.iter_styles(input_file, symbol_type)
             except MissingBinaryException:
                 BrowserUtils.show_warning(
                     "MDB Tools utility not found",
@@ -162,19 +142,31 @@ class StyleDropHandler(QgsCustomDropHandler):
                     'The MDB tools "mdb-export" utility is required to convert .style databases. Please setup a path to the MDB tools utility in the SLYR options panel.',
                     level=Qgis.MessageLevel.Critical,
                 )
+                base_context.symbol_cache.close()
                 progress_dialog.deleteLater()
                 return True
 
             if feedback.isCanceled():
                 break
 
+            # EMF pictures are converted in batches ahead of the symbols which
+            # use them, instead of running Inkscape once for each picture
+            raw_symbols = StyleDatabaseConverter.with_preconverted_emf_pictures(
+                symbol_type,
+                raw_symbols,
+                lambda raw_symbol: raw_symbol[Extractor.BLOB],
+                base_context,
+            )
+
+            symbol_count = Extractor.count_styles(input_file, symbol_type)
             for index, raw_symbol in enumerate(raw_symbols):
-                feedback.setProgress(
-                    int(
-                        index / len(raw_symbols) * type_percent
-                        + type_percent * type_index
+                if symbol_count:
+                    feedback.setProgress(
+                        int(
+                            index / symbol_count * type_percent
+                            + type_percent * type_index
+                        )
                     )
-                )
                 if feedback.isCanceled():
                     break
                 name = raw_symbol[Extractor.NAME]
@@ -185,43 +177,7 @@ class StyleDropHandler(QgsCustomDropHandler):
 
                 unique_name = make_name_unique(name)
 
-                handle = BytesIO(raw_symbol[Extractor.BLOB])
-                stream = Stream(handle)
-                stream.allow_shortcuts = False
-
-                try:
-                    symbol = stream.read_object()
-                except UnreadableSymbolException as e:
-                    e = "Unreadable object: {}".format(e)
-                    unreadable.append(
-                        "<b>{}</b>: {}".format(html.escape(name), html.escape(str(e)))
-                    )
-                    continue
-                except NotImplementedException as e:
-                    unreadable.append(
-                        "<b>{}</b>: {}".format(html.escape(name), html.escape(str(e)))
-                    )
-                    continue
-                except UnsupportedVersionException as e:
-                    e = "Unsupported version: {}".format(e)
-                    unreadable.append(
-                        "<b>{}</b>: {}".format(html.escape(name), html.escape(str(e)))
-                    )
-                    continue
-                except UnknownClsidException as e:
-                    unreadable.append(
-                        "<b>{}</b>: {}".format(html.escape(name), html.escape(str(e)))
-                    )
-                    continue
-                except UnreadablePictureException as e:
-                    unreadable.append(
-                        "<b>{}</b>: {}".format(html.escape(name), html.escape(str(e)))
-                    )
-                    continue
-
-                context = Context()
-                context.project = QgsProject.instance()
-                context.symbol_name = unique_name
+                context = base_context.for_symbol(unique_name)
 
                 def unsupported_object_callback(msg, level=Context.WARNING):
                     if level == Context.WARNING:
@@ -248,36 +204,14 @@ class StyleDropHandler(QgsCustomDropHandler):
 
                 context.unsupported_object_callback = unsupported_object_callback
 
-                if symbol_type in (Extractor.AREA_PATCHES, Extractor.LINE_PATCHES):
-                    if symbol_type == Extractor.LINE_PATCHES:
-                        geom = GeometryConverter.convert_geometry(symbol.polyline)
-                        qgis_symbol = QgsLegendPatchShape(
-                            QgsSymbol.SymbolType.Line, geom, symbol.preserve_aspect
-                        )
-                    elif symbol_type == Extractor.AREA_PATCHES:
-                        geom = GeometryConverter.convert_geometry(symbol.polygon)
-                        qgis_symbol = QgsLegendPatchShape(
-                            QgsSymbol.SymbolType.Fill, geom, symbol.preserve_aspect
-                        )
-                else:
-                    try:
-                        qgis_symbol = SymbolConverter.Symbol_to_QgsSymbol(
-                            symbol, context
-                        )
-                    except NotImplementedException as e:
-                        unreadable.append(
-                            "<b>{}</b>: {}".format(
-                                html.escape(name), html.escape(str(e))
-                            )
-                        )
-                        continue
-                    except UnreadablePictureException as e:
-                        unreadable.append(
-                            "<b>{}</b>: {}".format(
-                                html.escape(name), html.escape(str(e))
-                            )
-                        )
-                        continue
+                qgis_symbol, error = StyleDatabaseConverter.convert_symbol(
+                    symbol_type, name, raw_symbol[Extractor.BLOB], context
+                )
+                if error:
+                    unreadable.append(
+                        "<b>{}</b>: {}".format(html.escape(name), html.escape(error[1]))
+                    )
+                    continue
 
                 if isinstance(qgis_symbol, QgsSymbol):
                     # self.check_for_missing_fonts(qgis_symbol, feedback)
@@ -323,6 +257,7 @@ class StyleDropHandler(QgsCustomDropHandler):
                             tags,
                         ):
                             raise AssertionError("Could not tag symbol")
+        base_context.symbol_cache.close()
         progress_dialog.deleteLater()
         if feedback.isCanceled():
             return True
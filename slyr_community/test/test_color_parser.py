@@ -6,7 +6,7 @@ import unittest
 
 from .test_case import SlyrTestCase
 
-from ..parser.color_parser import cielab_to_rgb
+from ..parser.color_parser import cielab_to_rgb, cielab_to_rgb_list, lookup_lab
 
 
 class TestColorParser(SlyrTestCase):
@@ -70,6 +70,28 @@ class TestColorParser(SlyrTestCase):
         self.assertEqual(2, g)
         self.assertEqual(2, b)
 
+    def test_lookup_lab(self):
+        self.assertEqual(lookup_lab(32.6742, 51.5019, 45.4267), (131, 2, 2))
+        self.assertIsNone(lookup_lab(32.6743, 51.5019, 45.4267))
+        self.assertIsNone(lookup_lab(-1, 0, 0))
+        self.assertIsNone(lookup_lab(50, 1000, 0))
+
+    def test_lab_to_rgb_list(self):
+        red = (56.547017615341, 76.8994334713463, 68.1034442713808)
+        green = (85.6070742290004, -91.4861929759672, 73.9622026853808)
+        lut = (32.6742, 51.5019, 45.4267)
+        lut2 = (32.67421111111, 51.50189999999, 45.4267000001)
+        values = [red, lut, green, red, lut2, (-1, 0, 0)]
+        self.assertEqual(
+            cielab_to_rgb_list(values),
+            [cielab_to_rgb(*lab) for lab in values],
+        )
+        self.assertEqual(
+            cielab_to_rgb_list(values)[:5],
+            [(255, 0, 0), (131, 2, 2), (0, 255, 0), (255, 0, 0), (131, 2, 2)],
+        )
+        self.assertEqual(cielab_to_rgb_list([]), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -173,6 +173,28 @@ class TestConversionContext(SlyrTestCase):
             context.picture_folder = tmp_dir
             self.assertFalse(context.embed_svgs())
 
+    def test_clone(self):
+        settings = Context.read_settings()
+        settings["inkscape_path"] = "/my/inkscape"
+        context = Context(settings)
+        self.assertEqual(context.inkscape_path, "/my/inkscape")
+
+        context.picture_folder = "/pictures"
+        context.symbol_layer_output_to_input_index_map["a"] = 1
+        context.warned_crs_definitions.add("wkt")
+
+        clone = context.for_symbol("my symbol")
+        self.assertEqual(clone.symbol_name, "my symbol")
+        self.assertIsNone(context.symbol_name)
+        self.assertEqual(clone.inkscape_path, "/my/inkscape")
+        self.assertEqual(clone.picture_folder, "/pictures")
+        self.assertEqual(clone.units, context.units)
+        # per item state must not be shared
+        self.assertFalse(clone.symbol_layer_output_to_input_index_map)
+        self.assertFalse(clone.warned_crs_definitions)
+        self.assertEqual(context.symbol_layer_output_to_input_index_map, {"a": 1})
+        self.assertEqual(context.warned_crs_definitions, {"wkt"})
+
 
 if __name__ == "__main__":
     unittest.main()
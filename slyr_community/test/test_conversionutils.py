@@ -6,6 +6,8 @@ Test Conversion Utils
 
 import unittest
 
+from qgis.PyQt.QtGui import QFontDatabase
+
 from .test_case import SlyrTestCase
 
 from ..converters.utils import ConversionUtils
@@ -27,6 +29,51 @@ class TestConversionUtils(SlyrTestCase):
             ConversionUtils.safe_filename("abc §DEF 12üA.def"), "abc__DEF_12u_A_def"
         )
 
+    def test_font_index(self):
+        """
+        Test font lookups
+        """
+        ConversionUtils.invalidate_font_index()
+        index = ConversionUtils.font_index()
+        self.assertIs(ConversionUtils.font_index(), index)
+
+        families = ConversionUtils.available_font_families()
+        self.assertEqual(families, index.families)
+        if families:
+            family = families[0]
+            self.assertTrue(ConversionUtils.is_font_family_available(family))
+            self.assertEqual(
+                ConversionUtils.correct_font_capitalisation(
+                    " {} ".format(family.upper())
+                ).lower(),
+                family.lower(),
+            )
+            try:
+                expected_styles = QFontDatabase().styles(family)
+            except TypeError:
+                expected_styles = QFontDatabase.styles(family)
+            self.assertNotIn(family, index.styles)
+            self.assertEqual(
+                ConversionUtils.available_font_styles(family), list(expected_styles)
+            )
+            # styles are read from the index after the first lookup
+            self.assertEqual(index.styles[family], expected_styles)
+            styles = ConversionUtils.available_font_styles(family)
+            self.assertEqual(styles, list(expected_styles))
+            # callers can't modify the cached styles
+            styles.append("not a style")
+            self.assertEqual(
+                ConversionUtils.available_font_styles(family), list(expected_styles)
+            )
+        self.assertFalse(ConversionUtils.is_font_family_available("not a font xxx"))
+        self.assertEqual(
+            ConversionUtils.correct_font_capitalisation("not a font xxx"),
+            "not a font xxx",
+        )
+
+        ConversionUtils.invalidate_font_index()
+        self.assertIsNot(ConversionUtils.font_index(), index)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,235 @@
+"""
+Test EMF conversion
+"""
+
+import unittest
+import os
+import stat
+import struct
+import tempfile
+from io import BytesIO
+
+from qgis.PyQt.QtCore import QSettings
+from qgis.core import QgsApplication
+
+from .test_case import SlyrTestCase
+from ..converters.emf import EmfConverter
+from ..parser.initalize_registry import initialize_registry
+from ..parser.stream import Stream
+
+initialize_registry()
+
+# a fake inkscape, which writes a fixed svg and logs each call. Batch exports
+# (writing an svg next to each emf file) are only supported if batch is set
+FAKE_INKSCAPE = """#!/bin/sh
+echo "$@" >> "{log}"
+svg='<svg xmlns="http://www.w3.org/2000/svg" width="10" height="5"></svg>'
+batch="{batch}"
+out=""
+while [ $# -gt 0 ]; do
+  if [ "$1" = "-o" ]; then out="$2"; fi
+  if [ "$1" = "--export-type=svg" ] && [ -z "$batch" ]; then exit 0; fi
+  case "$1" in
+    *.emf) if [ -n "$batch" ]; then echo "$svg" > "${{1%.emf}}.svg"; fi ;;
+  esac
+  shift
+done
+if [ -n "$out" ]; then
+  echo "$svg" > "$out"
+fi
+"""
+
+
+@unittest.skipIf(os.name == "nt", "requires a POSIX shell")
+class TestEmfConverter(SlyrTestCase):
+    """
+    Test EMF conversion
+    """
+
+    @staticmethod
+    def create_fake_inkscape(folder: str, batch: bool):
+        """
+        Creates a fake inkscape executable, returning its path and the
+        path of the call log
+        """
+        log = os.path.join(folder, "calls.log")
+        inkscape = os.path.join(folder, "inkscape")
+        with open(inkscape, "wt", encoding="utf-8") as f:
+            f.write(FAKE_INKSCAPE.format(log=log, batch="1" if batch else ""))
+        os.chmod(inkscape, os.stat(inkscape).st_mode | stat.S_IEXEC)
+        return inkscape, log
+
+    @staticmethod
+    def call_count(log: str) -> int:
+        """
+        Returns the number of calls made to a fake inkscape
+        """
+        if not os.path.exists(log):
+            return 0
+        with open(log, "rt", encoding="utf-8") as f:
+            return len(f.readlines())
+
+    def test_cache_folder(self):
+        # defaults to the (per user) QGIS settings folder
+        self.assertTrue(
+            EmfConverter.cache_folder().startswith(QgsApplication.qgisSettingsDirPath())
+        )
+        self.assertTrue(EmfConverter.cache_enabled())
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            inkscape, log = self.create_fake_inkscape(tmp_dir, False)
+
+            QSettings().setValue(
+                "/plugins/slyr/emf_cache_path", os.path.join(tmp_dir, "cache")
+            )
+            try:
+                emf_path = os.path.join(tmp_dir, "picture.emf")
+                with open(emf_path, "wb") as f:
+                    f.write(b"not really an emf")
+
+                svg_path = os.path.join(tmp_dir, "picture.svg")
+                EmfConverter.emf_to_svg(emf_path, svg_path, inkscape_path=inkscape)
+                self.assertTrue(os.path.exists(svg_path))
+                with open(svg_path, "rt", encoding="utf-8") as f:
+                    svg = f.read()
+                # width and height are removed
+                self.assertNotIn("width", svg)
+
+                # identical content is read from the cache
+                svg_path2 = os.path.join(tmp_dir, "picture2.svg")
+                EmfConverter.emf_to_svg(emf_path, svg_path2, inkscape_path=inkscape)
+                with open(svg_path2, "rt", encoding="utf-8") as f:
+                    self.assertEqual(f.read(), svg)
+
+                self.assertEqual(self.call_count(log), 1)
+            finally:
+                QSettings().remove("/plugins/slyr/emf_cache_path")
+
+    def test_disabled_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            inkscape, log = self.create_fake_inkscape(tmp_dir, False)
+
+            QSettings().setValue(
+                "/plugins/slyr/emf_cache_path", os.path.join(tmp_dir, "cache")
+            )
+            QSettings().setValue("/plugins/slyr/enable_emf_cache", 0)
+            try:
+                content = b"not really an emf"
+                self.assertEqual(
+                    EmfConverter.convert_batch([content], inkscape_path=inkscape), 0
+                )
+                self.assertEqual(self.call_count(log), 0)
+
+                emf_path = os.path.join(tmp_dir, "picture.emf")
+                with open(emf_path, "wb") as f:
+                    f.write(content)
+                for svg_name in ("picture.svg", "picture2.svg"):
+                    svg_path = os.path.join(tmp_dir, svg_name)
+                    EmfConverter.emf_to_svg(emf_path, svg_path, inkscape_path=inkscape)
+                    self.assertTrue(os.path.exists(svg_path))
+
+                self.assertEqual(self.call_count(log), 2)
+                self.assertFalse(os.path.exists(os.path.join(tmp_dir, "cache")))
+            finally:
+                QSettings().remove("/plugins/slyr/emf_cache_path")
+                QSettings().remove("/plugins/slyr/enable_emf_cache")
+
+    def test_convert_batch(self):
+        for batch in (True, False):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                inkscape, log = self.create_fake_inkscape(tmp_dir, batch)
+
+                QSettings().setValue(
+                    "/plugins/slyr/emf_cache_path", os.path.join(tmp_dir, "cache")
+                )
+                try:
+                    contents = [
+                        b"not really an emf",
+                        b"also not an emf",
+                        b"not really an emf",
+                    ]
+                    self.assertEqual(
+                        EmfConverter.convert_batch(contents, inkscape_path=inkscape),
+                        2,
+                    )
+                    for content in contents:
+                        self.assertTrue(
+                            os.path.exists(EmfConverter.cached_svg_path(content))
+                        )
+
+                    if batch:
+                        # all pictures are converted by a single inkscape call
+                        self.assertEqual(self.call_count(log), 1)
+                    else:
+                        # the batch call is followed by a call for each picture
+                        self.assertEqual(self.call_count(log), 3)
+                    call_count = self.call_count(log)
+
+                    # cached pictures aren't converted again
+                    self.assertEqual(
+                        EmfConverter.convert_batch(contents, inkscape_path=inkscape),
+                        0,
+                    )
+                    emf_path = os.path.join(tmp_dir, "picture.emf")
+                    with open(emf_path, "wb") as f:
+                        f.write(contents[1])
+                    svg_path = os.path.join(tmp_dir, "picture.svg")
+                    EmfConverter.emf_to_svg(emf_path, svg_path, inkscape_path=inkscape)
+                    with open(svg_path, "rt", encoding="utf-8") as f:
+                        self.assertNotIn("width", f.read())
+                    self.assertEqual(self.call_count(log), call_count)
+                finally:
+                    QSettings().remove("/plugins/slyr/emf_cache_path")
+
+    def test_native_conversion(self):
+        path = os.path.join(
+            os.path.dirname(__file__),
+            "styles",
+            "marker_bin",
+            "Picture Marker Version 4.bin",
+        )
+        with open(path, "rb") as f:
+            symbol = Stream(BytesIO(f.read())).read_object()
+        content = symbol.layers[0].picture.picture.content
+
+        # insert a clipping rectangle after the header
+        header_size = struct.unpack_from("<I", content, 4)[0]
+        clipped_content = (
+            content[:header_size]
+            + struct.pack("<IIiiii", 0x1E, 24, 430, 300, 500, 400)
+            + content[header_size:]
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            inkscape, log = self.create_fake_inkscape(tmp_dir, False)
+
+            QSettings().setValue("/plugins/slyr/enable_emf_cache", 0)
+            try:
+
+                def convert(emf_content):
+                    emf_path = os.path.join(tmp_dir, "picture.emf")
+                    with open(emf_path, "wb") as f:
+                        f.write(emf_content)
+                    svg_path = os.path.join(tmp_dir, "picture.svg")
+                    EmfConverter.emf_to_svg(emf_path, svg_path, inkscape_path=inkscape)
+                    with open(svg_path, "rt", encoding="utf-8") as f:
+                        return f.read()
+
+                self.assertIn("<path", convert(content))
+                self.assertEqual(self.call_count(log), 0)
+
+                # pictures using clipping are converted by inkscape
+                self.assertNotIn("<path", convert(clipped_content))
+                self.assertEqual(self.call_count(log), 1)
+
+                QSettings().setValue("/plugins/slyr/force_inkscape_emf", 1)
+                self.assertNotIn("<path", convert(content))
+                self.assertEqual(self.call_count(log), 2)
+            finally:
+                QSettings().remove("/plugins/slyr/enable_emf_cache")
+                QSettings().remove("/plugins/slyr/force_inkscape_emf")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Test native EMF to SVG translation
+"""
+
+import unittest
+import os
+import struct
+from io import BytesIO
+from xml.etree import ElementTree
+
+from .test_case import SlyrTestCase
+from ..converters.emf_svg import (
+    EMR_CREATEBRUSHINDIRECT,
+    EMR_RECTANGLE,
+    EMR_SELECTOBJECT,
+    EmfSvgTranslator,
+    UnsupportedEmfException,
+)
+from ..parser.initalize_registry import initialize_registry
+from ..parser.stream import Stream
+
+initialize_registry()
+
+
+class TestEmfSvgTranslator(SlyrTestCase):
+    """
+    Test native EMF to SVG translation
+    """
+
+    @staticmethod
+    def read_emf(folder, name):
+        path = os.path.join(os.path.dirname(__file__), "styles", folder, name)
+        with open(path, "rb") as f:
+            symbol = Stream(BytesIO(f.read())).read_object()
+        picture = symbol.layers[0].picture
+        # marker pictures are wrapped in a StdPicture
+        picture = getattr(picture, "picture", picture)
+        return picture.content
+
+    @staticmethod
+    def parse_svg(svg: str):
+        """
+        Parses SVG content, returning the viewbox and a list of
+        (element tag, style dict, path commands) for each drawn element
+        """
+        root = ElementTree.fromstring(svg)
+        view_box = [float(v) for v in root.get("viewBox").split()]
+        elements = []
+        for element in root:
+            style = dict(
+                item.split(":", 1) for item in element.get("style", "").split(";")
+            )
+            commands = []
+            for token in element.get("d", "").split():
+                if token.isalpha():
+                    commands.append((token, []))
+                else:
+                    commands[-1][1].extend(float(v) for v in token.split(","))
+            elements.append((element.tag.split("}")[-1], style, commands))
+        return view_box, elements
+
+    def test_polyline(self):
+        content = self.read_emf("marker_bin", "Picture Marker Version 4.bin")
+        self.assertTrue(EmfSvgTranslator.is_emf(content))
+
+        view_box, elements = self.parse_svg(EmfSvgTranslator.translate(content))
+        for value, expected in zip(view_box, (421.6535, -716.5354, 120.4724, 186.6142)):
+            self.assertAlmostEqual(value, expected, 3)
+        self.assertEqual([e[0] for e in elements], ["path"])
+
+        _, style, commands = elements[0]
+        self.assertEqual(style["fill"], "none")
+        self.assertEqual(style["stroke"], "#000000")
+        self.assertAlmostEqual(float(style["stroke-width"]), 3.937, 3)
+        self.assertEqual(style["stroke-linecap"], "butt")
+        self.assertEqual(style["stroke-linejoin"], "miter")
+        self.assertEqual([c[0] for c in commands], ["M", "L", "L"])
+        for (_, values), expected in zip(
+            commands,
+            ((423.622, -714.5669), (423.622, -531.8898), (540.1575, -531.8898)),
+        ):
+            self.assertEqual(len(values), 2)
+            self.assertAlmostEqual(values[0], expected[0], 3)
+            self.assertAlmostEqual(values[1], expected[1], 3)
+
+    def test_path(self):
+        content = self.read_emf("marker_bin", "Picture Marker Version 8.bin")
+        view_box, elements = self.parse_svg(EmfSvgTranslator.translate(content))
+        for value, expected in zip(view_box, (453.937, -678.3465, 29.5276, 30.7087)):
+            self.assertAlmostEqual(value, expected, 3)
+        self.assertEqual([e[0] for e in elements], ["path", "path"])
+
+        # a closed bezier outline, then a closed rectangle
+        _, style, commands = elements[0]
+        self.assertEqual(style["fill"], "none")
+        self.assertEqual(style["stroke-linecap"], "round")
+        self.assertEqual([c[0] for c in commands], ["M", "C", "Z"])
+        self.assertAlmostEqual(commands[0][1][0], 468.5039, 3)
+        self.assertAlmostEqual(commands[0][1][1], -653.5433, 3)
+        # each bezier segment has two control points and an end point
+        self.assertEqual(len(commands[1][1]) % 6, 0)
+
+        _, style, commands = elements[1]
+        self.assertEqual([c[0] for c in commands], ["M", "L", "L", "L", "L", "L", "Z"])
+        self.assertAlmostEqual(commands[2][1][0], 483.0709, 3)
+        self.assertAlmostEqual(commands[2][1][1], -677.9528, 3)
+
+    def test_fill(self):
+        content = self.read_emf("marker_bin", "Picture Marker Version 4.bin")
+        # draw a red filled rectangle before the polyline
+        filled = self.insert_record(
+            content, EMR_RECTANGLE, struct.pack("<iiii", 10, 20, 110, 70)
+        )
+        filled = self.insert_record(filled, EMR_SELECTOBJECT, struct.pack("<I", 5))
+        filled = self.insert_record(
+            filled, EMR_CREATEBRUSHINDIRECT, struct.pack("<III", 5, 0, 0x0000FF)
+        )
+        _, elements = self.parse_svg(EmfSvgTranslator.translate(filled))
+        self.assertEqual([e[0] for e in elements], ["path", "path"])
+
+        _, style, commands = elements[0]
+        self.assertEqual(style["fill"], "#ff0000")
+        self.assertEqual([c[0] for c in commands], ["M", "L", "L", "L", "Z"])
+        self.assertEqual(elements[1][1]["fill"], "none")
+
+    @staticmethod
+    def insert_record(content: bytes, record_type: int, data: bytes) -> bytes:
+        """
+        Inserts a record after the header of EMF content
+        """
+        header_size = struct.unpack_from("<I", content, 4)[0]
+        record = struct.pack("<II", record_type, 8 + len(data)) + data
+        return content[:header_size] + record + content[header_size:]
+
+    def test_clipping(self):
+        content = self.read_emf("marker_bin", "Picture Marker Version 4.bin")
+        svg = EmfSvgTranslator.translate(content)
+
+        # resetting the clip region has no effect
+        reset_clip = self.insert_record(content, 0x4B, struct.pack("<II", 0, 5))
+        self.assertEqual(EmfSvgTranslator.translate(reset_clip), svg)
+
+        # clipping must be converted by Inkscape instead
+        clip_rect = self.insert_record(
+            content, 0x1E, struct.pack("<iiii", 430, 300, 500, 400)
+        )
+        with self.assertRaises(UnsupportedEmfException):
+            EmfSvgTranslator.translate(clip_rect)
+
+        region = struct.pack("<IIII", 32, 1, 1, 16) + struct.pack("<iiii", 0, 0, 9, 9)
+        clip_region = self.insert_record(
+            content,
+            0x4B,
+            struct.pack("<II", 48, 5) + region + struct.pack("<iiii", 0, 0, 9, 9),
+        )
+        with self.assertRaises(UnsupportedEmfException):
+            EmfSvgTranslator.translate(clip_region)
+
+    def test_unsupported(self):
+        # embedded bitmaps must be converted by Inkscape instead
+        content = self.read_emf("fill_bin", "Picture Fill EMF.bin")
+        with self.assertRaises(UnsupportedEmfException):
+            EmfSvgTranslator.translate(content)
+
+        with self.assertRaises(UnsupportedEmfException):
+            EmfSvgTranslator.translate(b"not really an emf")
+
+        # a truncated record
+        header = bytearray(content[: struct.unpack_from("<I", content, 4)[0]])
+        with self.assertRaises(UnsupportedEmfException):
+            EmfSvgTranslator.translate(bytes(header) + struct.pack("<II", 0x56, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Test style database extraction
+"""
+
+import unittest
+import os
+
+from .test_case import SlyrTestCase
+
+from ..bintools.extractor import Extractor
+
+# pylint: disable=protected-access
+NEWLINE = Extractor._Extractor__NEWLINE
+DELIMITER = Extractor._Extractor__DELIMITER
+QUOTE = Extractor._Extractor__QUOTE
+# pylint: enable=protected-access
+
+
+class FakeStdout:
+    """
+    Fake process output, returning predefined chunks for each read
+    """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.closed = False
+
+    def read(self, _):  # pylint: disable=missing-docstring
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def close(self):  # pylint: disable=missing-docstring
+        self.closed = True
+
+
+class FakeProcess:
+    """
+    Fake mdb-export process
+    """
+
+    def __init__(self, chunks):
+        self.stdout = FakeStdout(chunks)
+        self.running = True
+        self.killed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stdout.close()
+
+    def poll(self):  # pylint: disable=missing-docstring
+        return None if self.running else 0
+
+    def kill(self):  # pylint: disable=missing-docstring
+        self.killed = True
+        self.running = False
+
+    def wait(self):  # pylint: disable=missing-docstring
+        self.running = False
+        return 0
+
+
+class TestExtractor(SlyrTestCase):
+    """
+    Test style database extraction
+    """
+
+    def test_iter_mdb_export_records(self):
+        # records and delimiters are split across reads
+        proc = FakeProcess(
+            [
+                b"header" + NEWLINE[:5],
+                NEWLINE[5:] + b"record 1" + NEWLINE + b"rec",
+                b"ord 2" + NEWLINE[:-1],
+                NEWLINE[-1:] + b"record 3",
+            ]
+        )
+        # pylint: disable=protected-access
+        self.assertEqual(
+            list(Extractor._iter_mdb_export_records(proc)),
+            [b"header", b"record 1", b"record 2", b"record 3"],
+        )
+        self.assertTrue(proc.stdout.closed)
+
+    def test_iter_mdb_export_output(self):
+        header = DELIMITER.join([b"ID", b"Name", b"Category", b"Object", b"Tags"])
+        row = DELIMITER.join(
+            [
+                b"1",
+                QUOTE + b"my symbol" + QUOTE,
+                QUOTE + b"cat" + QUOTE,
+                QUOTE + b"\x01\x02" + NEWLINE[:3] + QUOTE,
+                QUOTE + b"a;b" + QUOTE,
+            ]
+        )
+        content = header + NEWLINE + row + NEWLINE
+        # split within the delimiter following the name
+        split = content.index(DELIMITER, len(header) + len(NEWLINE) + 2) + 10
+        proc = FakeProcess([content[:split], content[split:]])
+
+        # pylint: disable=protected-access
+        styles = list(Extractor._mdb_export_styles(proc))
+        self.assertEqual(
+            styles,
+            [
+                {
+                    Extractor.NAME: "my symbol",
+                    Extractor.CATEGORY: "cat",
+                    Extractor.TAGS: "a;b",
+                    Extractor.ID: "1",
+                    Extractor.BLOB: b"\x01\x02" + NEWLINE[:3],
+                }
+            ],
+        )
+
+    def test_close_mdb_export(self):
+        # pylint: disable=protected-access
+        proc = FakeProcess([b"header" + NEWLINE])
+        styles = Extractor._mdb_export_styles(proc)
+        self.assertFalse(styles.closed)
+        styles.close()
+        self.assertTrue(styles.closed)
+        self.assertTrue(proc.killed)
+        self.assertTrue(proc.stdout.closed)
+
+        # discarded without being iterated
+        proc = FakeProcess([b"header" + NEWLINE])
+        styles = Extractor._mdb_export_styles(proc)
+        del styles
+        self.assertTrue(proc.killed)
+        self.assertTrue(proc.stdout.closed)
+
+    def test_iter_styles(self):
+        path = os.path.join(os.path.dirname(__file__), "styles", "colors.style")
+        styles = Extractor.iter_styles(path, Extractor.COLORS)
+        self.assertEqual(next(styles)[Extractor.ID], "1")
+        styles.close()
+        self.assertTrue(styles.closed)
+        self.assertEqual(list(styles), [])
+
+        # closed when exhausted
+        styles = Extractor.iter_styles(path, Extractor.COLORS)
+        self.assertEqual(len(list(styles)), 5)
+        self.assertTrue(styles.closed)
+
+        with Extractor.iter_styles(path, Extractor.COLORS) as styles:
+            self.assertFalse(styles.closed)
+        self.assertTrue(styles.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
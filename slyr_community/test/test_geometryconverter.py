@@ -12,6 +12,8 @@ from qgis.core import (
 
 from .test_case import SlyrTestCase
 from ..converters.geometry import GeometryConverter
+from ..parser.objects.polygon import Polygon
+from ..parser.objects.polyline import Polyline
 
 
 class TestGeometryConverter(SlyrTestCase):
@@ -174,6 +176,45 @@ class TestGeometryConverter(SlyrTestCase):
             )
         )
 
+    def test_linear_polyline(self):
+        """
+        Test converting polylines without curves
+        """
+        polyline = Polyline()
+        self.assertEqual(
+            GeometryConverter.polyline_to_geometry(polyline).asWkt(),
+            "LineString EMPTY",
+        )
+        polyline.parts = [[(1, 2), (3, 4)]]
+        self.assertEqual(
+            GeometryConverter.polyline_to_geometry(polyline).asWkt(),
+            "LineString (1 2, 3 4)",
+        )
+        polyline.parts = [[(1, 2), (3, 4)], [(5, 6), (7, 8)]]
+        self.assertEqual(
+            GeometryConverter.polyline_to_geometry(polyline).asWkt(),
+            "MultiCurve ((1 2, 3 4),(5 6, 7 8))",
+        )
+
+    def test_linear_polygon(self):
+        """
+        Test converting polygons without curves
+        """
+        polygon = Polygon()
+        polygon.parts = [[(0, 0), (1, 0), (1, 1), (0, 0)]]
+        self.assertEqual(
+            GeometryConverter.polygon_to_geometry(polygon).asWkt(),
+            "Polygon ((0 0, 1 0, 1 1, 0 0))",
+        )
+        polygon.parts = [
+            [(0, 0), (1, 0), (1, 1), (0, 0)],
+            [(5, 5), (6, 5), (6, 6), (5, 5)],
+        ]
+        self.assertEqual(
+            GeometryConverter.polygon_to_geometry(polygon).asWkt(),
+            "MultiPolygon (((0 0, 1 0, 1 1, 0 0)),((5 5, 6 5, 6 6, 5 5)))",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+"""
+Test Jet database reading
+"""
+
+import unittest
+import os
+
+from .test_case import SlyrTestCase
+
+from ..bintools.jet_database import JetDatabase, JetFormatException
+
+
+class TestJetDatabase(SlyrTestCase):
+    """
+    Test Jet database reading
+    """
+
+    def test_read_style(self):
+        styles_path = os.path.join(os.path.dirname(__file__), "styles")
+        with JetDatabase(os.path.join(styles_path, "colors.style")) as database:
+            self.assertTrue(database.has_table("colors"))
+            self.assertFalse(database.has_table("not a table"))
+            with self.assertRaises(JetFormatException):
+                database.rows("not a table")
+
+            rows = list(database.rows("Colors"))
+            self.assertEqual(len(rows), 5)
+            self.assertEqual(database.row_count("Colors"), 5)
+            with self.assertRaises(JetFormatException):
+                database.row_count("not a table")
+            self.assertEqual([r["ID"] for r in rows], list(range(1, 6)))
+            for row in rows:
+                with open(
+                    os.path.join(styles_path, "colors_bin", row["Name"] + ".bin"), "rb"
+                ) as f:
+                    self.assertEqual(bytes(row["Object"]), f.read())
+
+    def test_multi_page_values(self):
+        styles_path = os.path.join(os.path.dirname(__file__), "styles")
+        with JetDatabase(os.path.join(styles_path, "fill.style")) as database:
+            rows = [
+                r for r in database.rows("Fill Symbols") if r["Name"] == "many layers"
+            ]
+            self.assertIsInstance(rows[0]["Object"], bytes)
+            with open(
+                os.path.join(styles_path, "fill_bin", "many layers.bin"), "rb"
+            ) as f:
+                self.assertEqual(rows[0]["Object"], f.read())
+
+    def test_not_a_database(self):
+        with self.assertRaises(JetFormatException):
+            JetDatabase(__file__)
+
+    def test_decode_text(self):
+        self.assertEqual(JetDatabase.decode_text("abc".encode("utf-16-le")), "abc")
+        self.assertEqual(JetDatabase.decode_text(b"\xff\xfeabc"), "abc")
+        self.assertEqual(
+            JetDatabase.decode_text(b"\xff\xfeab\x00" + "éc".encode("utf-16-le")),
+            "abéc",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,9 +11,12 @@ import tempfile
 
 from .test_case import SlyrTestCase
 
-from qgis.core import QgsProject
+from qgis.core import QgsProject, QgsLayerTree, QgsVectorLayer
 
+from ..parser.deferred_object import DeferredObject
 from ..parser.initalize_registry import initialize_registry
+from ..parser.objects.feature_layer import FeatureLayer
+from ..parser.objects.group_layer import GroupLayer
 from ..parser.streams.map_document import MapDocument
 
 from ..converters.context import Context
@@ -410,6 +413,157 @@ class TestMxdParser(SlyrTestCase):
                     #    expected_res = ast.literal_eval(o.read())
                     # self.assertEqual(expected_res, res)
 
+    def test_lazy_parsing(self):
+        file = os.path.join(
+            os.path.dirname(__file__), "mxd", "background_color_blue.mxd"
+        )
+        with open(file, "rb") as f:
+            expected = MapDocument(f, tolerant=False).to_dict()
+
+        with open(file, "rb") as f:
+            doc = MapDocument(f, tolerant=False, lazy=True)
+            self.assertEqual(doc.version, expected["version"])
+            self.assertNotIn("frames", doc.__dict__)
+            self.assertNotIn("page_layout", doc.__dict__)
+
+            self.assertEqual([f.to_dict() for f in doc.frames], expected["frames"])
+            self.assertNotIn("page_layout", doc.__dict__)
+            self.assertIsNotNone(doc.page_layout)
+            self.assertFalse(doc.layout_read_error)
+
+    def test_lazy_layers(self):
+        file = os.path.join(os.path.dirname(__file__), "mxd", "sources_relative2.mxd")
+        with open(file, "rb") as f:
+            expected = MapDocument(f, tolerant=False).to_dict()
+
+        with open(file, "rb") as f:
+            doc = MapDocument(f, tolerant=False, lazy=True)
+            root_groups = doc.frames[0].root_groups
+            self.assertIsInstance(root_groups[1], DeferredObject)
+            self.assertIsInstance(root_groups[1], FeatureLayer)
+            self.assertFalse(root_groups[1].is_resolved())
+            # group layers are parsed while reading the layer masking details
+            self.assertIsInstance(root_groups[2], GroupLayer)
+            self.assertTrue(root_groups[2].is_resolved())
+
+            self.assertEqual(
+                root_groups[1].to_dict(), expected["frames"][0]["root_groups"][1]
+            )
+            self.assertTrue(root_groups[1].is_resolved())
+            self.assertEqual([f.to_dict() for f in doc.frames], expected["frames"])
+
+    def test_lazy_layer_names(self):
+        file = os.path.join(os.path.dirname(__file__), "mxd", "page_queries.mxd")
+        with open(file, "rb") as f:
+            expected = MapDocument(f, tolerant=False).to_dict()
+
+        with open(file, "rb") as f:
+            doc = MapDocument(f, tolerant=False, lazy=True)
+            root_groups = doc.frames[0].root_groups
+            deferred = [
+                g
+                for g in root_groups
+                if isinstance(g, DeferredObject) and not g.is_resolved()
+            ]
+            self.assertGreater(len(deferred), 1)
+
+            # layer names are available without parsing the layers
+            self.assertEqual(
+                [g.name for g in root_groups],
+                [g["name"] for g in expected["frames"][0]["root_groups"]],
+            )
+            self.assertFalse(any(g.is_resolved() for g in deferred))
+
+            self.assertEqual([f.to_dict() for f in doc.frames], expected["frames"])
+
+    @staticmethod
+    def describe_project(project: QgsProject) -> dict:
+        """
+        Returns a description of the converted layers from a project
+        """
+        tree = []
+
+        def describe_node(node, depth):
+            for child in node.children():
+                if QgsLayerTree.isLayer(child):
+                    layer = child.layer()
+                    renderer = (
+                        layer.renderer().dump()
+                        if isinstance(layer, QgsVectorLayer) and layer.renderer()
+                        else None
+                    )
+                    tree.append(
+                        (
+                            depth,
+                            child.name(),
+                            layer.source(),
+                            layer.crs().authid(),
+                            renderer,
+                            child.itemVisibilityChecked(),
+                        )
+                    )
+                else:
+                    tree.append((depth, child.name(), child.itemVisibilityChecked()))
+                    describe_node(child, depth + 1)
+
+        describe_node(project.layerTreeRoot(), 0)
+
+        def layer_name(layer_id):
+            layer = project.mapLayer(layer_id)
+            return layer.name() if layer else None
+
+        relations = sorted(
+            (
+                r.name(),
+                layer_name(r.referencedLayerId()),
+                layer_name(r.referencingLayerId()),
+            )
+            for r in project.relationManager().relations().values()
+        )
+        themes = {
+            theme: sorted(
+                l.name()
+                for l in project.mapThemeCollection().mapThemeVisibleLayers(theme)
+            )
+            for theme in project.mapThemeCollection().mapThemes()
+        }
+        return {"tree": tree, "relations": relations, "themes": themes}
+
+    def test_parallel_conversion(self):
+        for filename in ("sources_relative2.mxd", "simple_project_two_frames.mxd"):
+            file = os.path.join(os.path.dirname(__file__), "mxd", filename)
+
+            res = []
+            for max_workers in (None, 2):
+                with open(file, "rb") as f:
+                    doc = MapDocument(f, tolerant=False)
+
+                context = Context()
+                context.convert_fonts = False
+                warnings = []
+
+                def warning(msg, level=0):
+                    warnings.append((msg, level))
+
+                context.unsupported_object_callback = warning
+                p = ProjectConverter.convert_project(
+                    file, doc, context, max_workers=max_workers
+                )
+                res.append((self.describe_project(p), sorted(set(warnings))))
+
+            self.assertTrue(res[0][0]["tree"])
+            self.assertEqual(res[1], res[0])
+
+    def test_metadata_only(self):
+        file = os.path.join(
+            os.path.dirname(__file__), "mxd", "background_color_blue.mxd"
+        )
+        with open(file, "rb") as f:
+            doc = MapDocument(f, tolerant=False, metadata_only=True)
+        self.assertEqual(doc.version, "10.6")
+        self.assertEqual(doc.frames, [])
+        self.assertIsNone(doc.page_layout)
+
 
 from qgis.core import QgsApplication
 
@@ -0,0 +1,84 @@
+"""
+Test object registry
+"""
+
+import unittest
+import binascii
+
+from .test_case import SlyrTestCase
+
+from ..parser.exceptions import RequiresLicenseException
+from ..parser.initalize_registry import initialize_registry
+from ..parser.object_registry import ObjectRegistry, REGISTRY
+from ..parser.objects.colors import RgbColor
+from ..parser.objects.field import Field
+from ..parser.objects.fields import Fields
+
+initialize_registry()
+
+
+class TestObjectRegistry(SlyrTestCase):
+    """
+    Test object registry
+    """
+
+    def test_binary_clsid(self):
+        clsid_bin = ObjectRegistry.clsid_to_hex(RgbColor.cls_id())
+        self.assertEqual(clsid_bin, b"96c4e97e23d1d0118383080009b996cc")
+        clsid = binascii.unhexlify(clsid_bin)
+
+        self.assertEqual(
+            ObjectRegistry.bytes_to_clsid(clsid),
+            ObjectRegistry.hex_to_clsid2(clsid_bin),
+        )
+        self.assertEqual(
+            ObjectRegistry.clsid_to_bytes(ObjectRegistry.bytes_to_clsid(clsid)), clsid
+        )
+        self.assertIs(REGISTRY.binary_objects[clsid], RgbColor)
+        self.assertIsInstance(REGISTRY.create_object_from_bytes(clsid), RgbColor)
+        self.assertIsNone(REGISTRY.create_object_from_bytes(bytes(16)))
+        with self.assertRaises(RequiresLicenseException):
+            REGISTRY.create_object_from_bytes(b"\x01" * 16)
+
+    def test_create_object_from_dict(self):
+        field = Field()
+        field.name = "test"
+        fields = Fields()
+        fields.fields.append(field)
+
+        res = REGISTRY.create_object_from_dict(fields.to_dict())
+        self.assertIsInstance(res, Fields)
+        self.assertEqual(res.version, Fields.compatible_versions()[-1])
+        self.assertIsInstance(res.fields[0], Field)
+        self.assertEqual(res.fields[0].name, "test")
+        self.assertEqual(res.fields[0].version, Field.compatible_versions()[-1])
+        self.assertIsNone(REGISTRY.create_object_from_dict(None))
+
+        self.assertIs(REGISTRY.names["Fields"], Fields)
+        with self.assertRaises(KeyError):
+            REGISTRY.create_object_from_dict({"type": "xxx"})
+
+    def test_objects_from_dicts(self):
+        fields = []
+        for name in ("a", "b"):
+            field = Field()
+            field.name = name
+            fields.append(Fields())
+            fields[-1].fields.append(field)
+
+        res = REGISTRY.objects_from_dicts([f.to_dict() for f in fields] + [None])
+        self.assertEqual(len(res), 3)
+        for obj, name in zip(res, ("a", "b")):
+            self.assertIsInstance(obj, Fields)
+            self.assertEqual(obj.version, Fields.compatible_versions()[-1])
+            self.assertIsInstance(obj.fields[0], Field)
+            self.assertEqual(obj.fields[0].name, name)
+        self.assertIsNone(res[2])
+        self.assertEqual(REGISTRY.objects_from_dicts([]), [])
+
+        with self.assertRaises(KeyError):
+            REGISTRY.objects_from_dicts([fields[0].to_dict(), {"type": "xxx"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Test picture utilities
+"""
+
+import unittest
+
+from qgis.PyQt.QtCore import QBuffer
+from qgis.PyQt.QtGui import QImage, QColor, qRgba, qRed, qGreen, qBlue
+
+from .test_case import SlyrTestCase
+from ..converters.pictures import PictureUtils
+
+
+class TestPictureUtils(SlyrTestCase):
+    """
+    Test picture utilities
+    """
+
+    @staticmethod
+    def reference_set_colors(image: QImage, fg: QColor, bg: QColor, trans: QColor):
+        """
+        Per pixel implementation of PictureUtils.set_colors, for regression tests
+        """
+        image = image.convertToFormat(QImage.Format.Format_ARGB32)
+        fg_rgba = qRgba(fg.red(), fg.green(), fg.blue(), fg.alpha())
+        bg_rgba = qRgba(bg.red(), bg.green(), bg.blue(), bg.alpha())
+        for y in range(image.height()):
+            for x in range(image.width()):
+                rgba = image.pixel(x, y)
+                red = qRed(rgba)
+                green = qGreen(rgba)
+                blue = qBlue(rgba)
+                if (
+                    abs(red - trans.red()) < 40
+                    and abs(green - trans.green()) < 40
+                    and abs(blue - trans.blue()) < 40
+                ):
+                    image.setPixel(x, y, qRgba(0, 0, 0, 0))
+                elif abs(red) < 40 and abs(green) < 40 and abs(blue) < 40:
+                    image.setPixel(x, y, fg_rgba)
+                elif (
+                    abs(red - 255) < 40
+                    and abs(green - 255) < 40
+                    and abs(blue - 255) < 40
+                ):
+                    image.setPixel(x, y, bg_rgba)
+        return image
+
+    def test_set_colors(self):
+        image = QImage(64, 48, QImage.Format.Format_ARGB32)
+        for y in range(image.height()):
+            for x in range(image.width()):
+                # a range of colors near black, white and the transparent color
+                image.setPixel(
+                    x,
+                    y,
+                    qRgba(
+                        (x * 4) % 256,
+                        (y * 5 + x) % 256,
+                        (x * y) % 256,
+                        255,
+                    ),
+                )
+
+        buffer = QBuffer()
+        image.save(buffer, "png")
+        data = buffer.data()
+
+        fg = QColor(255, 0, 0)
+        bg = QColor(0, 0, 255, 200)
+        trans = QColor(100, 120, 140)
+
+        res = QImage()
+        res.loadFromData(PictureUtils.set_colors(data, fg, bg, trans))
+        res = res.convertToFormat(QImage.Format.Format_ARGB32)
+
+        expected = self.reference_set_colors(QImage.fromData(data), fg, bg, trans)
+        self.assertEqual(res.size(), expected.size())
+        for y in range(res.height()):
+            for x in range(res.width()):
+                self.assertEqual(res.pixel(x, y), expected.pixel(x, y), (x, y))
+
+    def test_colorize_picture_data_fix_alpha(self):
+        image = QImage(4, 4, QImage.Format.Format_ARGB32)
+        image.fill(QColor(255, 255, 255))
+        image.setPixel(2, 2, qRgba(10, 20, 30, 255))
+        buffer = QBuffer()
+        image.save(buffer, "png")
+
+        res = PictureUtils.colorize_picture_data(buffer.data(), QColor())
+        self.assertEqual(res.pixelColor(0, 0).alpha(), 0)
+        self.assertEqual(res.pixelColor(3, 3).alpha(), 0)
+        self.assertEqual(res.pixel(2, 2), qRgba(10, 20, 30, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+Test binary scanning
+"""
+
+import unittest
+import os
+
+from .test_case import SlyrTestCase
+
+from ..bintools.scanner import (
+    SCANNERS,
+    ObjectScan,
+    IntMatch,
+    StringMatch,
+    scan_buffer,
+    resolve_precedence,
+)
+from ..parser.initalize_registry import initialize_registry
+
+initialize_registry()
+
+
+class TestScanner(SlyrTestCase):
+    """
+    Test binary scanning
+    """
+
+    @staticmethod
+    def read_bin(folder, name):
+        path = os.path.join(os.path.dirname(__file__), "styles", folder, name)
+        with open(path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def describe(match):
+        """
+        Returns a comparable description of a match
+        """
+        if match is None:
+            return None
+        return (
+            match.__class__.__name__,
+            match.match_start,
+            match.match_length,
+            match.value(),
+        )
+
+    @staticmethod
+    def runs(resolved):
+        """
+        Returns the (start, end, match class, match start) runs of bytes
+        which resolved to the same match
+        """
+        res = []
+        current = None
+        for index, match in enumerate(resolved):
+            if res and match is current:
+                res[-1][1] = index + 1
+            else:
+                res.append([index, index + 1, match])
+                current = match
+        return [
+            (
+                start,
+                end,
+                match.__class__.__name__ if match is not None else None,
+                match.match_start if match is not None else None,
+            )
+            for start, end, match in res
+        ]
+
+    def test_scanners(self):
+        # the optimised scans must give the same results as scanning every offset
+        for folder, name in (
+            ("fill_bin", "Black mm.bin"),
+            ("line_bin", "Two levels with tags.bin"),
+            ("line_bin", "Cartographic line 3 positions no flip.bin"),
+        ):
+            data = self.read_bin(folder, name)
+            for scanner in SCANNERS:
+                self.assertEqual(
+                    [
+                        (offset, self.describe(match))
+                        for offset, match in scanner.scan_buffer(data)
+                    ],
+                    [
+                        (offset, self.describe(match))
+                        for offset, match in ObjectScan.scan_buffer(scanner, data)
+                    ],
+                    "{} {}".format(name, scanner.__class__.__name__),
+                )
+
+    def test_scan_buffer(self):
+        data = self.read_bin("fill_bin", "Black mm.bin")
+        matches = scan_buffer(data)
+        # ordered by scanned offset, so persistent objects follow their CLSID
+        self.assertEqual(
+            [self.describe(m) for m in matches if not isinstance(m, IntMatch)],
+            [
+                ("GuidCodeMatch", 0, 16, "MultiLayerFillSymbol"),
+                ("PersistentMatch", 252, 1, "MultiLayerFillSymbol"),
+                ("GuidCodeMatch", 26, 16, "RgbColor"),
+                ("ColorMatch", 26, 47, "0,0,0"),
+                ("PersistentMatch", 72, 1, "RgbColor"),
+                ("GuidCodeMatch", 77, 16, "SimpleFillSymbol"),
+                ("PersistentMatch", 238, 1, "SimpleFillSymbol"),
+                ("GuidCodeMatch", 95, 16, "SimpleLineSymbol"),
+                ("PersistentMatch", 179, 1, "SimpleLineSymbol"),
+                ("GuidCodeMatch", 113, 16, "RgbColor"),
+                ("ColorMatch", 113, 47, "240,240,240"),
+                ("PersistentMatch", 159, 1, "RgbColor"),
+                ("GuidCodeMatch", 180, 16, "RgbColor"),
+                ("ColorMatch", 180, 47, "0,0,0"),
+                ("PersistentMatch", 226, 1, "RgbColor"),
+            ],
+        )
+        int_matches = [m for m in matches if isinstance(m, IntMatch)]
+        self.assertEqual(len(int_matches), 44)
+        self.assertEqual(
+            [(m.match_start, m.found_value) for m in int_matches[:5]],
+            [(8, 571019), (14, 147790), (16, 851970), (17, 3328), (18, 13)],
+        )
+
+        data = self.read_bin("line_bin", "Two levels with tags.bin")
+        matches = scan_buffer(data)
+        self.assertEqual(
+            [self.describe(m) for m in matches if not isinstance(m, IntMatch)],
+            [
+                ("GuidCodeMatch", 0, 16, "MultiLayerLineSymbol"),
+                ("PersistentMatch", 261, 1, "MultiLayerLineSymbol"),
+                ("GuidCodeMatch", 30, 16, "SimpleLineSymbol"),
+                ("PersistentMatch", 114, 1, "SimpleLineSymbol"),
+                ("GuidCodeMatch", 48, 16, "RgbColor"),
+                ("ColorMatch", 48, 47, "255,0,0"),
+                ("PersistentMatch", 94, 1, "RgbColor"),
+                ("DoubleMatch", 95, 8, "1.0"),
+                ("GuidCodeMatch", 115, 16, "SimpleLineSymbol"),
+                ("PersistentMatch", 199, 1, "SimpleLineSymbol"),
+                ("GuidCodeMatch", 133, 16, "RgbColor"),
+                ("ColorMatch", 133, 47, "110,110,110"),
+                ("PersistentMatch", 179, 1, "RgbColor"),
+                ("DoubleMatch", 180, 8, "1.0"),
+                ("StringMatch", 216, 20, '"l2 tags"'),
+                ("StringMatch", 236, 26, '"Layer1tags"'),
+            ],
+        )
+        self.assertEqual(len([m for m in matches if isinstance(m, IntMatch)]), 55)
+
+        self.assertEqual(scan_buffer(b""), [])
+
+    def test_resolve_precedence(self):
+        data = self.read_bin("line_bin", "Two levels with tags.bin")
+        resolved = resolve_precedence(scan_buffer(data), len(data))
+        self.assertEqual(len(resolved), len(data))
+        self.assertEqual(
+            self.runs(resolved),
+            [
+                (0, 16, "GuidCodeMatch", 0),
+                (16, 18, "IntMatch", 14),
+                (18, 20, "IntMatch", 16),
+                (20, 21, "IntMatch", 17),
+                (21, 22, "IntMatch", 18),
+                (22, 24, None, None),
+                (24, 28, "IntMatch", 24),
+                (28, 29, "IntMatch", 25),
+                (29, 30, "IntMatch", 26),
+                (30, 46, "GuidCodeMatch", 30),
+                (46, 48, "IntMatch", 44),
+                (48, 64, "GuidCodeMatch", 48),
+                (64, 95, "ColorMatch", 48),
+                (95, 103, "DoubleMatch", 95),
+                (103, 105, "IntMatch", 101),
+                (105, 106, "IntMatch", 102),
+                (106, 109, "IntMatch", 105),
+                (109, 110, "IntMatch", 106),
+                (110, 111, "IntMatch", 107),
+                (111, 114, None, None),
+                (114, 115, "PersistentMatch", 114),
+                (115, 131, "GuidCodeMatch", 115),
+                (131, 133, "IntMatch", 129),
+                (133, 149, "GuidCodeMatch", 133),
+                (149, 180, "ColorMatch", 133),
+                (180, 188, "DoubleMatch", 180),
+                (188, 190, "IntMatch", 186),
+                (190, 191, "IntMatch", 187),
+                (191, 194, "IntMatch", 190),
+                (194, 195, "IntMatch", 191),
+                (195, 196, "IntMatch", 192),
+                (196, 198, None, None),
+                (198, 202, "IntMatch", 198),
+                (202, 203, "IntMatch", 199),
+                (203, 204, "IntMatch", 200),
+                (204, 206, "IntMatch", 202),
+                (206, 207, "IntMatch", 203),
+                (207, 208, "IntMatch", 204),
+                (208, 210, None, None),
+                (210, 214, "IntMatch", 210),
+                (214, 215, "IntMatch", 211),
+                (215, 216, "IntMatch", 212),
+                (216, 236, "StringMatch", 216),
+                (236, 262, "StringMatch", 236),
+            ],
+        )
+
+    def test_resolve_equal_precedence(self):
+        first = IntMatch(2, 4, 1)
+        second = IntMatch(4, 4, 2)
+        string = StringMatch(7, 6, "abc")
+        resolved = resolve_precedence([first, second, string], 10)
+        # the earlier match wins for equal precedence, and matches are
+        # clipped to the buffer length
+        self.assertEqual(
+            resolved,
+            [None, None, first, first, first, first, second, string, string, string],
+        )
+        self.assertEqual(resolve_precedence([], 3), [None, None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
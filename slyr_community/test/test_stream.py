@@ -0,0 +1,173 @@
+"""
+Test binary streams
+"""
+
+import contextlib
+import unittest
+import os
+from array import array
+from io import BytesIO, StringIO
+from struct import pack
+
+from .test_case import SlyrTestCase
+
+from ..parser.exceptions import UnreadableSymbolException
+from ..parser.initalize_registry import initialize_registry
+from ..parser.memory_stream import MemoryStream
+from ..parser.objects.polyline import Polyline
+from ..parser.stream import Stream, debug_label
+from ..parser.streams.layer import LayerFile
+from ..parser.streams.map_document import MapDocument
+
+initialize_registry()
+
+
+class TestStream(SlyrTestCase):
+    """
+    Test binary streams
+    """
+
+    def test_memory_stream(self):
+        data = MemoryStream(b"abcdef")
+        self.assertEqual(data.tell(), 0)
+        self.assertEqual(data.read(2), b"ab")
+        self.assertEqual(data.tell(), 2)
+        self.assertEqual(bytes(data.read_view(2)), b"cd")
+        data.seek(-1, os.SEEK_END)
+        self.assertEqual(data.read(), b"f")
+        self.assertEqual(data.read(3), b"")
+        data.seek(1)
+        self.assertEqual(data.read(100), b"bcdef")
+
+    def test_memory_stream_primitives(self):
+        binary = (
+            pack("<B", 7)
+            + pack("<d", 1.5)
+            + pack("<L", 0xFFFFFFFE)
+            + pack("<i", -5)
+            + pack("<H", 65535)
+        )
+        for io_stream in (BytesIO(binary), MemoryStream(binary)):
+            stream = Stream(io_stream)
+            self.assertEqual(stream.read_uchar("uchar"), 7)
+            self.assertEqual(stream.read_double("double"), 1.5)
+            self.assertEqual(stream.read_int("int"), 0xFFFFFFFE)
+            self.assertEqual(stream.read_signed_int("signed int"), -5)
+            self.assertEqual(stream.read_ushort("ushort"), 65535)
+            self.assertEqual(stream.tell(), len(binary))
+
+    def test_read_arrays(self):
+        binary = pack("<3L", 1, 2, 0xFFFFFFFF) + pack("<4d", 1.5, 2.5, -3.5, 4.0)
+        for io_stream in (BytesIO(binary), MemoryStream(binary)):
+            stream = Stream(io_stream)
+            self.assertEqual(stream.read_ints(0), array("L"))
+            self.assertEqual(stream.read_ints(3, "ints").tolist(), [1, 2, 0xFFFFFFFF])
+            self.assertEqual(stream.read_xy_pairs(1, "xy"), [(1.5, 2.5)])
+            self.assertEqual(stream.read_doubles(2, "doubles").tolist(), [-3.5, 4.0])
+            self.assertEqual(stream.tell(), len(binary))
+
+        stream = Stream(MemoryStream(pack("<L", 1)))
+        with self.assertRaises(UnreadableSymbolException):
+            stream.read_ints(2)
+
+    def test_debug_labels(self):
+        self.assertEqual(debug_label("plain"), "plain")
+        self.assertEqual(debug_label(("index {}", 3)), "index 3")
+        self.assertEqual(
+            debug_label(("{} string length", ("field {}", 2))),
+            "field 2 string length",
+        )
+
+        # labels are accepted in both release and debug modes
+        for debug in (False, True):
+            stream = Stream(MemoryStream(pack("<i", 5)), debug=debug)
+            self.assertEqual(stream.read_int(("value {}", 1)), 5)
+
+    def test_read_polyline(self):
+        body = (
+            pack("<L", 3)
+            + pack("<4d", 0, 0, 5, 6)
+            + pack("<4L", 2, 3, 0, 2)
+            + pack("<6d", 1, 2, 3, 4, 5, 6)
+        )
+        binary = pack("<L", len(body)) + body + bytes(16)
+        stream = Stream(MemoryStream(binary))
+        polyline = Polyline()
+        polyline.read(stream, 2)
+        self.assertEqual(stream.tell(), len(binary))
+        self.assertEqual(polyline.part_count(), 2)
+        self.assertEqual(polyline.coordinates.tolist(), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(polyline.part(1), [(5, 6)])
+        self.assertEqual(polyline.parts, [[(1, 2), (3, 4)], [(5, 6)]])
+        self.assertFalse(hasattr(polyline, "__dict__"))
+
+        polyline.parts = [[(7, 8)]]
+        self.assertEqual(polyline.to_dict()["parts"], [[(7, 8)]])
+
+    def test_extract_short_streams(self):
+        path = os.path.join(
+            os.path.dirname(__file__), "mxd", "background_color_blue.mxd"
+        )
+        with open(path, "rb") as f:
+            stream = Stream(f, force_layer=True, parse_doc_structure_only=True)
+            version = stream.extract_file_from_stream("Version").getvalue()
+            mini_stream = stream._get_mini_stream()  # pylint: disable=protected-access
+            self.assertEqual(
+                stream.extract_file_from_stream("Version").getvalue(), version
+            )
+            self.assertIs(
+                stream._get_mini_stream(),  # pylint: disable=protected-access
+                mini_stream,
+            )
+            self.assertIsNone(stream.extract_file_from_stream("xxx"))
+
+    def test_byte_coverage(self):
+        path = os.path.join(
+            os.path.dirname(__file__), "mxd", "background_color_blue.mxd"
+        )
+        with open(path, "rb") as f:
+            stream = Stream(f, force_layer=True, parse_doc_structure_only=True)
+            self.assertEqual(
+                stream.byte_coverage(),
+                {"header": [], "sat": [], "dir": [], "mini_fat": []},
+            )
+
+        with open(path, "rb") as f, contextlib.redirect_stdout(StringIO()):
+            stream = Stream(
+                f, force_layer=True, parse_doc_structure_only=True, debug=True
+            )
+
+        def offsets(ranges):
+            return [i for start, end in ranges for i in range(start, end)]
+
+        # matches the offsets recorded byte by byte by earlier versions
+        self.assertEqual(
+            stream.byte_coverage(),
+            {
+                "header": offsets([(0, 76)]),
+                "sat": offsets(
+                    [(76, 512), (1024, 1536), (12800, 14336), (275456, 275968)]
+                ),
+                "dir": offsets([(512, 1024), (2560, 5632)]),
+                "mini_fat": offsets([(274944, 275456)]),
+            },
+        )
+
+    def test_memory_stream_file(self):
+        path = os.path.join(os.path.dirname(__file__), "lyr", "lines.lyr")
+        with open(path, "rb") as f:
+            expected = LayerFile(f).to_dict()
+        with MemoryStream.from_file(path) as f:
+            self.assertEqual(LayerFile(f).to_dict(), expected)
+
+        path = os.path.join(
+            os.path.dirname(__file__), "mxd", "background_color_blue.mxd"
+        )
+        with open(path, "rb") as f:
+            expected = MapDocument(f, offset=-1).to_dict()
+        with MemoryStream.from_file(path) as f:
+            self.assertEqual(MapDocument(f, offset=-1).to_dict(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Test style database symbol conversion
+"""
+
+import unittest
+import os
+import tempfile
+from io import BytesIO
+
+from qgis.PyQt.QtCore import QSettings
+from qgis.core import QgsFillSymbol
+
+from .test_case import SlyrTestCase
+from ..bintools.extractor import Extractor
+from . import test_emf
+from ..converters.context import Context
+from ..converters.emf import EmfConverter
+from ..converters.style_database import StyleDatabaseConverter
+from ..converters.symbols import SymbolConverter
+from ..parser.initalize_registry import initialize_registry
+from ..parser.stream import Stream
+
+initialize_registry()
+
+
+class TestStyleDatabaseConverter(SlyrTestCase):
+    """
+    Test style database symbol conversion
+    """
+
+    def test_convert_symbol(self):
+        path = os.path.join(
+            os.path.dirname(__file__), "styles", "fill_bin", "Black mm.bin"
+        )
+        with open(path, "rb") as f:
+            blob = f.read()
+
+        symbol, error = StyleDatabaseConverter.convert_symbol(
+            Extractor.FILL_SYMBOLS, "Black mm", blob, Context()
+        )
+        self.assertIsNone(error)
+        self.assertIsInstance(symbol, QgsFillSymbol)
+
+        entity_type, xml = StyleDatabaseConverter.entity_to_xml(symbol)
+        self.assertEqual(entity_type, StyleDatabaseConverter.SYMBOL)
+        restored = StyleDatabaseConverter.entity_from_xml(entity_type, xml)
+        self.assertIsInstance(restored, QgsFillSymbol)
+        self.assertEqual(restored.color().name(), symbol.color().name())
+        self.assertEqual(restored.symbolLayerCount(), symbol.symbolLayerCount())
+
+        self.assertIsNone(StyleDatabaseConverter.entity_to_xml("not an entity"))
+
+    def test_convert_symbols(self):
+        path = os.path.join(os.path.dirname(__file__), "styles", "fill.style")
+        symbols = [
+            (raw[Extractor.NAME], raw[Extractor.NAME], raw[Extractor.BLOB], index)
+            for index, raw in enumerate(
+                Extractor.iter_styles(path, Extractor.FILL_SYMBOLS)
+            )
+        ]
+        self.assertTrue(symbols)
+
+        context = Context()
+        expected = []
+        for name, unique_name, blob, key in symbols:
+            symbol, error = StyleDatabaseConverter.convert_symbol(
+                Extractor.FILL_SYMBOLS, name, blob, context.for_symbol(unique_name)
+            )
+            expected.append(
+                (
+                    key,
+                    name,
+                    StyleDatabaseConverter.entity_to_xml(symbol)
+                    if symbol is not None
+                    else None,
+                    error,
+                )
+            )
+
+        res = [
+            (
+                key,
+                symbols[key][0],
+                StyleDatabaseConverter.entity_to_xml(symbol)
+                if symbol is not None
+                else None,
+                error,
+            )
+            for key, symbol, error, _ in StyleDatabaseConverter.convert_symbols(
+                Extractor.FILL_SYMBOLS, iter(symbols), context, max_workers=2
+            )
+        ]
+        self.assertEqual(res, expected)
+
+    @unittest.skipIf(os.name == "nt", "requires a POSIX shell")
+    def test_with_preconverted_emf_pictures(self):
+        def read_blob(folder, name):
+            path = os.path.join(os.path.dirname(__file__), "styles", folder, name)
+            with open(path, "rb") as f:
+                return f.read()
+
+        def emf_content(blob):
+            symbol = Stream(BytesIO(blob)).read_object()
+            return SymbolConverter.emf_picture_contents(symbol)[0]
+
+        picture_fill = read_blob("fill_bin", "Picture Fill EMF.bin")
+        picture_marker = read_blob("marker_bin", "Picture Marker Version 4.bin")
+        items = [
+            ("a", read_blob("fill_bin", "Black mm.bin")),
+            ("b", picture_fill),
+            ("c", read_blob("fill_bin", "Black cm.bin")),
+            ("d", picture_marker),
+        ]
+
+        closed = []
+
+        def raw_symbols():
+            try:
+                yield from items
+            finally:
+                closed.append(True)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            inkscape, log = test_emf.TestEmfConverter.create_fake_inkscape(
+                tmp_dir, True
+            )
+            context = Context()
+            context.inkscape_path = inkscape
+
+            QSettings().setValue(
+                "/plugins/slyr/emf_cache_path", os.path.join(tmp_dir, "cache")
+            )
+            # the marker picture could otherwise be translated without inkscape
+            QSettings().setValue("/plugins/slyr/force_inkscape_emf", 1)
+            try:
+                symbols = StyleDatabaseConverter.with_preconverted_emf_pictures(
+                    Extractor.FILL_SYMBOLS,
+                    raw_symbols(),
+                    lambda item: item[1],
+                    context,
+                    chunk_size=2,
+                )
+                # pictures are converted one chunk at a time, before the chunk
+                # is yielded
+                self.assertEqual(next(symbols), items[0])
+                self.assertTrue(
+                    os.path.exists(
+                        EmfConverter.cached_svg_path(emf_content(picture_fill))
+                    )
+                )
+                self.assertEqual(next(symbols), items[1])
+                self.assertEqual(test_emf.TestEmfConverter.call_count(log), 1)
+
+                # symbols which are never read don't have their pictures converted
+                symbols.close()
+                self.assertEqual(closed, [True])
+                self.assertFalse(
+                    os.path.exists(
+                        EmfConverter.cached_svg_path(emf_content(picture_marker))
+                    )
+                )
+                self.assertEqual(test_emf.TestEmfConverter.call_count(log), 1)
+
+                # other entity types are passed through without conversion
+                self.assertEqual(
+                    list(
+                        StyleDatabaseConverter.with_preconverted_emf_pictures(
+                            Extractor.COLORS, items, lambda item: item[1], context
+                        )
+                    ),
+                    items,
+                )
+                self.assertEqual(test_emf.TestEmfConverter.call_count(log), 1)
+            finally:
+                QSettings().remove("/plugins/slyr/emf_cache_path")
+                QSettings().remove("/plugins/slyr/force_inkscape_emf")
+
+
+if __name__ == "__main__":
+    unittest.main()
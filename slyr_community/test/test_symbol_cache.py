@@ -0,0 +1,120 @@
+"""
+Test symbol conversion cache
+"""
+
+import unittest
+import os
+import tempfile
+from io import BytesIO
+
+from qgis.PyQt.QtCore import QSettings
+from qgis.core import QgsFillSymbol
+
+from .test_case import SlyrTestCase
+from ..converters.context import Context
+from ..converters.symbol_cache import SymbolConversionCache, symbol_digest
+from ..converters.symbols import SymbolConverter
+from ..parser.initalize_registry import initialize_registry
+from ..parser.stream import Stream
+
+initialize_registry()
+
+
+class TestSymbolConversionCache(SlyrTestCase):
+    """
+    Test symbol conversion cache
+    """
+
+    @staticmethod
+    def read_symbol(name):
+        path = os.path.join(os.path.dirname(__file__), "styles", "fill_bin", name)
+        with open(path, "rb") as f:
+            return Stream(BytesIO(f.read())).read_object()
+
+    def test_digest(self):
+        self.assertEqual(
+            symbol_digest(self.read_symbol("Black mm.bin")),
+            symbol_digest(self.read_symbol("Black mm.bin")),
+        )
+        self.assertNotEqual(
+            symbol_digest(self.read_symbol("Black mm.bin")),
+            symbol_digest(self.read_symbol("Black inches.bin")),
+        )
+
+    def test_cache(self):
+        context = Context()
+        context.symbol_cache = SymbolConversionCache()
+
+        first = SymbolConverter.Symbol_to_QgsSymbol(
+            self.read_symbol("Black mm.bin"), context
+        )
+        self.assertIsInstance(first, QgsFillSymbol)
+        self.assertEqual(context.symbol_cache.misses, 1)
+        self.assertEqual(context.symbol_cache.hits, 0)
+
+        second = SymbolConverter.Symbol_to_QgsSymbol(
+            self.read_symbol("Black mm.bin"), context
+        )
+        self.assertIsInstance(second, QgsFillSymbol)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.color().name(), first.color().name())
+        self.assertEqual(context.symbol_cache.hits, 1)
+
+        # different context settings must not share cached symbols
+        context.apply_conversion_tweaks = not context.apply_conversion_tweaks
+        SymbolConverter.Symbol_to_QgsSymbol(self.read_symbol("Black mm.bin"), context)
+        self.assertEqual(context.symbol_cache.misses, 2)
+
+    def test_persistent_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cache.sqlite")
+            context = Context()
+            with SymbolConversionCache(path) as cache:
+                context.symbol_cache = cache
+                SymbolConverter.Symbol_to_QgsSymbol(
+                    self.read_symbol("Black mm.bin"), context
+                )
+                self.assertEqual(cache.misses, 1)
+
+            with SymbolConversionCache(path) as cache:
+                context.symbol_cache = cache
+                res = SymbolConverter.Symbol_to_QgsSymbol(
+                    self.read_symbol("Black mm.bin"), context
+                )
+                self.assertIsInstance(res, QgsFillSymbol)
+                self.assertEqual(cache.hits, 1)
+                self.assertEqual(cache.misses, 0)
+
+    def test_cache_from_settings(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cache.sqlite")
+            context = Context()
+            try:
+                QSettings().setValue("/plugins/slyr/symbol_cache_path", path)
+                with SymbolConversionCache.from_settings() as cache:
+                    context.symbol_cache = cache
+                    SymbolConverter.Symbol_to_QgsSymbol(
+                        self.read_symbol("Black mm.bin"), context
+                    )
+                self.assertTrue(os.path.exists(path))
+
+                with SymbolConversionCache.from_settings() as cache:
+                    context.symbol_cache = cache
+                    SymbolConverter.Symbol_to_QgsSymbol(
+                        self.read_symbol("Black mm.bin"), context
+                    )
+                    self.assertEqual(cache.hits, 1)
+            finally:
+                QSettings().remove("/plugins/slyr/symbol_cache_path")
+
+            # no path set, memory only cache
+            with SymbolConversionCache.from_settings() as cache:
+                context.symbol_cache = cache
+                SymbolConverter.Symbol_to_QgsSymbol(
+                    self.read_symbol("Black mm.bin"), context
+                )
+                self.assertEqual(cache.misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -763,6 +763,28 @@ class TestSymbolParser(SlyrTestCase):
         path = os.path.join(os.path.dirname(__file__), "styles", "ramps_bin")
         self.run_symbol_checks(path)
 
+    def test_preset_ramp_batch_colors(self):
+        """
+        Test that preset ramp colors converted in a batch match those
+        converted one at a time
+        """
+        path = os.path.join(
+            os.path.dirname(__file__),
+            "styles",
+            "ramps_bin",
+            "Preset Color Ramp 13 colors R_G_B.bin",
+        )
+        with open(path, "rb") as f:
+            stream = Stream(f)
+            ramp = stream.read_object()
+            self.assertIsNone(stream.pending_lab_colors)
+        with open(path, "rb") as f:
+            # colors are converted one at a time while debugging
+            debug_ramp = Stream(f, debug=True).read_object()
+
+        self.assertEqual(len(ramp.colors), 13)
+        self.assertEqual(ramp.to_dict(), debug_ramp.to_dict())
+
     def test_color_symbol(self):
         """
         Test color symbol parsing
@@ -0,0 +1,47 @@
+"""
+Test worker process pools
+"""
+
+import unittest
+import multiprocessing
+import multiprocessing.spawn
+
+from .test_case import SlyrTestCase
+
+from ..converters.worker_pool import can_spawn_workers, worker_count
+
+
+class TestWorkerPool(SlyrTestCase):
+    """
+    Test worker process pools
+    """
+
+    def test_worker_count(self):
+        self.assertEqual(worker_count(None), 1)
+        self.assertEqual(worker_count(0), 1)
+        self.assertEqual(worker_count(1), 1)
+
+        # tests run from a standalone Python interpreter
+        self.assertTrue(can_spawn_workers())
+        self.assertEqual(worker_count(4), 4)
+
+    def test_worker_count_host_application(self):
+        # within a host application, workers would be spawned from the host
+        # executable instead of a Python interpreter, so conversions must
+        # fall back to running in-process
+        executable = multiprocessing.spawn.get_executable()
+        try:
+            for host in ("/usr/bin/qgis_process", "C:\\OSGeo4W\\bin\\qgis-bin.exe"):
+                multiprocessing.set_executable(host)
+                self.assertFalse(can_spawn_workers(), host)
+                self.assertEqual(worker_count(4), 1, host)
+
+            multiprocessing.set_executable("C:\\OSGeo4W\\apps\\Python312\\python.exe")
+            self.assertTrue(can_spawn_workers())
+            self.assertEqual(worker_count(4), 4)
+        finally:
+            multiprocessing.set_executable(executable)
+
+
+if __name__ == "__main__":
+    unittest.main()
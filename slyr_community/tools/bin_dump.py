@@ -10,7 +10,7 @@ from io import BytesIO
 
 from slyr_community.parser.symbol_parser import read_symbol
 from slyr_community.converters.dictionary import DictionaryConverter
-from slyr_community.bintools.scanner import SCANNERS
+from slyr_community.bintools.scanner import scan_buffer, resolve_precedence
 
 from slyr_community.parser.initalize_registry import initialize_registry
 
@@ -30,38 +30,17 @@ if args.scan:
 
     print("Scanning....")
     with open(args.file, "rb") as f:
-        data = BytesIO(f.read())
+        raw = f.read()
 
-    with data as f:
-        f.seek(0, 2)
-        length_file = f.tell()
-        f.seek(0)
-        colors = [Fore.WHITE] * length_file
+    scan_results = scan_buffer(raw)
+    scan_results_array = resolve_precedence(scan_results, len(raw))
 
-        scan_results_array = [None] * length_file
-        scan_results = []
-
-        while True:
-            for s in SCANNERS:
-                res = s.scan(f)
-                if res is not None:
-                    scan_results.append(res)
-                    for i in range(res.match_start, res.match_end):
-                        if (
-                            scan_results_array[i] is None
-                            or scan_results_array[i].precedence() < res.precedence()
-                        ):
-                            scan_results_array = (
-                                scan_results_array[:i]
-                                + [res]
-                                + scan_results_array[i + 1 :]
-                            )
-
-            if not f.read(1):
-                break
-
-        f.seek(0)
+    # matches starting on each 16 byte line
+    line_results = {}
+    for res in scan_results:
+        line_results.setdefault(res.match_start // 16 * 16, []).append(res)
 
+    with BytesIO(raw) as f:
         while True:
 
             def format_line(line_start, line):
@@ -82,15 +61,14 @@ if args.scan:
 
                 formatted += "\t"
                 found_parts = []
-                for res in scan_results:
-                    if line_start <= res.match_start < line_start + 16:
-                        found_parts.append(
-                            hex(res.match_start)[2:]
-                            + ":"
-                            + res.color()
-                            + res.value()
-                            + Fore.WHITE
-                        )
+                for res in line_results.get(line_start, []):
+                    found_parts.append(
+                        hex(res.match_start)[2:]
+                        + ":"
+                        + res.color()
+                        + res.value()
+                        + Fore.WHITE
+                    )
 
                 formatted += " ".join(found_parts)
 
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+"""
+Benchmarks parsing of LYR/MXD documents, reporting the average parse time per file
+(or the memory held by the parsed documents, with --memory)
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+from slyr_community.parser.initalize_registry import initialize_registry
+from slyr_community.parser.memory_stream import MemoryStream
+from slyr_community.parser.streams.layer import LayerFile
+from slyr_community.parser.streams.map_document import MapDocument
+
+initialize_registry()
+
+parser = argparse.ArgumentParser()
+parser.add_argument("folder", help="folder containing .lyr or .mxd files to parse")
+parser.add_argument(
+    "--repeat", help="number of times to parse each file", type=int, default=5
+)
+parser.add_argument(
+    "--strict",
+    help="parse with tolerant=False, validating expected values",
+    action="store_true",
+)
+parser.add_argument("--debug", help="parse with debug output", action="store_true")
+parser.add_argument(
+    "--mmap", help="memory map files instead of reading them", action="store_true"
+)
+parser.add_argument(
+    "--memory",
+    help="report the memory held by parsed documents instead of parse times",
+    action="store_true",
+)
+args = parser.parse_args()
+
+files = []
+for fn in sorted(os.listdir(args.folder)):
+    if os.path.splitext(fn)[1].lower() in (".lyr", ".mxd"):
+        files.append(os.path.join(args.folder, fn))
+
+
+def parse(path: str):
+    """
+    Parses a single document
+    """
+    if args.mmap:
+        f = MemoryStream.from_file(path)
+    else:
+        f = open(path, "rb")  # pylint: disable=consider-using-with
+    with f:
+        if path.lower().endswith(".mxd"):
+            return MapDocument(f, debug=args.debug, offset=-1, tolerant=not args.strict)
+        return LayerFile(f, debug=args.debug, tolerant=not args.strict)
+
+
+if args.memory:
+    tracemalloc.start()
+    documents = []
+    failed = 0
+    for file in files:
+        try:
+            documents.append(parse(file))
+        except Exception as e:  # pylint: disable=broad-except
+            print("{}: {}".format(os.path.basename(file), e))
+            failed += 1
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if documents:
+        print(
+            "Parsed {} files ({} failed), {:.1f} KiB held per file, {:.1f} MiB peak".format(
+                len(documents),
+                failed,
+                current / (1024 * len(documents)),
+                peak / (1024 * 1024),
+            )
+        )
+    raise SystemExit
+
+parsed = 0
+failed = 0
+total_time = 0
+for file in files:
+    try:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            parse(file)
+        total_time += time.perf_counter() - start
+        parsed += 1
+    except Exception as e:  # pylint: disable=broad-except
+        print("{}: {}".format(os.path.basename(file), e))
+        failed += 1
+
+if parsed:
+    print(
+        "Parsed {} files ({} failed), {:.3f} ms per file".format(
+            parsed, failed, 1000 * total_time / (parsed * args.repeat)
+        )
+    )